@@ -66,6 +66,10 @@ def _environment_spec() -> specs.EnvironmentSpec:
     )
 
 
+# The environment specification is static, so it is only built once.
+_DDPG_ENV_SPEC = _environment_spec()
+
+
 def _networks(
     action_spec: specs.BoundedArray,
     policy_layer_sizes: List[int],
@@ -102,6 +106,25 @@ def _networks(
         'observation': tf2_utils.batch_concat,
     }
 
+def _action2bet(action: float) -> float:
+    """ Maps an action of the policy network in [-1, 1] to a bet size. """
+    return max(1.0, (action+1.0)*29.5+0.9)
+
+
+def _actions2bets(actions: tf.Tensor) -> tf.Tensor:
+    """ Maps a batch of policy network actions to bet sizes.
+
+    The graph equivalent of _action2bet, so the mapping is traced together
+    with the policy network.
+    """
+    return tf.maximum(1.0, 29.5*actions + 30.4)
+
+
+def _policy2bets(bets: tf.Tensor) -> np.ndarray:
+    """ Returns the bet sizes computed by the policy network for a batch. """
+    return bets.numpy()
+
+
 # pylint: disable=invalid-name
 def DDPGTrainer(policy_network_shape,
                 critic_network_shape,
@@ -119,8 +142,10 @@ def DDPGTrainer(policy_network_shape,
         batch_size: batch size for updates.
         sigma: standard deviation of zero-mean, Gaussian exploration noise.
     """
-    batch_size = round(batch_size)
-    env_spec = _environment_spec()
+    # ray.tune may sample the batch size as a float.
+    if not isinstance(batch_size, int):
+        batch_size = round(batch_size)
+    env_spec = _DDPG_ENV_SPEC
     network = _networks(env_spec.actions,
                         policy_network_shape,
                         critic_network_shape)
@@ -134,26 +159,35 @@ def DDPGTrainer(policy_network_shape,
                               batch_size=batch_size,
                               discount=1.0
                               ),
-                         lambda x: max(1.0,(x+1.0)*29.5+0.9),
+                         _action2bet,
                          'float32')
 
 
 def _convert2tensor(d: Dict[Any, float]) -> Dict[Any, tf.Tensor]:
     """ Converts a dictionary to a dictionary of tensors. """
-    t_d={}
-    for k in d:
-        t_d[k] = tf.constant(d[k], dtype='float32')
-    return t_d
+    return tf.nest.map_structure(
+        lambda v: tf.convert_to_tensor(v, dtype='float32'), d)
+
+
+def _concat_observation(obs: Dict[str, tf.Tensor]) -> tf.Tensor:
+    """ Concatenates an observation into the input of the policy network.
+
+    Matches tf2_utils.batch_concat, which orders the entries by their keys,
+    without flattening every entry separately.
+    """
+    return tf.concat([obs['CARD_DISTRIBUTION'], obs['CHIPS']], axis=-1)
 
 
-def DDPGBettor(policy_path) -> PolicyBettor:
+def DDPGBettor(policy_path, use_tensorrt=False) -> PolicyBettor:
     """ Returns a DDPG PolicyBettor.
 
     Args:
         policy_path: Path to the saved model.
+        use_tensorrt: Whether to run the policy as a TensorRT engine.
     """
     return PolicyBettor(policy_path,
-                        lambda x: max(1.0,
-                                      (np.asscalar(x.numpy())+1.0)*29.5+0.9),
-                        lambda x: tf2_utils.batch_concat(_convert2tensor(x)),
-                        'float32')
+                        _policy2bets,
+                        lambda x: _concat_observation(_convert2tensor(x)),
+                        'float32',
+                        use_tensorrt,
+                        output_postproc=_actions2bets)
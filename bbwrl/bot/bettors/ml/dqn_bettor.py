@@ -21,13 +21,15 @@
 # SOFTWARE.
 """ Implements a single-process DQN agent based Bettor. """
 
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 
 from acme import specs
 from acme.agents.tf.dqn import DQN
 from acme.tf import utils as tf2_utils
+from acme import types
 import sonnet as snt
 import numpy as np
+import tensorflow as tf
 
 from bbwrl.bot.bettors.ml.trainer_bettor import TrainerBettor
 from bbwrl.bot.bettors.ml.policy_bettor import PolicyBettor
@@ -36,6 +38,8 @@ from bbwrl.environments import rule_variation
 
 # The possible bet sizes the DQN agent can choose from.
 ACTIONS = (1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 15.0, 20.0, 30.0)
+# The number of sampled states used to calibrate the quantized network.
+_NUM_CALIBRATION_STATES = 500
 
 
 def _environment_spec(actions: Tuple[float, ...]) -> specs.EnvironmentSpec:
@@ -60,6 +64,10 @@ def _environment_spec(actions: Tuple[float, ...]) -> specs.EnvironmentSpec:
     )
 
 
+# The environment specification is static, so it is only built once.
+_DQN_ENV_SPEC = _environment_spec(ACTIONS)
+
+
 def _network(environment_spec: specs.EnvironmentSpec,
              network_layer_sizes: List[int]) -> snt.Module:
     """ Returns a network.
@@ -88,8 +96,10 @@ def DQNTrainer(network_shape: List[int],
         learning_rate: learning rate for the q-network update.
         batch_size: batch size for updates.
     """
-    batch_size = round(batch_size)
-    env_spec = _environment_spec(ACTIONS)
+    # ray.tune may sample the batch size as a float.
+    if not isinstance(batch_size, int):
+        batch_size = round(batch_size)
+    env_spec = _DQN_ENV_SPEC
     return TrainerBettor(DQN(environment_spec=env_spec,
                              network=_network(env_spec, network_shape),
                              learning_rate=learning_rate,
@@ -100,13 +110,88 @@ def DQNTrainer(network_shape: List[int],
                          'float32')
 
 
-def DQNBettor(policy_path: str) -> PolicyBettor:
+def _q_values2bets(q_values: tf.Tensor) -> tf.Tensor:
+    """ Maps a batch of Q-values to the bet sizes of the greedy actions. """
+    # The bet sizes are folded into the traced graph as a constant, creating
+    # the tensor at import would initialize TensorFlow for every importer.
+    return tf.gather(ACTIONS, tf.argmax(q_values, axis=-1))
+
+
+def _policy2bets(bets: tf.Tensor) -> np.ndarray:
+    """ Returns the bet sizes selected in the graph for a batch. """
+    return bets.numpy()
+
+
+def _build_tflite(
+    policy_path: str
+) -> Callable[[types.NestedArray], np.ndarray]:
+    """ Returns an INT8 quantized TFLite version of a saved DQN policy.
+
+    The network is calibrated on randomly sampled bankrolls and partially
+    dealt shoes, then run by a TFLite interpreter with 8-bit weights. The
+    inputs of the interpreter are resized to the batch size of the
+    observations.
+
+    Args:
+        policy_path: Path to the saved model.
+    """
+    rng = np.random.default_rng(0)
+    full_shoe = np.full(14, 4*rule_variation.SHOE_SIZE)
+    full_shoe[0] = 0
+
+    def representative_dataset():
+        for _ in range(_NUM_CALIBRATION_STATES):
+            cards_left = rng.uniform(rule_variation.RESHUFFLE, 1.0)
+            card_distribution = rng.binomial(full_shoe, cards_left)
+            chips = rng.uniform(1.0, 1000.0)
+            # Inputs are ordered by the names of the serving signature.
+            yield [card_distribution.reshape(1, 14).astype(np.float32),
+                   np.array([[chips]], dtype=np.float32)]
+
+    converter = tf.lite.TFLiteConverter.from_saved_model(policy_path)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_dataset
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    interpreter = tf.lite.Interpreter(model_content=converter.convert())
+    interpreter.allocate_tensors()
+    # CHIPS and CARD_DISTRIBUTION are told apart by their last dimension.
+    inputs = {detail['shape'][-1]: detail['index']
+              for detail in interpreter.get_input_details()}
+    output = interpreter.get_output_details()[0]['index']
+    # The tensors are allocated for a single state by the converter.
+    num_states = 1
+
+    def policy(obs: types.NestedArray) -> np.ndarray:
+        nonlocal num_states
+        if len(obs['CHIPS']) != num_states:
+            # Only reallocated when the batch size changes, which is rare.
+            num_states = len(obs['CHIPS'])
+            interpreter.resize_tensor_input(inputs[1], [num_states, 1])
+            interpreter.resize_tensor_input(inputs[14], [num_states, 14])
+            interpreter.allocate_tensors()
+        interpreter.set_tensor(inputs[1], obs['CHIPS'])
+        interpreter.set_tensor(inputs[14], obs['CARD_DISTRIBUTION'])
+        interpreter.invoke()
+        return interpreter.get_tensor(output)
+
+    return policy
+
+
+def DQNBettor(policy_path: str,
+              use_tensorrt: bool = False,
+              quantize: bool = False) -> PolicyBettor:
     """ Returns a DQN PolicyBettor.
 
     Args:
         policy_path: Path to the saved model.
+        use_tensorrt: Whether to run the policy as a TensorRT engine.
+        quantize: Whether to run an INT8 quantized TFLite version of the
+            policy on the CPU.
     """
     return PolicyBettor(policy_path,
-                        lambda x: ACTIONS[np.argmax(x[0])],
+                        _policy2bets,
                         lambda x: x,
-                        'float32')
+                        'float32',
+                        use_tensorrt,
+                        _build_tflite if quantize else None,
+                        _q_values2bets)
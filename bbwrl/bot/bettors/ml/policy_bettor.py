@@ -21,7 +21,9 @@
 # SOFTWARE.
 """ Implements the PolicyBettor class"""
 
-from typing import Any, Callable
+import os
+import shutil
+from typing import Any, Callable, Optional
 
 from acme import types
 import numpy as np
@@ -30,6 +32,47 @@ import tensorflow as tf
 from bbwrl.bot.bettors.bettor import Bettor
 
 
+def _build_tensorrt(policy_path: str) -> str:
+    """ Converts a saved model to a TensorRT optimized saved model.
+
+    The converted model is stored next to the original one and uses FP16
+    precision, which lets TensorRT fuse the whole network into a few kernels.
+    A model converted after the last save of the original one is reused,
+    so the evaluation processes only convert it once.
+
+    Args:
+        policy_path: Path to the saved model.
+
+    Returns:
+        The path to the converted saved model.
+    """
+    trt_path = policy_path.rstrip('/') + '_trt'
+    trt_model = os.path.join(trt_path, 'saved_model.pb')
+    if (os.path.isfile(trt_model) and os.path.getmtime(trt_model) >=
+            os.path.getmtime(os.path.join(policy_path, 'saved_model.pb'))):
+        return trt_path
+    # Only imported when needed, the TensorRT module is not part of every
+    # TensorFlow build.
+    # pylint: disable=import-outside-toplevel
+    from tensorflow.python.compiler.tensorrt import trt_convert as trt
+    params = trt.DEFAULT_TRT_CONVERSION_PARAMS._replace(
+        precision_mode=trt.TrtPrecisionMode.FP16)
+    converter = trt.TrtGraphConverterV2(input_saved_model_dir=policy_path,
+                                        conversion_params=params)
+    converter.convert()
+    # Saved under a temporary name and renamed, so that other processes never
+    # load a partially written model.
+    tmp_path = '{}.{}'.format(trt_path, os.getpid())
+    converter.save(tmp_path)
+    shutil.rmtree(trt_path, ignore_errors=True)
+    try:
+        os.rename(tmp_path, trt_path)
+    except OSError:
+        # Another process saved its conversion first.
+        shutil.rmtree(tmp_path, ignore_errors=True)
+    return trt_path
+
+
 class PolicyBettor(Bettor):
     """ Implements a bettor that uses a saved tensorflow model.
 
@@ -38,38 +81,97 @@ class PolicyBettor(Bettor):
     """
     def __init__(self,
                  policy_path: str,
-                 policy2action: Callable[[Any], float],
+                 policy2action: Callable[[Any], np.ndarray],
                  obs_precomp: Callable[[types.NestedArray], Any],
-                 dtype: str):
+                 dtype: str,
+                 use_tensorrt: bool = False,
+                 policy_loader: Optional[Callable[[str], Any]] = None,
+                 output_postproc: Callable[[Any], Any] = lambda x: x):
         """ Initializes the bettor.
 
         Args:
             policy_path: Path to the saved model.
-            policy2action: A function that maps the policy output to an action.
+            policy2action: A function that maps the policy output for a batch
+                of states to an array with an action for each state.
             obs_precomp: A function that maps the observations to the required
                 input for the policy network.
             dtype: The dtype used by the network.
+            use_tensorrt: Whether to run the network as a TensorRT engine.
+                Requires a GPU and a TensorFlow build with TensorRT support.
+            policy_loader: An optional function that loads the policy from
+                policy_path in place of the saved model.
+            output_postproc: A function applied to the output of the policy
+                network as part of the same traced function.
         """
-        self._loaded_policy = tf.saved_model.load(policy_path)
+        if policy_loader is not None:
+            self._loaded_policy = policy_loader(policy_path)
+        elif use_tensorrt:
+            serving = tf.saved_model.load(
+                _build_tensorrt(policy_path)).signatures['serving_default']
+            input_names = sorted(serving.structured_input_signature[1])
+            self._loaded_policy = lambda obs: tf.nest.flatten(serving(
+                **dict(zip(input_names, tf.nest.flatten(obs)))))[0]
+        else:
+            self._loaded_policy = tf.saved_model.load(policy_path)
         self._policy2action = policy2action
         self._obs_precomp = obs_precomp
+        self._output_postproc = output_postproc
         self._dtype = dtype
+        self._chips_buf = np.zeros((1, 1), dtype=dtype)
+        self._cd_buf = np.zeros((1, 14), dtype=dtype)
+        if policy_loader is None:
+            # Tracing once with a fixed signature avoids retracing and most of
+            # the eager dispatch overhead of calling the saved model. XLA then
+            # fuses the whole network, except for TensorRT engines which are
+            # already fused and cannot be compiled by XLA.
+            self._infer = tf.function(
+                self._infer,
+                input_signature=[{
+                    'CHIPS': tf.TensorSpec((None, 1), dtype),
+                    'CARD_DISTRIBUTION': tf.TensorSpec((None, 14), dtype)
+                }],
+                experimental_compile=not use_tensorrt)
+
+    def _infer(self, obs: types.NestedArray) -> Any:
+        """ Returns the output of the policy network for an observation.
+
+        Args:
+            obs: The observation to evaluate the policy network on.
+        """
+        return self._output_postproc(
+            self._loaded_policy(self._obs_precomp(obs)))
+
+    def _bets(self, obs: types.NestedArray) -> np.ndarray:
+        """ Returns the bet sizes for a batch of observations.
+
+        Args:
+            obs: The batch of observations to evaluate the policy network on.
+        """
+        return np.asarray(self._policy2action(self._infer(obs))).reshape(-1)
 
     def _create_observation(self,
                             chips: float,
                             card_distribution: np.ndarray) -> types.NestedArray:
         """ Creates an observation.
 
+        The observation reuses the same buffers on every call, so it is only
+        valid until the next call. A card distribution that already has the
+        dtype of the network is passed on as a view without copying.
+
         Args:
             chips: The bankroll of the player.
             card_distribution: The distribution of the cards remaining in the
                 shoe.
         """
+        self._chips_buf[0, 0] = chips
+        if card_distribution.dtype == self._cd_buf.dtype:
+            cd = card_distribution.reshape(1, 14)
+        else:
+            self._cd_buf[0] = card_distribution
+            cd = self._cd_buf
         return {
-            'CHIPS':
-                np.array([[chips]], dtype=self._dtype),
-            'CARD_DISTRIBUTION':
-                card_distribution.astype(self._dtype).reshape(1, 14)
+            'CHIPS': self._chips_buf,
+            'CARD_DISTRIBUTION': cd
         }
 
     def get_bet_size(self,
@@ -82,9 +184,29 @@ class PolicyBettor(Bettor):
             card_distribution: The distribution of the cards remaining in the
                 shoe.
         """
-        obs = self._obs_precomp(self._create_observation(chips,
-                                                         card_distribution))
-        return self._policy2action(self._loaded_policy(obs))
+        obs = self._create_observation(chips, card_distribution)
+        return float(self._bets(obs)[0])
+
+    def get_bet_size_batch(self,
+                           chips: np.ndarray,
+                           card_distributions: np.ndarray) -> np.ndarray:
+        """ Returns the bet sizes for a batch of states.
+
+        The whole batch is evaluated with a single call to the network, which
+        amortizes the dispatch overhead over every state in the batch. The
+        policy needs to accept batches larger than one.
+
+        Args:
+            chips: The bankrolls of the players with shape (B, ).
+            card_distributions: The distributions of the cards remaining in
+                the shoes with shape (B, 14).
+        """
+        return self._bets({
+            'CHIPS':
+                np.asarray(chips, dtype=self._dtype).reshape(-1, 1),
+            'CARD_DISTRIBUTION':
+                np.asarray(card_distributions, dtype=self._dtype)
+        })
 
     def set_payout(self, payout: float, card_distribution: np.ndarray) -> None:
         pass
@@ -35,14 +35,26 @@ from bbwrl.environments import rule_variation
 
 MIN_REWARD = -1e60
 
+# The step type of a TimeStep indexed by whether the player went bankrupt.
+_STEP_LOOKUP = (StepType.MID, StepType.LAST)
+
 
 def _log_util(x: float) -> float:
     """ Calculates the logarithm utility. """
-    if x+1 <= 0:
-        return MIN_REWARD
-    if math.log(x+1) <= MIN_REWARD:
+    # log1p(x) is always above MIN_REWARD when defined, so a single bound
+    # check is enough.
+    return math.log1p(x) if x > -1.0 else MIN_REWARD
+
+
+def _log_reward(chips: float, payout: float) -> float:
+    """ Calculates the change in logarithm utility caused by a payout.
+
+    Equals _log_util(chips+payout) - _log_util(chips) for bankrolls above -1,
+    which always holds before a bet, but evaluates a single logarithm.
+    """
+    if chips + payout <= -1.0:
         return MIN_REWARD
-    return math.log(x+1)
+    return math.log1p(payout / (1.0 + chips))
 
 
 class TrainerBettor(Bettor):
@@ -55,6 +67,7 @@ class TrainerBettor(Bettor):
         _utility_function: The utility function used by the agent.
         _last_action: The last action taken by the bettor.
         _chips_before_game: The bankroll of the player before the last bet.
+        _discount_one: The discount shared by every non-initial TimeStep.
     """
 
     def __init__(self,
@@ -76,6 +89,7 @@ class TrainerBettor(Bettor):
         self._action2bet = action2bet
         self._dtype = dtype
         self._chips_before_game = rule_variation.AGENT_CHIPS
+        self._discount_one = np.array(1.0, dtype=dtype)
 
     def _default_spec(self,
                       chips: float,
@@ -105,13 +119,9 @@ class TrainerBettor(Bettor):
             card_distribution: The distribution of the cards remaining in the
                 shoe.
         """
-        if chips < 0:
-            st = StepType.LAST
-        else:
-            st = StepType.MID
-        return TimeStep(step_type=st,
+        return TimeStep(step_type=_STEP_LOOKUP[chips < 0],
                         reward=reward,
-                        discount=np.array(1.0, dtype=self._dtype),
+                        discount=self._discount_one,
                         observation=self._create_observation(chips,
                                                         card_distribution))
 
@@ -145,8 +155,9 @@ class TrainerBettor(Bettor):
                                                     card_distribution))
         self._last_action = self._agent.select_action(
             self._create_observation(chips, card_distribution))
-        # The action sometimes is a scalar sometimes an array
-        self._last_action = self._last_action.flatten()[0]
+        # The action sometimes is a scalar sometimes an array. Reshaping
+        # returns a view, whereas flattening would copy the action.
+        self._last_action = self._last_action.reshape(())
         self._chips_before_game = chips
         return self._action2bet(self._last_action)
 
@@ -156,8 +167,11 @@ class TrainerBettor(Bettor):
         Args:
             payout: The payout to find the corresponding reward to.
         """
-        reward = (self._utility_function(self._chips_before_game+payout)
-                  - self._utility_function(self._chips_before_game))
+        if self._utility_function is _log_util:
+            reward = _log_reward(self._chips_before_game, payout)
+        else:
+            reward = (self._utility_function(self._chips_before_game+payout)
+                      - self._utility_function(self._chips_before_game))
         return np.array(reward, dtype=self._dtype)
 
     def set_payout(self,
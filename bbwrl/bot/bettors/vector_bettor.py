@@ -33,7 +33,9 @@ class VectorBettor(Bettor):
 
     Attributes:
         _shoe_size: The number of decks in the shoe.
-        _vector: The special vector used in the dot product.
+        _vector: The special vector used in the dot product, without the
+            entry of the unused first index of the card distribution.
+        _full_shoe_count: The dot product of the vector and a full shoe.
     """
     def __init__(self, shoe_size: int, vector: np.ndarray):
         """ Initializes the vector bettor.
@@ -43,19 +45,17 @@ class VectorBettor(Bettor):
             vector: The special vector used in the dot product.
         """
         self._shoe_size = shoe_size
-        self._vector = np.array(vector)
+        self._vector = np.array(vector, dtype=np.float64)[1:14].copy()
+        self._full_shoe_count = shoe_size * 4 * float(self._vector.sum())
 
     def _running_count(self, card_distribution: np.ndarray) -> float:
         """ Calculates the running count. """
-        count = 0.0
-        for i in range(1, 14):
-            count += self._vector[i] * (self._shoe_size*4 -
-                                        card_distribution[i])
-        return count
+        return self._full_shoe_count - float(
+            np.dot(self._vector, card_distribution[1:14]))
 
     def _true_count(self, card_distribution: np.ndarray) -> float:
         """ Calculates the true count. """
-        decks_left = card_distribution.sum() / 52.0
+        decks_left = float(card_distribution.sum()) / 52.0
         return self._running_count(card_distribution) / decks_left
 
     def get_bet_size(self,
@@ -70,6 +70,21 @@ class VectorBettor(Bettor):
         """
         return self._true_count(card_distribution) - 1.0
 
+    def get_bet_size_batch(self,
+                           chips: np.ndarray,
+                           card_distributions: np.ndarray) -> np.ndarray:
+        """ Returns the bet sizes for a batch of states.
+
+        Args:
+            chips: The bankrolls of the players with shape (B, ).
+            card_distributions: The distributions of the cards remaining in
+                the shoes with shape (B, 14).
+        """
+        running_counts = (self._full_shoe_count
+                          - card_distributions[:, 1:14] @ self._vector)
+        decks_left = card_distributions.sum(axis=1) / 52.0
+        return running_counts / decks_left - 1.0
+
     def set_payout(self, payout: float, card_distribution: np.ndarray) -> None:
         return
 
@@ -24,7 +24,7 @@
 
 import logging
 import math
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 import acme.core
 from acme import types
@@ -34,11 +34,18 @@ import numpy as np
 from bbwrl.bot import bettors
 from bbwrl.bot import strategists
 from bbwrl.environments import rule_variation
+from bbwrl.environments import table
 
 
 # The minimum receivable reward
 MIN_REWARD = -1e60
 
+# The distribution of the cards in a full shoe. The first entry is unused.
+# The dtype is the C long that KellyBettor expects. The int8 revealed cards
+# from the environment are upcast into it when the deck is updated.
+_FULL_SHOE = np.full(14, 4*rule_variation.SHOE_SIZE, dtype=int)
+_FULL_SHOE[0] = 0
+
 
 def _create_action(value: float) -> types.NestedArray:
     """ Returns float64 numpy scalar.
@@ -49,23 +56,43 @@ def _create_action(value: float) -> types.NestedArray:
     return np.array(value, dtype=np.float64)
 
 
-def _log_util(chips: float,
-              bet_size: float,
-              payout: float) -> float:
-    """ Returns the gained log utility.
+def _log_utility(chips: float, bet_size: float) -> Callable[[float], float]:
+    """ Returns the gained log utility as a function of the payout of a bet.
 
-    Returns the difference between the utility before and after a payout.
-    The payout is atleast MIN_REWARD.
+    The returned function computes the difference between the utility before
+    and after a payout, which is atleast MIN_REWARD. The chips and the bet
+    size are fixed for the whole game, so everything that only depends on
+    them is computed here and captured by the returned function.
 
     Args:
         chips: The current number of chips the agent owns.
         bet_size: The size of the bet the agent takes.
-        payout: The payout of the game.
     """
-    if chips <= 0 or chips + payout*bet_size <= 0:
-        return MIN_REWARD
-    return max(math.log(1.0 + chips + payout*bet_size) - math.log(1.0 + chips),
-               MIN_REWARD)
+    if chips <= 0:
+        return lambda payout: MIN_REWARD
+    neg_chips = -chips
+    relative_bet = bet_size / (1.0 + chips)
+
+    def utility(payout: float) -> float:
+        if payout*bet_size <= neg_chips:
+            return MIN_REWARD
+        return math.log1p(payout*relative_bet)
+
+    return utility
+
+
+def _format_distribution(distribution: np.ndarray) -> str:
+    """ Formats a card distribution for the logs.
+
+    Uses the same comma free, space separated layout as str() on a numpy
+    array, which the evaluator relies on when splitting log lines at commas,
+    without going through the numpy array printer.
+
+    Args:
+        distribution: The card distribution to format.
+    """
+    return '[' + ' '.join(map(str, distribution.tolist())) + ']'
+
 
 class Bot(acme.core.Actor):
     """ Implements an actor capable of interacting with Table.
@@ -78,8 +105,13 @@ class Bot(acme.core.Actor):
         _bettor: The bettor that determines bet sizes.
         _strategist_class: The class of the strategist to be used.
         _strategist: The strategist used to determine what action to take.
+        _strategist_is_stateless: Whether a single strategist is reused for
+            every game.
         _logger: The logger used to log every action-observation pair.
         _last_timestep: The timestep before the last action was taken.
+        _stage2action: Maps stages to the method choosing the action.
+        _move_hint: The state of the hand and the move chosen when the bot
+            last declined to double down, reused to decide whether to hit.
     """
     def __init__(self,
                  bettor_name: str,
@@ -96,8 +128,20 @@ class Bot(acme.core.Actor):
         """
         self._bettor = bettors.BETTORS[bettor_name](**bettor_parameters)
         self._strategist_class = strategists.STRATEGISTS[strategist_name]
-        self._strategist = None
+        # The strategist only needs to be built for every bet if its actions
+        # depend on the utility function.
+        self._strategist_is_stateless = getattr(self._strategist_class,
+                                                'STATELESS', False)
+        self._strategist = (self._strategist_class(None)
+                            if self._strategist_is_stateless else None)
         self._logger = logger
+        self._move_hint = None
+        self._stage2action = {
+            table.CHOOSE_BET: self._choose_bet,
+            table.SPLIT: self._split,
+            table.DOUBLE: self._double,
+            table.HIT_STAND: self._hit,
+        }
         self._reset_deck()
 
     def select_action(self,
@@ -110,39 +154,80 @@ class Bot(acme.core.Actor):
         Returns:
             A nested array holding the chosen action.
         """
-        if observation['STAGE'] == 'CHOOSE_BET':
-            chips = observation['CHIPS']
-            bet_size = self._bettor.get_bet_size(chips, self._deck_distribution)
-            if np.isnan(bet_size):
-                bet_size = 1.0
-            bet_size = min(1000.0, chips, bet_size)
-            bet_size = max(1.0, bet_size)
+        return self._stage2action[observation['STAGE']](observation)
+
+    def _choose_bet(self, observation: types.NestedArray) -> types.NestedArray:
+        """ Chooses a bet size and a strategist for the next game.
+
+        Args:
+            observation: The last observation of the environment
+        """
+        chips = observation['CHIPS']
+        bet_size = self._bettor.get_bet_size(chips, self._deck_distribution)
+        # NaN is the only value that is not equal to itself.
+        if bet_size != bet_size:
+            bet_size = 1.0
+        bet_size = min(1000.0, chips, bet_size)
+        bet_size = max(1.0, bet_size)
+        if not self._strategist_is_stateless:
             if self._strategist is not None:
                 self._strategist.free_mem()
             self._strategist = self._strategist_class(
-                lambda x: _log_util(chips, bet_size, x))
-            return _create_action(bet_size)
+                _log_utility(chips, bet_size))
+        return _create_action(bet_size)
+
+    def _split(self, observation: types.NestedArray) -> types.NestedArray:
+        """ Decides whether to split.
+
+        Args:
+            observation: The last observation of the environment
+        """
         player_total = observation['PLAYER_TOTAL']
         player_aces = observation['PLAYER_ACES']
         dealer_total = observation['DEALER_TOTAL']
-        if observation['STAGE'] == 'SPLIT?':
-            split = self._strategist.should_split(player_total,
-                                                  player_aces,
-                                                  dealer_total,
-                                                  self._deck_distribution)
-            return _create_action(split)
-        if observation['STAGE'] == 'DOUBLE?':
-            double = self._strategist.should_double(player_total,
-                                                    player_aces,
-                                                    dealer_total,
-                                                    self._deck_distribution)
-            return _create_action(double)
-        if observation['STAGE'] == 'HIT/STAND':
-            hit = self._strategist.should_hit(player_total,
+        split = self._strategist.should_split(player_total,
                                               player_aces,
                                               dealer_total,
                                               self._deck_distribution)
-            return _create_action(hit)
+        return _create_action(split)
+
+    def _double(self, observation: types.NestedArray) -> types.NestedArray:
+        """ Decides whether to double down.
+
+        Args:
+            observation: The last observation of the environment
+        """
+        if not isinstance(self._strategist, strategists.Strategist):
+            double = self._strategist.should_double(
+                observation['PLAYER_TOTAL'],
+                observation['PLAYER_ACES'],
+                observation['DEALER_TOTAL'],
+                self._deck_distribution)
+            return _create_action(double)
+        state = (observation['PLAYER_TOTAL'],
+                 observation['PLAYER_ACES'],
+                 observation['DEALER_TOTAL'])
+        move = self._strategist.get_action(*state, self._deck_distribution)
+        double = move == strategists.DOUBLE
+        # No cards are drawn when declining to double down, so the move stays
+        # valid for the next decision if it is made in the same state.
+        self._move_hint = None if double else (state, move)
+        return _create_action(double)
+
+    def _hit(self, observation: types.NestedArray) -> types.NestedArray:
+        """ Decides whether to hit or stand.
+
+        Args:
+            observation: The last observation of the environment
+        """
+        state = (observation['PLAYER_TOTAL'],
+                 observation['PLAYER_ACES'],
+                 observation['DEALER_TOTAL'])
+        move_hint, self._move_hint = self._move_hint, None
+        if move_hint is not None and move_hint[0] == state:
+            return _create_action(move_hint[1] != strategists.STAND)
+        hit = self._strategist.should_hit(*state, self._deck_distribution)
+        return _create_action(hit)
 
     def observe_first(self, timestep: dm_env.TimeStep) -> None:
         """ Observes the first timestep.
@@ -164,16 +249,18 @@ class Bot(acme.core.Actor):
         Args:
             action: The action last taken.
         """
-        if self._logger is None:
+        if self._logger is None or not self._logger.isEnabledFor(logging.INFO):
             return
-        self._logger.info('{}, {}, {}, {}, {}, {}, {}'.format(
-            self._last_timestep.observation['STAGE'],
-            self._last_timestep.observation['CHIPS'],
-            self._last_timestep.observation['PLAYER_TOTAL'],
-            self._last_timestep.observation['PLAYER_ACES'],
-            self._last_timestep.observation['DEALER_TOTAL'],
+        observation = self._last_timestep.observation
+        self._logger.info(
+            '%s, %s, %s, %s, %s, %s, %s',
+            observation['STAGE'],
+            observation['CHIPS'],
+            observation['PLAYER_TOTAL'],
+            observation['PLAYER_ACES'],
+            observation['DEALER_TOTAL'],
             action,
-            self._deck_distribution))
+            _format_distribution(self._deck_distribution))
 
     def observe(self,
                 action: types.NestedArray,
@@ -189,11 +276,16 @@ class Bot(acme.core.Actor):
         """
         self._log(action)
         self._last_timestep = next_timestep
-        if next_timestep.observation['REVEALED_CARDS'][0] == -1:
+        observation = next_timestep.observation
+        revealed_cards = observation['REVEALED_CARDS']
+        # The first entry is only nonzero, -1, when the shoe was reshuffled.
+        if revealed_cards[0] == -1:
             self._reset_deck()
-        self._deck_distribution -= next_timestep.observation['REVEALED_CARDS']
-        self._deck_distribution[0] = 0
-        if next_timestep.observation['STAGE'] == 'CHOOSE_BET':
+            self._deck_distribution[1:] -= revealed_cards[1:]
+        else:
+            np.subtract(self._deck_distribution, revealed_cards,
+                        out=self._deck_distribution)
+        if observation['STAGE'] == table.CHOOSE_BET:
             self._bettor.set_payout(next_timestep.reward,
                                     self._deck_distribution)
 
@@ -202,9 +294,7 @@ class Bot(acme.core.Actor):
 
     def _reset_deck(self) -> None:
         """ Resets the deck distribution when reshuffled. """
-        self._deck_distribution = np.full(14,
-                                          4*rule_variation.SHOE_SIZE)
-        self._deck_distribution[0] = 0
+        self._deck_distribution = _FULL_SHOE.copy()
 
     def save(self) -> str:
         """ Save the neural network of the bettor.
@@ -21,6 +21,7 @@
 # SOFTWARE.
 """ Strategist implementations. """
 
+from bbwrl.bot.strategists.strategist import Strategist, HIT, STAND, DOUBLE
 from bbwrl.bot.strategists.basic_strategist import BasicStrategist
 from bbwrl.utils import pyxinstall
 from bbwrl.bot.strategists.optimal_strategist import OptimalStrategist # type: ignore
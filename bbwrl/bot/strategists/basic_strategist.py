@@ -30,7 +30,7 @@ bbwrl.utils.basic_strategy_generator.main()
 """
 import numpy as np
 
-from bbwrl.bot.strategists.strategist import Strategist
+from bbwrl.bot.strategists.strategist import Strategist, HIT, STAND, DOUBLE
 
 
 BASIC_ACE_STRATEGY = [
@@ -87,31 +87,58 @@ BASIC_SPLIT_STRATEGY = [
 ]
 
 
+# The moves of the lookup tables encoded as integers.
+_MOVE_CODES = {'H': HIT, 'S': STAND, 'D': DOUBLE}
+
+
+def _move(player_total: int, player_aces: int, dealer_total: int) -> int:
+    """ Returns the code of the move in the lookup tables for a state. """
+    if player_aces == 1 and player_total >= 12:
+        move = BASIC_ACE_STRATEGY[player_total-12][dealer_total-2]
+    else:
+        move = BASIC_HIT_STRATEGY[player_total-3][dealer_total-2]
+    return _MOVE_CODES[move]
+
+
+# The move codes of every state flattened into a single buffer, indexed by
+# ((player_total-3)*2 + player_aces)*10 + dealer_total-2. Soft totals below 12
+# cannot occur, those entries repeat the hard totals.
+_MOVES = bytes(_move(player_total, player_aces, dealer_total)
+               for player_total in range(3, 22)
+               for player_aces in range(2)
+               for dealer_total in range(2, 12))
+# The split decisions flattened the same way, indexed by row*10 +
+# dealer_total-2 where row is 0 for a pair of aces and player_total//2-1
+# otherwise.
+_SPLITS = bytes(split for row in BASIC_SPLIT_STRATEGY for split in row)
+
+
+def _prefered_move(player_total: int,
+                   player_aces: int,
+                   dealer_total: int) -> int:
+    """Decides whether the player should double down, hit or stand.
+
+    Args:
+        player_total: The hand total of the player.
+        player_aces: The number of aces which have the possibility to be 1
+            or 11 of the player.
+        dealer_total: The hand total of the dealer.
+
+    Returns:
+        The code of the prefered move among doubling down, hitting and
+        standing.
+    """
+    return _MOVES[((player_total-3)*2 + player_aces)*10 + dealer_total-2]
+
+
 class BasicStrategist(Strategist):
     """ Implements a basic strategist using a lookup table to choose actions.
     """
+    STATELESS = True
+
     def __init__(self, utility_function):
         pass
 
-    def _prefered_move(self,
-                       player_total: int,
-                       player_aces: int,
-                       dealer_total: int) -> str:
-        """Decides whether the player should double down, hit or stand.
-
-        Args:
-            player_total: The hand total of the player.
-            player_aces: The number of aces which have the possibility to be 1
-                or 11 of the player.
-            dealer_total: The hand total of the dealer.
-
-        Returns:
-            The prefered move among doubling down, hitting and standing.
-        """
-        if player_aces == 1:
-            return BASIC_ACE_STRATEGY[player_total-12][dealer_total-2]
-        return BASIC_HIT_STRATEGY[player_total-3][dealer_total-2]
-
     def should_split(self,
                      player_total: int,
                      player_aces: int,
@@ -126,9 +153,8 @@ class BasicStrategist(Strategist):
             card_distribution: The distribution of the cards remaining in the
                 shoe.
         """
-        if player_aces == 1:
-            return BASIC_SPLIT_STRATEGY[0][dealer_total-2]
-        return BASIC_SPLIT_STRATEGY[int(player_total/2)-1][dealer_total-2]
+        row = 0 if player_aces == 1 else player_total//2-1
+        return bool(_SPLITS[row*10 + dealer_total-2])
 
     def should_double(self,
                       player_total: int,
@@ -144,9 +170,9 @@ class BasicStrategist(Strategist):
             card_distribution: The distribution of the cards remaining in the
                 shoe.
         """
-        return self._prefered_move(player_total,
-                                   player_aces,
-                                   dealer_total) == 'D'
+        return _prefered_move(player_total,
+                              player_aces,
+                              dealer_total) == DOUBLE
 
     def should_hit(self,
                    player_total: int,
@@ -162,9 +188,25 @@ class BasicStrategist(Strategist):
             card_distribution: The distribution of the cards remaining in the
                 shoe.
         """
-        return self._prefered_move(player_total,
-                                   player_aces,
-                                   dealer_total) != 'S'
+        return _prefered_move(player_total,
+                              player_aces,
+                              dealer_total) != STAND
+
+    def get_action(self,
+                   player_total: int,
+                   player_aces: int,
+                   dealer_total: int,
+                   card_distribution: np.ndarray) -> int:
+        """ Returns the optimal move among doubling down, hitting and standing.
+
+        Args:
+            player_total: The hand total of the player.
+            player_aces: The number of soft aces available to the player.
+            dealer_total: The hand total of the dealer.
+            card_distribution: The distribution of the cards remaining in the
+                shoe.
+        """
+        return _prefered_move(player_total, player_aces, dealer_total)
 
     def free_mem(self) -> None:
         pass
@@ -1,4 +1,4 @@
-/* Generated by Cython 0.29.23 */
+/* Generated by Cython 0.29.37 */
 
 /* BEGIN: Cython Metadata
 {
@@ -23,9 +23,9 @@ END: Cython Metadata */
 #elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
     #error Cython requires Python 2.6+ or Python 3.3+.
 #else
-#define CYTHON_ABI "0_29_23"
-#define CYTHON_HEX_VERSION 0x001D17F0
-#define CYTHON_FUTURE_DIVISION 0
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 1
 #include <stddef.h>
 #ifndef offsetof
   #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
@@ -63,6 +63,7 @@ END: Cython Metadata */
   #define CYTHON_COMPILING_IN_PYPY 1
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #undef CYTHON_USE_TYPE_SLOTS
   #define CYTHON_USE_TYPE_SLOTS 0
   #undef CYTHON_USE_PYTYPE_LOOKUP
@@ -91,18 +92,26 @@ END: Cython Metadata */
   #define CYTHON_FAST_THREAD_STATE 0
   #undef CYTHON_FAST_PYCALL
   #define CYTHON_FAST_PYCALL 0
-  #undef CYTHON_PEP489_MULTI_PHASE_INIT
-  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
   #undef CYTHON_USE_TP_FINALIZE
-  #define CYTHON_USE_TP_FINALIZE 0
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
   #undef CYTHON_USE_DICT_VERSIONS
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
   #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
 #elif defined(PYSTON_VERSION)
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 1
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -140,10 +149,59 @@ END: Cython Metadata */
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
   #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
 #else
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -163,7 +221,7 @@ END: Cython Metadata */
     #undef CYTHON_USE_PYLONG_INTERNALS
     #define CYTHON_USE_PYLONG_INTERNALS 0
   #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
-    #define CYTHON_USE_PYLONG_INTERNALS 1
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
   #endif
   #ifndef CYTHON_USE_PYLIST_INTERNALS
     #define CYTHON_USE_PYLIST_INTERNALS 1
@@ -171,7 +229,7 @@ END: Cython Metadata */
   #ifndef CYTHON_USE_UNICODE_INTERNALS
     #define CYTHON_USE_UNICODE_INTERNALS 1
   #endif
-  #if PY_VERSION_HEX < 0x030300F0
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
     #undef CYTHON_USE_UNICODE_WRITER
     #define CYTHON_USE_UNICODE_WRITER 0
   #elif !defined(CYTHON_USE_UNICODE_WRITER)
@@ -186,11 +244,14 @@ END: Cython Metadata */
   #ifndef CYTHON_UNPACK_METHODS
     #define CYTHON_UNPACK_METHODS 1
   #endif
-  #ifndef CYTHON_FAST_THREAD_STATE
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
     #define CYTHON_FAST_THREAD_STATE 1
   #endif
   #ifndef CYTHON_FAST_PYCALL
-    #define CYTHON_FAST_PYCALL 1
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
   #endif
   #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
     #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
@@ -199,17 +260,25 @@ END: Cython Metadata */
     #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
   #endif
   #ifndef CYTHON_USE_DICT_VERSIONS
-    #define CYTHON_USE_DICT_VERSIONS (PY_VERSION_HEX >= 0x030600B1)
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
   #endif
-  #ifndef CYTHON_USE_EXC_INFO_STACK
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
     #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
   #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
 #endif
 #if !defined(CYTHON_FAST_PYCCALL)
 #define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
 #endif
 #if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
   #undef SHIFT
   #undef BASE
   #undef MASK
@@ -328,9 +397,6 @@ class __Pyx_FakeReference {
     T *ptr;
 };
 
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
-  #define Py_OptimizeFlag 0
-#endif
 #define __PYX_BUILD_PY_SSIZE_T "n"
 #define CYTHON_FORMAT_SSIZE_T "z"
 #if PY_MAJOR_VERSION < 3
@@ -340,15 +406,79 @@ class __Pyx_FakeReference {
   #define __Pyx_DefaultClassType PyClass_Type
 #else
   #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-#if PY_VERSION_HEX >= 0x030800A4 && PY_VERSION_HEX < 0x030800B2
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_New(a, 0, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
 #else
   #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
           PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
 #endif
   #define __Pyx_DefaultClassType PyType_Type
 #endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
 #ifndef Py_TPFLAGS_CHECKTYPES
   #define Py_TPFLAGS_CHECKTYPES 0
 #endif
@@ -456,8 +586,12 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #endif
 #if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
   #define CYTHON_PEP393_ENABLED 1
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
-                                              0 : _PyUnicode_Ready((PyObject *)(op)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
   #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
   #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
@@ -465,10 +599,14 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
   #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
   #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
-  #if defined(PyUnicode_IS_READY) && defined(PyUnicode_GET_SIZE)
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
   #else
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
   #endif
 #else
   #define CYTHON_PEP393_ENABLED 0
@@ -572,10 +710,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #if PY_VERSION_HEX < 0x030200A4
   typedef long Py_hash_t;
   #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
 #else
   #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
 #endif
 #if PY_MAJOR_VERSION >= 3
   #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
@@ -600,8 +738,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
     } __Pyx_PyAsyncMethodsStruct;
 #endif
 
-#if defined(WIN32) || defined(MS_WINDOWS)
-  #define _USE_MATH_DEFINES
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
 #endif
 #include <math.h>
 #ifdef NAN
@@ -641,7 +781,8 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include "typeinfo"
 #include <utility>
 
-    #if __cplusplus > 199711L
+    #if __cplusplus >= 201103L || (defined(_MSC_VER) && _MSC_VER >= 1600)
+    // move should be defined for these versions of MSVC, but __cplusplus isn't set usefully
     #include <type_traits>
 
     namespace cython_std {
@@ -748,6 +889,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
     (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
 static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
 #if CYTHON_ASSUME_SAFE_MACROS
 #define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
 #else
@@ -902,11 +1044,11 @@ struct __pyx_obj_5bbwrl_3bot_19reward_distribution_RewardDistribution {
 };
 
 
-/* "bbwrl/bot/strategists/optimal_strategist.pyx":31
+/* "bbwrl/bot/strategists/optimal_strategist.pyx":33
  * 
  * 
  * cdef class OptimalStrategist:             # <<<<<<<<<<<<<<
- *     cdef RewardDistribution reward_distribution
+ *     """ Implementation of the optimal strategist.
  * 
  */
 struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist {
@@ -946,11 +1088,11 @@ struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution {
 static struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *__pyx_vtabptr_5bbwrl_3bot_19reward_distribution_RewardDistribution;
 
 
-/* "bbwrl/bot/strategists/optimal_strategist.pyx":31
+/* "bbwrl/bot/strategists/optimal_strategist.pyx":33
  * 
  * 
  * cdef class OptimalStrategist:             # <<<<<<<<<<<<<<
- *     cdef RewardDistribution reward_distribution
+ *     """ Implementation of the optimal strategist.
  * 
  */
 
@@ -958,6 +1100,9 @@ struct __pyx_vtabstruct_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalSt
   bool (*should_split)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int, int, int, PyObject *, int __pyx_skip_dispatch);
   bool (*should_double)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int, int, int, PyObject *, int __pyx_skip_dispatch);
   bool (*should_hit)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int, int, int, PyObject *, int __pyx_skip_dispatch);
+  int (*_best_move)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int, int, int);
+  PyObject *(*best_moves)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int, int, PyObject *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*split_moves)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int, int, PyObject *, PyObject *, int __pyx_skip_dispatch);
   void (*free_mem)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int __pyx_skip_dispatch);
 };
 static struct __pyx_vtabstruct_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_vtabptr_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist;
@@ -1059,13 +1204,21 @@ static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args,
 #ifndef Py_MEMBER_SIZE
 #define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
 #endif
+#if CYTHON_FAST_PYCALL
   static size_t __pyx_pyframe_localsplus_offset = 0;
   #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
   #define __Pxy_PyFrame_Initialize_Offsets()\
     ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
      (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
   #define __Pyx_PyFrame_GetLocalsplus(frame)\
     (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
 #endif
 
 /* PyObjectCall.proto */
@@ -1160,6 +1313,47 @@ static void __Pyx_WriteUnraisable(const char *name, int clineno,
                                   int lineno, const char *filename,
                                   int full_traceback, int nogil);
 
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
 /* PyObjectCallNoArg.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
@@ -1181,29 +1375,11 @@ static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
 /* GetAttr3.proto */
 static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
 
-/* GetBuiltinName.proto */
-static PyObject *__Pyx_GetBuiltinName(PyObject *name);
-
-/* GetModuleGlobalName.proto */
-#if CYTHON_USE_DICT_VERSIONS
-#define __Pyx_GetModuleGlobalName(var, name)  {\
-    static PY_UINT64_T __pyx_dict_version = 0;\
-    static PyObject *__pyx_dict_cached_value = NULL;\
-    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
-        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
-        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-}
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  {\
-    PY_UINT64_T __pyx_dict_version;\
-    PyObject *__pyx_dict_cached_value;\
-    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
 }
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
-#else
-#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
-#endif
 
 /* Import.proto */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
@@ -1217,28 +1393,6 @@ static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyOb
 /* RaiseException.proto */
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
-/* GetItemInt.proto */
-#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
-    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
-               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
-#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
-    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck);
-#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
-    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck);
-static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
-                                                     int is_list, int wraparound, int boundscheck);
-
 /* ExtTypeTest.proto */
 static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
 
@@ -1269,14 +1423,22 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, P
 static int __Pyx_setup_reduce(PyObject* type_obj);
 
 /* TypeImport.proto */
-#ifndef __PYX_HAVE_RT_ImportType_proto
-#define __PYX_HAVE_RT_ImportType_proto
-enum __Pyx_ImportType_CheckSize {
-   __Pyx_ImportType_CheckSize_Error = 0,
-   __Pyx_ImportType_CheckSize_Warn = 1,
-   __Pyx_ImportType_CheckSize_Ignore = 2
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
 };
-static PyTypeObject *__Pyx_ImportType(PyObject* module, const char *module_name, const char *class_name, size_t size, enum __Pyx_ImportType_CheckSize check_size);
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
 #endif
 
 /* GetVTable.proto */
@@ -1350,6 +1512,9 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_should_split(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, int __pyx_v_dealer_total, PyObject *__pyx_v_card_distribution, int __pyx_skip_dispatch); /* proto*/
 static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_should_double(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, int __pyx_v_dealer_total, PyObject *__pyx_v_card_distribution, int __pyx_skip_dispatch); /* proto*/
 static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_should_hit(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, int __pyx_v_dealer_total, PyObject *__pyx_v_card_distribution, int __pyx_skip_dispatch); /* proto*/
+static int __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist__best_move(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, int __pyx_v_dealer_total); /* proto*/
+static PyObject *__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_best_moves(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, PyObject *__pyx_v_dealer_totals, PyObject *__pyx_v_card_distribution, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_split_moves(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, PyObject *__pyx_v_dealer_totals, PyObject *__pyx_v_card_distribution, int __pyx_skip_dispatch); /* proto*/
 static void __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_free_mem(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
 
 /* Module declarations from 'libcpp.utility' */
@@ -1375,11 +1540,14 @@ extern int __pyx_module_is_main_bbwrl__bot__strategists__optimal_strategist;
 int __pyx_module_is_main_bbwrl__bot__strategists__optimal_strategist = 0;
 
 /* Implementation of 'bbwrl.bot.strategists.optimal_strategist' */
+static const char __pyx_k_HIT[] = "HIT";
 static const char __pyx_k_new[] = "__new__";
 static const char __pyx_k_dict[] = "__dict__";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "__name__";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_STAND[] = "STAND";
+static const char __pyx_k_DOUBLE[] = "DOUBLE";
 static const char __pyx_k_import[] = "__import__";
 static const char __pyx_k_pickle[] = "pickle";
 static const char __pyx_k_reduce[] = "__reduce__";
@@ -1390,16 +1558,19 @@ static const char __pyx_k_pyx_type[] = "__pyx_type";
 static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_pyx_state[] = "__pyx_state";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_best_moves[] = "best_moves";
 static const char __pyx_k_pyx_result[] = "__pyx_result";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_should_hit[] = "should_hit";
 static const char __pyx_k_PickleError[] = "PickleError";
 static const char __pyx_k_player_aces[] = "player_aces";
+static const char __pyx_k_split_moves[] = "split_moves";
 static const char __pyx_k_dealer_total[] = "dealer_total";
 static const char __pyx_k_player_total[] = "player_total";
 static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
 static const char __pyx_k_should_split[] = "should_split";
 static const char __pyx_k_stringsource[] = "stringsource";
+static const char __pyx_k_dealer_totals[] = "dealer_totals";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_should_double[] = "should_double";
 static const char __pyx_k_rule_variation[] = "rule_variation";
@@ -1413,18 +1584,26 @@ static const char __pyx_k_bbwrl_environments[] = "bbwrl.environments";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_bbwrl_bot_reward_distribution[] = "bbwrl.bot.reward_distribution";
 static const char __pyx_k_pyx_unpickle_OptimalStrategist[] = "__pyx_unpickle_OptimalStrategist";
-static const char __pyx_k_Incompatible_checksums_s_vs_0x8e[] = "Incompatible checksums (%s vs 0x8ee055d = (reward_distribution))";
+static const char __pyx_k_Implementation_of_the_optimal_s[] = " Implementation of the optimal strategist. ";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0x8ee055d, 0x7ab7f32, 0xd3af553) = (reward_distribution))";
 static const char __pyx_k_bbwrl_bot_strategists_optimal_st[] = "bbwrl.bot.strategists.optimal_strategist";
-static PyObject *__pyx_kp_s_Incompatible_checksums_s_vs_0x8e;
+static const char __pyx_k_bbwrl_bot_strategists_strategist[] = "bbwrl.bot.strategists.strategist";
+static PyObject *__pyx_n_s_DOUBLE;
+static PyObject *__pyx_n_s_HIT;
+static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
 static PyObject *__pyx_n_s_OptimalStrategist;
 static PyObject *__pyx_n_s_PickleError;
 static PyObject *__pyx_n_s_RewardDistribution;
+static PyObject *__pyx_n_s_STAND;
 static PyObject *__pyx_n_s_bbwrl_bot_reward_distribution;
 static PyObject *__pyx_n_s_bbwrl_bot_strategists_optimal_st;
+static PyObject *__pyx_n_s_bbwrl_bot_strategists_strategist;
 static PyObject *__pyx_n_s_bbwrl_environments;
+static PyObject *__pyx_n_s_best_moves;
 static PyObject *__pyx_n_s_card_distribution;
 static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_n_s_dealer_total;
+static PyObject *__pyx_n_s_dealer_totals;
 static PyObject *__pyx_n_s_dict;
 static PyObject *__pyx_n_s_free_mem;
 static PyObject *__pyx_n_s_getstate;
@@ -1451,6 +1630,7 @@ static PyObject *__pyx_n_s_setstate_cython;
 static PyObject *__pyx_n_s_should_double;
 static PyObject *__pyx_n_s_should_hit;
 static PyObject *__pyx_n_s_should_split;
+static PyObject *__pyx_n_s_split_moves;
 static PyObject *__pyx_kp_s_stringsource;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_update;
@@ -1459,17 +1639,22 @@ static int __pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
 static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_2should_split(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, int __pyx_v_dealer_total, PyObject *__pyx_v_card_distribution); /* proto */
 static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_4should_double(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, int __pyx_v_dealer_total, PyObject *__pyx_v_card_distribution); /* proto */
 static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_6should_hit(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, int __pyx_v_dealer_total, PyObject *__pyx_v_card_distribution); /* proto */
-static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_8free_mem(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_10__reduce_cython__(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_12__setstate_cython__(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_8best_moves(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, PyObject *__pyx_v_dealer_totals, PyObject *__pyx_v_card_distribution); /* proto */
+static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_10split_moves(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, PyObject *__pyx_v_dealer_totals, PyObject *__pyx_v_card_distribution); /* proto */
+static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_12free_mem(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_14__reduce_cython__(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_16__setstate_cython__(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist___pyx_unpickle_OptimalStrategist(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_tp_new_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_int_128679730;
 static PyObject *__pyx_int_149816669;
+static PyObject *__pyx_int_221967699;
 static PyObject *__pyx_tuple_;
-static PyObject *__pyx_codeobj__2;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_codeobj__3;
 /* Late includes */
 
-/* "bbwrl/bot/strategists/optimal_strategist.pyx":34
+/* "bbwrl/bot/strategists/optimal_strategist.pyx":45
  *     cdef RewardDistribution reward_distribution
  * 
  *     def __init__(self, utility_function):             # <<<<<<<<<<<<<<
@@ -1506,7 +1691,7 @@ static int __pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 34, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 45, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
       goto __pyx_L5_argtuple_error;
@@ -1517,7 +1702,7 @@ static int __pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 34, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 45, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bbwrl.bot.strategists.optimal_strategist.OptimalStrategist.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1539,14 +1724,14 @@ static int __pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":35
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":46
  * 
  *     def __init__(self, utility_function):
  *         self.reward_distribution = RewardDistribution(utility_function)             # <<<<<<<<<<<<<<
  * 
  *     cpdef bool should_split(self,
  */
-  __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_5bbwrl_3bot_19reward_distribution_RewardDistribution), __pyx_v_utility_function); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 35, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_5bbwrl_3bot_19reward_distribution_RewardDistribution), __pyx_v_utility_function); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF(__pyx_v_self->reward_distribution);
@@ -1554,7 +1739,7 @@ static int __pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
   __pyx_v_self->reward_distribution = ((struct __pyx_obj_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":34
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":45
  *     cdef RewardDistribution reward_distribution
  * 
  *     def __init__(self, utility_function):             # <<<<<<<<<<<<<<
@@ -1574,7 +1759,7 @@ static int __pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
   return __pyx_r;
 }
 
-/* "bbwrl/bot/strategists/optimal_strategist.pyx":37
+/* "bbwrl/bot/strategists/optimal_strategist.pyx":48
  *         self.reward_distribution = RewardDistribution(utility_function)
  * 
  *     cpdef bool should_split(self,             # <<<<<<<<<<<<<<
@@ -1612,14 +1797,14 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_should_split); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 37, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_should_split); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 48, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_3should_split)) {
-        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_player_total); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 37, __pyx_L1_error)
+        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_player_total); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 48, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_player_aces); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 37, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_player_aces); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 48, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_dealer_total); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 37, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_dealer_total); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 48, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_6 = __pyx_t_1; __pyx_t_7 = NULL;
@@ -1637,7 +1822,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
         #if CYTHON_FAST_PYCALL
         if (PyFunction_Check(__pyx_t_6)) {
           PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_card_distribution};
-          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 48, __pyx_L1_error)
           __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -1648,7 +1833,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
         #if CYTHON_FAST_PYCCALL
         if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
           PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_card_distribution};
-          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 48, __pyx_L1_error)
           __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -1657,7 +1842,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
         } else
         #endif
         {
-          __pyx_t_9 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 37, __pyx_L1_error)
+          __pyx_t_9 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 48, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_9);
           if (__pyx_t_7) {
             __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
@@ -1674,12 +1859,12 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
           __pyx_t_3 = 0;
           __pyx_t_4 = 0;
           __pyx_t_5 = 0;
-          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 48, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
         }
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_10 == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 37, __pyx_L1_error)
+        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_10 == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 48, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         __pyx_r = __pyx_t_10;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -1698,9 +1883,9 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
     #endif
   }
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":42
- *                             int dealer_total,
- *                             card_distribution):
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":62
+ *                 shoe.
+ *         """
  *         cdef RewardDistribution rd = self.reward_distribution             # <<<<<<<<<<<<<<
  *         rd.set_card_distribution(card_distribution)
  *         cdef double distr_split[17]
@@ -1710,8 +1895,8 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
   __pyx_v_rd = ((struct __pyx_obj_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":43
- *                             card_distribution):
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":63
+ *         """
  *         cdef RewardDistribution rd = self.reward_distribution
  *         rd.set_card_distribution(card_distribution)             # <<<<<<<<<<<<<<
  *         cdef double distr_split[17]
@@ -1719,37 +1904,37 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
  */
   ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->set_card_distribution(__pyx_v_rd, __pyx_v_card_distribution);
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":45
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":65
  *         rd.set_card_distribution(card_distribution)
  *         cdef double distr_split[17]
  *         distr_split = rd.distr_split(player_total,             # <<<<<<<<<<<<<<
  *                                      player_aces,
  *                                      dealer_total)
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_player_total); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 45, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_player_total); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 65, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":46
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":66
  *         cdef double distr_split[17]
  *         distr_split = rd.distr_split(player_total,
  *                                      player_aces,             # <<<<<<<<<<<<<<
  *                                      dealer_total)
  *         cdef double distr_hit_stand_double[17]
  */
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_player_aces); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_player_aces); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 66, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":47
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":67
  *         distr_split = rd.distr_split(player_total,
  *                                      player_aces,
  *                                      dealer_total)             # <<<<<<<<<<<<<<
  *         cdef double distr_hit_stand_double[17]
  *         distr_hit_stand_double = rd.distr_hit_stand_double(player_total,
  */
-  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_dealer_total); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 47, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_dealer_total); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":45
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":65
  *         rd.set_card_distribution(card_distribution)
  *         cdef double distr_split[17]
  *         distr_split = rd.distr_split(player_total,             # <<<<<<<<<<<<<<
@@ -1761,7 +1946,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":49
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":69
  *                                      dealer_total)
  *         cdef double distr_hit_stand_double[17]
  *         distr_hit_stand_double = rd.distr_hit_stand_double(player_total,             # <<<<<<<<<<<<<<
@@ -1770,7 +1955,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
  */
   memcpy(&(__pyx_v_distr_hit_stand_double[0]), ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distr_hit_stand_double(__pyx_v_rd, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_total), sizeof(__pyx_v_distr_hit_stand_double[0]) * (17 - 0));
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":53
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":73
  *                                                            dealer_total)
  *         return (rd.distribution_value(distr_split) >
  *                 rd.distribution_value(distr_hit_stand_double))             # <<<<<<<<<<<<<<
@@ -1780,7 +1965,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
   __pyx_r = (((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distribution_value(__pyx_v_rd, __pyx_v_distr_split) > ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distribution_value(__pyx_v_rd, __pyx_v_distr_hit_stand_double));
   goto __pyx_L0;
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":37
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":48
  *         self.reward_distribution = RewardDistribution(utility_function)
  * 
  *     cpdef bool should_split(self,             # <<<<<<<<<<<<<<
@@ -1808,6 +1993,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
 
 /* Python wrapper */
 static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_3should_split(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_2should_split[] = " Returns whether it is optimal to split in the given state.\n\n        Args:\n            player_total: The hand total of the player.\n            player_aces: The number of soft aces available to the player.\n            dealer_total: The hand total of the dealer.\n            card_distribution: The distribution of the cards remaining in the\n                shoe.\n        ";
 static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_3should_split(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   int __pyx_v_player_total;
   int __pyx_v_player_aces;
@@ -1846,23 +2032,23 @@ static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_player_aces)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("should_split", 1, 4, 4, 1); __PYX_ERR(0, 37, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("should_split", 1, 4, 4, 1); __PYX_ERR(0, 48, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_dealer_total)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("should_split", 1, 4, 4, 2); __PYX_ERR(0, 37, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("should_split", 1, 4, 4, 2); __PYX_ERR(0, 48, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_card_distribution)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("should_split", 1, 4, 4, 3); __PYX_ERR(0, 37, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("should_split", 1, 4, 4, 3); __PYX_ERR(0, 48, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "should_split") < 0)) __PYX_ERR(0, 37, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "should_split") < 0)) __PYX_ERR(0, 48, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -1872,14 +2058,14 @@ static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_player_total = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_player_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 38, __pyx_L3_error)
-    __pyx_v_player_aces = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_player_aces == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 39, __pyx_L3_error)
-    __pyx_v_dealer_total = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_dealer_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 40, __pyx_L3_error)
+    __pyx_v_player_total = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_player_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 49, __pyx_L3_error)
+    __pyx_v_player_aces = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_player_aces == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 50, __pyx_L3_error)
+    __pyx_v_dealer_total = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_dealer_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 51, __pyx_L3_error)
     __pyx_v_card_distribution = values[3];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("should_split", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 37, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("should_split", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 48, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bbwrl.bot.strategists.optimal_strategist.OptimalStrategist.should_split", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1901,7 +2087,7 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("should_split", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_should_split(__pyx_v_self, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_total, __pyx_v_card_distribution, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_should_split(__pyx_v_self, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_total, __pyx_v_card_distribution, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 48, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -1918,7 +2104,7 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
   return __pyx_r;
 }
 
-/* "bbwrl/bot/strategists/optimal_strategist.pyx":55
+/* "bbwrl/bot/strategists/optimal_strategist.pyx":75
  *                 rd.distribution_value(distr_hit_stand_double))
  * 
  *     cpdef bool should_double(self,             # <<<<<<<<<<<<<<
@@ -1956,14 +2142,14 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_should_double); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_should_double); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_5should_double)) {
-        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_player_total); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 55, __pyx_L1_error)
+        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_player_total); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 75, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_player_aces); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 55, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_player_aces); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 75, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_dealer_total); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 55, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_dealer_total); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 75, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_6 = __pyx_t_1; __pyx_t_7 = NULL;
@@ -1981,7 +2167,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
         #if CYTHON_FAST_PYCALL
         if (PyFunction_Check(__pyx_t_6)) {
           PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_card_distribution};
-          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 55, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L1_error)
           __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -1992,7 +2178,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
         #if CYTHON_FAST_PYCCALL
         if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
           PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_card_distribution};
-          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 55, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L1_error)
           __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2001,7 +2187,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
         } else
         #endif
         {
-          __pyx_t_9 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 55, __pyx_L1_error)
+          __pyx_t_9 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 75, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_9);
           if (__pyx_t_7) {
             __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
@@ -2018,12 +2204,12 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
           __pyx_t_3 = 0;
           __pyx_t_4 = 0;
           __pyx_t_5 = 0;
-          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 55, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
         }
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_10 == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 55, __pyx_L1_error)
+        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_10 == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 75, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         __pyx_r = __pyx_t_10;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -2042,9 +2228,9 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
     #endif
   }
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":60
- *                              int dealer_total,
- *                              card_distribution):
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":89
+ *                 shoe.
+ *         """
  *         cdef RewardDistribution rd = self.reward_distribution             # <<<<<<<<<<<<<<
  *         rd.set_card_distribution(card_distribution)
  *         cdef double distr_double[17]
@@ -2054,8 +2240,8 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
   __pyx_v_rd = ((struct __pyx_obj_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":61
- *                              card_distribution):
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":90
+ *         """
  *         cdef RewardDistribution rd = self.reward_distribution
  *         rd.set_card_distribution(card_distribution)             # <<<<<<<<<<<<<<
  *         cdef double distr_double[17]
@@ -2063,7 +2249,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
  */
   ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->set_card_distribution(__pyx_v_rd, __pyx_v_card_distribution);
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":63
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":92
  *         rd.set_card_distribution(card_distribution)
  *         cdef double distr_double[17]
  *         distr_double = rd.distr_double(player_total,             # <<<<<<<<<<<<<<
@@ -2072,7 +2258,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
  */
   memcpy(&(__pyx_v_distr_double[0]), ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distr_double(__pyx_v_rd, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_total), sizeof(__pyx_v_distr_double[0]) * (17 - 0));
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":67
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":96
  *                                        dealer_total)
  *         cdef double distr_hit_stand[17]
  *         distr_hit_stand = rd.distr_hit_stand(player_total,             # <<<<<<<<<<<<<<
@@ -2081,7 +2267,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
  */
   memcpy(&(__pyx_v_distr_hit_stand[0]), ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distr_hit_stand(__pyx_v_rd, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_total), sizeof(__pyx_v_distr_hit_stand[0]) * (17 - 0));
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":71
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":100
  *                                              dealer_total)
  *         return (rd.distribution_value(distr_double) >
  *                 rd.distribution_value(distr_hit_stand))             # <<<<<<<<<<<<<<
@@ -2091,7 +2277,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
   __pyx_r = (((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distribution_value(__pyx_v_rd, __pyx_v_distr_double) > ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distribution_value(__pyx_v_rd, __pyx_v_distr_hit_stand));
   goto __pyx_L0;
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":55
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":75
  *                 rd.distribution_value(distr_hit_stand_double))
  * 
  *     cpdef bool should_double(self,             # <<<<<<<<<<<<<<
@@ -2119,6 +2305,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
 
 /* Python wrapper */
 static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_5should_double(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_4should_double[] = " Returns whether it is optimal to double down in the given state.\n\n        Args:\n            player_total: The hand total of the player.\n            player_aces: The number of soft aces available to the player.\n            dealer_total: The hand total of the dealer.\n            card_distribution: The distribution of the cards remaining in the\n                shoe.\n        ";
 static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_5should_double(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   int __pyx_v_player_total;
   int __pyx_v_player_aces;
@@ -2157,23 +2344,23 @@ static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_player_aces)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("should_double", 1, 4, 4, 1); __PYX_ERR(0, 55, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("should_double", 1, 4, 4, 1); __PYX_ERR(0, 75, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_dealer_total)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("should_double", 1, 4, 4, 2); __PYX_ERR(0, 55, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("should_double", 1, 4, 4, 2); __PYX_ERR(0, 75, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_card_distribution)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("should_double", 1, 4, 4, 3); __PYX_ERR(0, 55, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("should_double", 1, 4, 4, 3); __PYX_ERR(0, 75, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "should_double") < 0)) __PYX_ERR(0, 55, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "should_double") < 0)) __PYX_ERR(0, 75, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -2183,14 +2370,14 @@ static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_player_total = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_player_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 56, __pyx_L3_error)
-    __pyx_v_player_aces = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_player_aces == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 57, __pyx_L3_error)
-    __pyx_v_dealer_total = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_dealer_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 58, __pyx_L3_error)
+    __pyx_v_player_total = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_player_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 76, __pyx_L3_error)
+    __pyx_v_player_aces = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_player_aces == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 77, __pyx_L3_error)
+    __pyx_v_dealer_total = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_dealer_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 78, __pyx_L3_error)
     __pyx_v_card_distribution = values[3];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("should_double", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 55, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("should_double", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 75, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bbwrl.bot.strategists.optimal_strategist.OptimalStrategist.should_double", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -2212,7 +2399,7 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("should_double", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_should_double(__pyx_v_self, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_total, __pyx_v_card_distribution, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_should_double(__pyx_v_self, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_total, __pyx_v_card_distribution, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2229,7 +2416,7 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
   return __pyx_r;
 }
 
-/* "bbwrl/bot/strategists/optimal_strategist.pyx":73
+/* "bbwrl/bot/strategists/optimal_strategist.pyx":102
  *                 rd.distribution_value(distr_hit_stand))
  * 
  *     cpdef bool should_hit(self,             # <<<<<<<<<<<<<<
@@ -2267,14 +2454,14 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_should_hit); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 73, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_should_hit); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 102, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_7should_hit)) {
-        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_player_total); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 73, __pyx_L1_error)
+        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_player_total); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 102, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_player_aces); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 73, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_player_aces); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 102, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_dealer_total); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 73, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_dealer_total); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 102, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_6 = __pyx_t_1; __pyx_t_7 = NULL;
@@ -2292,7 +2479,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
         #if CYTHON_FAST_PYCALL
         if (PyFunction_Check(__pyx_t_6)) {
           PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_card_distribution};
-          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 73, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 102, __pyx_L1_error)
           __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2303,7 +2490,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
         #if CYTHON_FAST_PYCCALL
         if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
           PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_card_distribution};
-          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 73, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 102, __pyx_L1_error)
           __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2312,7 +2499,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
         } else
         #endif
         {
-          __pyx_t_9 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 73, __pyx_L1_error)
+          __pyx_t_9 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 102, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_9);
           if (__pyx_t_7) {
             __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
@@ -2329,12 +2516,12 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
           __pyx_t_3 = 0;
           __pyx_t_4 = 0;
           __pyx_t_5 = 0;
-          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 73, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 102, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
         }
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_10 == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 73, __pyx_L1_error)
+        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_10 == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         __pyx_r = __pyx_t_10;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -2353,9 +2540,9 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
     #endif
   }
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":78
- *                           int dealer_total,
- *                           card_distribution):
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":116
+ *                 shoe.
+ *         """
  *         cdef RewardDistribution rd = self.reward_distribution             # <<<<<<<<<<<<<<
  *         rd.set_card_distribution(card_distribution)
  *         cdef double distr_hit[17]
@@ -2365,8 +2552,8 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
   __pyx_v_rd = ((struct __pyx_obj_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":79
- *                           card_distribution):
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":117
+ *         """
  *         cdef RewardDistribution rd = self.reward_distribution
  *         rd.set_card_distribution(card_distribution)             # <<<<<<<<<<<<<<
  *         cdef double distr_hit[17]
@@ -2374,7 +2561,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
  */
   ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->set_card_distribution(__pyx_v_rd, __pyx_v_card_distribution);
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":81
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":119
  *         rd.set_card_distribution(card_distribution)
  *         cdef double distr_hit[17]
  *         distr_hit = rd.distr_hit(player_total,             # <<<<<<<<<<<<<<
@@ -2383,7 +2570,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
  */
   memcpy(&(__pyx_v_distr_hit[0]), ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distr_hit(__pyx_v_rd, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_total), sizeof(__pyx_v_distr_hit[0]) * (17 - 0));
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":86
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":124
  *         cdef double distr_stand[17]
  *         distr_stand = rd.distr_stand(player_total,
  *                                      1 if dealer_total == 11 else 0,             # <<<<<<<<<<<<<<
@@ -2396,7 +2583,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
     __pyx_t_8 = 0;
   }
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":85
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":123
  *                                  dealer_total)
  *         cdef double distr_stand[17]
  *         distr_stand = rd.distr_stand(player_total,             # <<<<<<<<<<<<<<
@@ -2405,17 +2592,17 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
  */
   memcpy(&(__pyx_v_distr_stand[0]), ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distr_stand(__pyx_v_rd, __pyx_v_player_total, __pyx_t_8, __pyx_v_dealer_total, 1), sizeof(__pyx_v_distr_stand[0]) * (17 - 0));
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":90
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":128
  *                                      True)
  *         return (rd.distribution_value(distr_hit) >
  *                 rd.distribution_value(distr_stand))             # <<<<<<<<<<<<<<
  * 
- *     cpdef void free_mem(self):
+ *     cdef int _best_move(self,
  */
   __pyx_r = (((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distribution_value(__pyx_v_rd, __pyx_v_distr_hit) > ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distribution_value(__pyx_v_rd, __pyx_v_distr_stand));
   goto __pyx_L0;
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":73
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":102
  *                 rd.distribution_value(distr_hit_stand))
  * 
  *     cpdef bool should_hit(self,             # <<<<<<<<<<<<<<
@@ -2443,6 +2630,7 @@ static bool __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
 
 /* Python wrapper */
 static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_7should_hit(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_6should_hit[] = " Returns whether it is optimal to hit in the given state.\n\n        Args:\n            player_total: The hand total of the player.\n            player_aces: The number of soft aces available to the player.\n            dealer_total: The hand total of the dealer.\n            card_distribution: The distribution of the cards remaining in the\n                shoe.\n        ";
 static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_7should_hit(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   int __pyx_v_player_total;
   int __pyx_v_player_aces;
@@ -2481,23 +2669,23 @@ static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_player_aces)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("should_hit", 1, 4, 4, 1); __PYX_ERR(0, 73, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("should_hit", 1, 4, 4, 1); __PYX_ERR(0, 102, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_dealer_total)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("should_hit", 1, 4, 4, 2); __PYX_ERR(0, 73, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("should_hit", 1, 4, 4, 2); __PYX_ERR(0, 102, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_card_distribution)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("should_hit", 1, 4, 4, 3); __PYX_ERR(0, 73, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("should_hit", 1, 4, 4, 3); __PYX_ERR(0, 102, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "should_hit") < 0)) __PYX_ERR(0, 73, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "should_hit") < 0)) __PYX_ERR(0, 102, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -2507,14 +2695,14 @@ static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_player_total = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_player_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 74, __pyx_L3_error)
-    __pyx_v_player_aces = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_player_aces == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 75, __pyx_L3_error)
-    __pyx_v_dealer_total = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_dealer_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 76, __pyx_L3_error)
+    __pyx_v_player_total = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_player_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 103, __pyx_L3_error)
+    __pyx_v_player_aces = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_player_aces == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
+    __pyx_v_dealer_total = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_dealer_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 105, __pyx_L3_error)
     __pyx_v_card_distribution = values[3];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("should_hit", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 73, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("should_hit", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 102, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bbwrl.bot.strategists.optimal_strategist.OptimalStrategist.should_hit", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -2536,7 +2724,7 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("should_hit", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_should_hit(__pyx_v_self, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_total, __pyx_v_card_distribution, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 73, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_should_hit(__pyx_v_self, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_total, __pyx_v_card_distribution, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 102, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2553,24 +2741,217 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
   return __pyx_r;
 }
 
-/* "bbwrl/bot/strategists/optimal_strategist.pyx":92
+/* "bbwrl/bot/strategists/optimal_strategist.pyx":130
  *                 rd.distribution_value(distr_stand))
  * 
- *     cpdef void free_mem(self):             # <<<<<<<<<<<<<<
- *         self.reward_distribution.free_mem()
+ *     cdef int _best_move(self,             # <<<<<<<<<<<<<<
+ *                         int player_total,
+ *                         int player_aces,
  */
 
-static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_9free_mem(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static void __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_free_mem(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_skip_dispatch) {
+static int __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist__best_move(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, int __pyx_v_dealer_total) {
+  struct __pyx_obj_5bbwrl_3bot_19reward_distribution_RewardDistribution *__pyx_v_rd = 0;
+  double __pyx_v_value_double;
+  double __pyx_v_value_hit;
+  double __pyx_v_value_stand;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  double __pyx_t_3;
+  double __pyx_t_4;
+  double __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_best_move", 0);
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":140
+ *         should_hit.
+ *         """
+ *         cdef RewardDistribution rd = self.reward_distribution             # <<<<<<<<<<<<<<
+ *         cdef double value_double = rd.distribution_value(
+ *             rd.distr_double(player_total, player_aces, dealer_total))
+ */
+  __pyx_t_1 = ((PyObject *)__pyx_v_self->reward_distribution);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_rd = ((struct __pyx_obj_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":141
+ *         """
+ *         cdef RewardDistribution rd = self.reward_distribution
+ *         cdef double value_double = rd.distribution_value(             # <<<<<<<<<<<<<<
+ *             rd.distr_double(player_total, player_aces, dealer_total))
+ *         cdef double value_hit = rd.distribution_value(
+ */
+  __pyx_v_value_double = ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distribution_value(__pyx_v_rd, ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distr_double(__pyx_v_rd, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_total));
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":143
+ *         cdef double value_double = rd.distribution_value(
+ *             rd.distr_double(player_total, player_aces, dealer_total))
+ *         cdef double value_hit = rd.distribution_value(             # <<<<<<<<<<<<<<
+ *             rd.distr_hit(player_total, player_aces, dealer_total))
+ *         cdef double value_stand = rd.distribution_value(
+ */
+  __pyx_v_value_hit = ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distribution_value(__pyx_v_rd, ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distr_hit(__pyx_v_rd, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_total));
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":147
+ *         cdef double value_stand = rd.distribution_value(
+ *             rd.distr_stand(player_total,
+ *                            1 if dealer_total == 11 else 0,             # <<<<<<<<<<<<<<
+ *                            dealer_total,
+ *                            True))
+ */
+  if (((__pyx_v_dealer_total == 11) != 0)) {
+    __pyx_t_2 = 1;
+  } else {
+    __pyx_t_2 = 0;
+  }
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":145
+ *         cdef double value_hit = rd.distribution_value(
+ *             rd.distr_hit(player_total, player_aces, dealer_total))
+ *         cdef double value_stand = rd.distribution_value(             # <<<<<<<<<<<<<<
+ *             rd.distr_stand(player_total,
+ *                            1 if dealer_total == 11 else 0,
+ */
+  __pyx_v_value_stand = ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distribution_value(__pyx_v_rd, ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_rd->__pyx_vtab)->distr_stand(__pyx_v_rd, __pyx_v_player_total, __pyx_t_2, __pyx_v_dealer_total, 1));
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":150
+ *                            dealer_total,
+ *                            True))
+ *         if value_double > max(value_hit, value_stand):             # <<<<<<<<<<<<<<
+ *             return DOUBLE
+ *         if value_hit > value_stand:
+ */
+  __pyx_t_3 = __pyx_v_value_stand;
+  __pyx_t_4 = __pyx_v_value_hit;
+  if (((__pyx_t_3 > __pyx_t_4) != 0)) {
+    __pyx_t_5 = __pyx_t_3;
+  } else {
+    __pyx_t_5 = __pyx_t_4;
+  }
+  __pyx_t_6 = ((__pyx_v_value_double > __pyx_t_5) != 0);
+  if (__pyx_t_6) {
+
+    /* "bbwrl/bot/strategists/optimal_strategist.pyx":151
+ *                            True))
+ *         if value_double > max(value_hit, value_stand):
+ *             return DOUBLE             # <<<<<<<<<<<<<<
+ *         if value_hit > value_stand:
+ *             return HIT
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_DOUBLE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 151, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+
+    /* "bbwrl/bot/strategists/optimal_strategist.pyx":150
+ *                            dealer_total,
+ *                            True))
+ *         if value_double > max(value_hit, value_stand):             # <<<<<<<<<<<<<<
+ *             return DOUBLE
+ *         if value_hit > value_stand:
+ */
+  }
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":152
+ *         if value_double > max(value_hit, value_stand):
+ *             return DOUBLE
+ *         if value_hit > value_stand:             # <<<<<<<<<<<<<<
+ *             return HIT
+ *         return STAND
+ */
+  __pyx_t_6 = ((__pyx_v_value_hit > __pyx_v_value_stand) != 0);
+  if (__pyx_t_6) {
+
+    /* "bbwrl/bot/strategists/optimal_strategist.pyx":153
+ *             return DOUBLE
+ *         if value_hit > value_stand:
+ *             return HIT             # <<<<<<<<<<<<<<
+ *         return STAND
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_HIT); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 153, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 153, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+
+    /* "bbwrl/bot/strategists/optimal_strategist.pyx":152
+ *         if value_double > max(value_hit, value_stand):
+ *             return DOUBLE
+ *         if value_hit > value_stand:             # <<<<<<<<<<<<<<
+ *             return HIT
+ *         return STAND
+ */
+  }
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":154
+ *         if value_hit > value_stand:
+ *             return HIT
+ *         return STAND             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef list best_moves(self,
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_STAND); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 154, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 154, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  goto __pyx_L0;
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":130
+ *                 rd.distribution_value(distr_stand))
+ * 
+ *     cdef int _best_move(self,             # <<<<<<<<<<<<<<
+ *                         int player_total,
+ *                         int player_aces,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_WriteUnraisable("bbwrl.bot.strategists.optimal_strategist.OptimalStrategist._best_move", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_rd);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bbwrl/bot/strategists/optimal_strategist.pyx":156
+ *         return STAND
+ * 
+ *     cpdef list best_moves(self,             # <<<<<<<<<<<<<<
+ *                           int player_total,
+ *                           int player_aces,
+ */
+
+static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_9best_moves(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_best_moves(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, PyObject *__pyx_v_dealer_totals, PyObject *__pyx_v_card_distribution, int __pyx_skip_dispatch) {
+  int __pyx_7genexpr__pyx_v_dealer_total;
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  Py_ssize_t __pyx_t_9;
+  PyObject *(*__pyx_t_10)(PyObject *);
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("free_mem", 0);
+  __Pyx_RefNannySetupContext("best_moves", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
@@ -2580,26 +2961,73 @@ static void __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_free_mem); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_best_moves); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_9free_mem)) {
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_9best_moves)) {
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_player_total); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_player_aces); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
         __Pyx_INCREF(__pyx_t_1);
-        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-          if (likely(__pyx_t_4)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-            __Pyx_INCREF(__pyx_t_4);
+        __pyx_t_5 = __pyx_t_1; __pyx_t_6 = NULL;
+        __pyx_t_7 = 0;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+          __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+          if (likely(__pyx_t_6)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+            __Pyx_INCREF(__pyx_t_6);
             __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_3, function);
+            __Pyx_DECREF_SET(__pyx_t_5, function);
+            __pyx_t_7 = 1;
           }
         }
-        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 92, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_5)) {
+          PyObject *__pyx_temp[5] = {__pyx_t_6, __pyx_t_3, __pyx_t_4, __pyx_v_dealer_totals, __pyx_v_card_distribution};
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 4+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 156, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+          PyObject *__pyx_temp[5] = {__pyx_t_6, __pyx_t_3, __pyx_t_4, __pyx_v_dealer_totals, __pyx_v_card_distribution};
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 4+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 156, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_8 = PyTuple_New(4+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 156, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          if (__pyx_t_6) {
+            __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
+          }
+          __Pyx_GIVEREF(__pyx_t_3);
+          PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_t_3);
+          __Pyx_GIVEREF(__pyx_t_4);
+          PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_4);
+          __Pyx_INCREF(__pyx_v_dealer_totals);
+          __Pyx_GIVEREF(__pyx_v_dealer_totals);
+          PyTuple_SET_ITEM(__pyx_t_8, 2+__pyx_t_7, __pyx_v_dealer_totals);
+          __Pyx_INCREF(__pyx_v_card_distribution);
+          __Pyx_GIVEREF(__pyx_v_card_distribution);
+          PyTuple_SET_ITEM(__pyx_t_8, 3+__pyx_t_7, __pyx_v_card_distribution);
+          __pyx_t_3 = 0;
+          __pyx_t_4 = 0;
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 156, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        if (!(likely(PyList_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_t_2)->tp_name), 0))) __PYX_ERR(0, 156, __pyx_L1_error)
+        __pyx_r = ((PyObject*)__pyx_t_2);
+        __pyx_t_2 = 0;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         goto __pyx_L0;
       }
@@ -2616,17 +3044,662 @@ static void __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
     #endif
   }
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":93
- * 
- *     cpdef void free_mem(self):
- *         self.reward_distribution.free_mem()             # <<<<<<<<<<<<<<
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":176
+ *             One of DOUBLE, HIT and STAND for each of the dealer totals.
+ *         """
+ *         self.reward_distribution.set_card_distribution(card_distribution)             # <<<<<<<<<<<<<<
+ *         cdef int dealer_total
+ *         return [self._best_move(player_total, player_aces, dealer_total)
  */
-  ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_self->reward_distribution->__pyx_vtab)->free_mem(__pyx_v_self->reward_distribution);
+  ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_self->reward_distribution->__pyx_vtab)->set_card_distribution(__pyx_v_self->reward_distribution, __pyx_v_card_distribution);
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":92
- *                 rd.distribution_value(distr_stand))
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":178
+ *         self.reward_distribution.set_card_distribution(card_distribution)
+ *         cdef int dealer_total
+ *         return [self._best_move(player_total, player_aces, dealer_total)             # <<<<<<<<<<<<<<
+ *                 for dealer_total in dealer_totals]
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  { /* enter inner scope */
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 178, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+
+    /* "bbwrl/bot/strategists/optimal_strategist.pyx":179
+ *         cdef int dealer_total
+ *         return [self._best_move(player_total, player_aces, dealer_total)
+ *                 for dealer_total in dealer_totals]             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef list split_moves(self,
+ */
+    if (likely(PyList_CheckExact(__pyx_v_dealer_totals)) || PyTuple_CheckExact(__pyx_v_dealer_totals)) {
+      __pyx_t_2 = __pyx_v_dealer_totals; __Pyx_INCREF(__pyx_t_2); __pyx_t_9 = 0;
+      __pyx_t_10 = NULL;
+    } else {
+      __pyx_t_9 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_dealer_totals); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 179, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_10 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 179, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_10)) {
+        if (likely(PyList_CheckExact(__pyx_t_2))) {
+          if (__pyx_t_9 >= PyList_GET_SIZE(__pyx_t_2)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_5 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_9); __Pyx_INCREF(__pyx_t_5); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 179, __pyx_L1_error)
+          #else
+          __pyx_t_5 = PySequence_ITEM(__pyx_t_2, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 179, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          #endif
+        } else {
+          if (__pyx_t_9 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_9); __Pyx_INCREF(__pyx_t_5); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 179, __pyx_L1_error)
+          #else
+          __pyx_t_5 = PySequence_ITEM(__pyx_t_2, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 179, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          #endif
+        }
+      } else {
+        __pyx_t_5 = __pyx_t_10(__pyx_t_2);
+        if (unlikely(!__pyx_t_5)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 179, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_5);
+      }
+      __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_5); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 179, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_7genexpr__pyx_v_dealer_total = __pyx_t_7;
+
+      /* "bbwrl/bot/strategists/optimal_strategist.pyx":178
+ *         self.reward_distribution.set_card_distribution(card_distribution)
+ *         cdef int dealer_total
+ *         return [self._best_move(player_total, player_aces, dealer_total)             # <<<<<<<<<<<<<<
+ *                 for dealer_total in dealer_totals]
+ * 
+ */
+      __pyx_t_5 = __Pyx_PyInt_From_int(((struct __pyx_vtabstruct_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *)__pyx_v_self->__pyx_vtab)->_best_move(__pyx_v_self, __pyx_v_player_total, __pyx_v_player_aces, __pyx_7genexpr__pyx_v_dealer_total)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 178, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_5))) __PYX_ERR(0, 178, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+      /* "bbwrl/bot/strategists/optimal_strategist.pyx":179
+ *         cdef int dealer_total
+ *         return [self._best_move(player_total, player_aces, dealer_total)
+ *                 for dealer_total in dealer_totals]             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef list split_moves(self,
+ */
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  } /* exit inner scope */
+  __pyx_r = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":156
+ *         return STAND
+ * 
+ *     cpdef list best_moves(self,             # <<<<<<<<<<<<<<
+ *                           int player_total,
+ *                           int player_aces,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("bbwrl.bot.strategists.optimal_strategist.OptimalStrategist.best_moves", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_9best_moves(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_8best_moves[] = " Returns the optimal move against each of the dealer totals.\n\n        Evaluates a whole row of a strategy table in one call, each move is\n        the one get_action of a Strategist would return.\n\n        Args:\n            player_total: The hand total of the player.\n            player_aces: The number of soft aces available to the player.\n            dealer_totals: The hand totals of the dealer.\n            card_distribution: The distribution of the cards remaining in the\n                shoe.\n\n        Returns:\n            One of DOUBLE, HIT and STAND for each of the dealer totals.\n        ";
+static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_9best_moves(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_player_total;
+  int __pyx_v_player_aces;
+  PyObject *__pyx_v_dealer_totals = 0;
+  PyObject *__pyx_v_card_distribution = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("best_moves (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_player_total,&__pyx_n_s_player_aces,&__pyx_n_s_dealer_totals,&__pyx_n_s_card_distribution,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_player_total)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_player_aces)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("best_moves", 1, 4, 4, 1); __PYX_ERR(0, 156, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_dealer_totals)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("best_moves", 1, 4, 4, 2); __PYX_ERR(0, 156, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_card_distribution)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("best_moves", 1, 4, 4, 3); __PYX_ERR(0, 156, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "best_moves") < 0)) __PYX_ERR(0, 156, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+    }
+    __pyx_v_player_total = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_player_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L3_error)
+    __pyx_v_player_aces = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_player_aces == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 158, __pyx_L3_error)
+    __pyx_v_dealer_totals = values[2];
+    __pyx_v_card_distribution = values[3];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("best_moves", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 156, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bbwrl.bot.strategists.optimal_strategist.OptimalStrategist.best_moves", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_8best_moves(((struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *)__pyx_v_self), __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_totals, __pyx_v_card_distribution);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_8best_moves(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, PyObject *__pyx_v_dealer_totals, PyObject *__pyx_v_card_distribution) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("best_moves", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_best_moves(__pyx_v_self, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_totals, __pyx_v_card_distribution, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bbwrl.bot.strategists.optimal_strategist.OptimalStrategist.best_moves", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bbwrl/bot/strategists/optimal_strategist.pyx":181
+ *                 for dealer_total in dealer_totals]
+ * 
+ *     cpdef list split_moves(self,             # <<<<<<<<<<<<<<
+ *                            int player_total,
+ *                            int player_aces,
+ */
+
+static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_11split_moves(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_split_moves(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, PyObject *__pyx_v_dealer_totals, PyObject *__pyx_v_card_distribution, int __pyx_skip_dispatch) {
+  int __pyx_8genexpr1__pyx_v_dealer_total;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  Py_ssize_t __pyx_t_9;
+  PyObject *(*__pyx_t_10)(PyObject *);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("split_moves", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_split_moves); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 181, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_11split_moves)) {
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_player_total); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 181, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_player_aces); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 181, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_5 = __pyx_t_1; __pyx_t_6 = NULL;
+        __pyx_t_7 = 0;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+          __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+          if (likely(__pyx_t_6)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+            __Pyx_INCREF(__pyx_t_6);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_5, function);
+            __pyx_t_7 = 1;
+          }
+        }
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_5)) {
+          PyObject *__pyx_temp[5] = {__pyx_t_6, __pyx_t_3, __pyx_t_4, __pyx_v_dealer_totals, __pyx_v_card_distribution};
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 4+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+          PyObject *__pyx_temp[5] = {__pyx_t_6, __pyx_t_3, __pyx_t_4, __pyx_v_dealer_totals, __pyx_v_card_distribution};
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 4+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_8 = PyTuple_New(4+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 181, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          if (__pyx_t_6) {
+            __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
+          }
+          __Pyx_GIVEREF(__pyx_t_3);
+          PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_t_3);
+          __Pyx_GIVEREF(__pyx_t_4);
+          PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_4);
+          __Pyx_INCREF(__pyx_v_dealer_totals);
+          __Pyx_GIVEREF(__pyx_v_dealer_totals);
+          PyTuple_SET_ITEM(__pyx_t_8, 2+__pyx_t_7, __pyx_v_dealer_totals);
+          __Pyx_INCREF(__pyx_v_card_distribution);
+          __Pyx_GIVEREF(__pyx_v_card_distribution);
+          PyTuple_SET_ITEM(__pyx_t_8, 3+__pyx_t_7, __pyx_v_card_distribution);
+          __pyx_t_3 = 0;
+          __pyx_t_4 = 0;
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        if (!(likely(PyList_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_t_2)->tp_name), 0))) __PYX_ERR(0, 181, __pyx_L1_error)
+        __pyx_r = ((PyObject*)__pyx_t_2);
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":196
+ *         """
+ *         cdef int dealer_total
+ *         return [self.should_split(player_total,             # <<<<<<<<<<<<<<
+ *                                   player_aces,
+ *                                   dealer_total,
+ */
+  __Pyx_XDECREF(__pyx_r);
+  { /* enter inner scope */
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+
+    /* "bbwrl/bot/strategists/optimal_strategist.pyx":200
+ *                                   dealer_total,
+ *                                   card_distribution)
+ *                 for dealer_total in dealer_totals]             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef void free_mem(self):
+ */
+    if (likely(PyList_CheckExact(__pyx_v_dealer_totals)) || PyTuple_CheckExact(__pyx_v_dealer_totals)) {
+      __pyx_t_2 = __pyx_v_dealer_totals; __Pyx_INCREF(__pyx_t_2); __pyx_t_9 = 0;
+      __pyx_t_10 = NULL;
+    } else {
+      __pyx_t_9 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_dealer_totals); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 200, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_10 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 200, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_10)) {
+        if (likely(PyList_CheckExact(__pyx_t_2))) {
+          if (__pyx_t_9 >= PyList_GET_SIZE(__pyx_t_2)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_5 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_9); __Pyx_INCREF(__pyx_t_5); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 200, __pyx_L1_error)
+          #else
+          __pyx_t_5 = PySequence_ITEM(__pyx_t_2, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 200, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          #endif
+        } else {
+          if (__pyx_t_9 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_9); __Pyx_INCREF(__pyx_t_5); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 200, __pyx_L1_error)
+          #else
+          __pyx_t_5 = PySequence_ITEM(__pyx_t_2, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 200, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          #endif
+        }
+      } else {
+        __pyx_t_5 = __pyx_t_10(__pyx_t_2);
+        if (unlikely(!__pyx_t_5)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 200, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_5);
+      }
+      __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_5); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 200, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_8genexpr1__pyx_v_dealer_total = __pyx_t_7;
+
+      /* "bbwrl/bot/strategists/optimal_strategist.pyx":196
+ *         """
+ *         cdef int dealer_total
+ *         return [self.should_split(player_total,             # <<<<<<<<<<<<<<
+ *                                   player_aces,
+ *                                   dealer_total,
+ */
+      __pyx_t_5 = __Pyx_PyBool_FromLong(((struct __pyx_vtabstruct_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *)__pyx_v_self->__pyx_vtab)->should_split(__pyx_v_self, __pyx_v_player_total, __pyx_v_player_aces, __pyx_8genexpr1__pyx_v_dealer_total, __pyx_v_card_distribution, 0)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 196, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_5))) __PYX_ERR(0, 196, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+      /* "bbwrl/bot/strategists/optimal_strategist.pyx":200
+ *                                   dealer_total,
+ *                                   card_distribution)
+ *                 for dealer_total in dealer_totals]             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef void free_mem(self):
+ */
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  } /* exit inner scope */
+  __pyx_r = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":181
+ *                 for dealer_total in dealer_totals]
+ * 
+ *     cpdef list split_moves(self,             # <<<<<<<<<<<<<<
+ *                            int player_total,
+ *                            int player_aces,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("bbwrl.bot.strategists.optimal_strategist.OptimalStrategist.split_moves", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_11split_moves(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_10split_moves[] = " Returns whether it is optimal to split against each dealer total.\n\n        Args:\n            player_total: The hand total of the player.\n            player_aces: The number of soft aces available to the player.\n            dealer_totals: The hand totals of the dealer.\n            card_distribution: The distribution of the cards remaining in the\n                shoe.\n        ";
+static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_11split_moves(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_player_total;
+  int __pyx_v_player_aces;
+  PyObject *__pyx_v_dealer_totals = 0;
+  PyObject *__pyx_v_card_distribution = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("split_moves (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_player_total,&__pyx_n_s_player_aces,&__pyx_n_s_dealer_totals,&__pyx_n_s_card_distribution,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_player_total)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_player_aces)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("split_moves", 1, 4, 4, 1); __PYX_ERR(0, 181, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_dealer_totals)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("split_moves", 1, 4, 4, 2); __PYX_ERR(0, 181, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_card_distribution)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("split_moves", 1, 4, 4, 3); __PYX_ERR(0, 181, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "split_moves") < 0)) __PYX_ERR(0, 181, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+    }
+    __pyx_v_player_total = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_player_total == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 182, __pyx_L3_error)
+    __pyx_v_player_aces = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_player_aces == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 183, __pyx_L3_error)
+    __pyx_v_dealer_totals = values[2];
+    __pyx_v_card_distribution = values[3];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("split_moves", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 181, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bbwrl.bot.strategists.optimal_strategist.OptimalStrategist.split_moves", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_10split_moves(((struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *)__pyx_v_self), __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_totals, __pyx_v_card_distribution);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_10split_moves(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_v_player_total, int __pyx_v_player_aces, PyObject *__pyx_v_dealer_totals, PyObject *__pyx_v_card_distribution) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("split_moves", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_split_moves(__pyx_v_self, __pyx_v_player_total, __pyx_v_player_aces, __pyx_v_dealer_totals, __pyx_v_card_distribution, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 181, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bbwrl.bot.strategists.optimal_strategist.OptimalStrategist.split_moves", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bbwrl/bot/strategists/optimal_strategist.pyx":202
+ *                 for dealer_total in dealer_totals]
  * 
  *     cpdef void free_mem(self):             # <<<<<<<<<<<<<<
+ *         """ Frees the memory used by the Reward Distribution object. """
+ *         self.reward_distribution.free_mem()
+ */
+
+static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_13free_mem(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static void __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_free_mem(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, int __pyx_skip_dispatch) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("free_mem", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_free_mem); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 202, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_13free_mem)) {
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 202, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":204
+ *     cpdef void free_mem(self):
+ *         """ Frees the memory used by the Reward Distribution object. """
+ *         self.reward_distribution.free_mem()             # <<<<<<<<<<<<<<
+ */
+  ((struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution *)__pyx_v_self->reward_distribution->__pyx_vtab)->free_mem(__pyx_v_self->reward_distribution);
+
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":202
+ *                 for dealer_total in dealer_totals]
+ * 
+ *     cpdef void free_mem(self):             # <<<<<<<<<<<<<<
+ *         """ Frees the memory used by the Reward Distribution object. """
  *         self.reward_distribution.free_mem()
  */
 
@@ -2643,19 +3716,20 @@ static void __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStra
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_9free_mem(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_9free_mem(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_13free_mem(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_12free_mem[] = " Frees the memory used by the Reward Distribution object. ";
+static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_13free_mem(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("free_mem (wrapper)", 0);
-  __pyx_r = __pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_8free_mem(((struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *)__pyx_v_self));
+  __pyx_r = __pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_12free_mem(((struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_8free_mem(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self) {
+static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_12free_mem(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -2664,7 +3738,7 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("free_mem", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_void_to_None(__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_free_mem(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_void_to_None(__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_free_mem(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 202, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2688,19 +3762,19 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_11__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_11__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_15__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_15__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_10__reduce_cython__(((struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *)__pyx_v_self));
+  __pyx_r = __pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_14__reduce_cython__(((struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_10__reduce_cython__(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self) {
+static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_14__reduce_cython__(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self) {
   PyObject *__pyx_v_state = 0;
   PyObject *__pyx_v__dict = 0;
   int __pyx_v_use_setstate;
@@ -2923,19 +3997,19 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_13__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_13__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_17__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_17__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_12__setstate_cython__(((struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+  __pyx_r = __pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_16__setstate_cython__(((struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_12__setstate_cython__(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_16__setstate_cython__(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -2949,7 +4023,7 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist_17Optim
  * def __setstate_cython__(self, __pyx_state):
  *     __pyx_unpickle_OptimalStrategist__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
  */
-  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
   __pyx_t_1 = __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist___pyx_unpickle_OptimalStrategist__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -3061,12 +4135,12 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist___pyx_u
   PyObject *__pyx_v___pyx_result = 0;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
+  PyObject *__pyx_t_6 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -3075,114 +4149,118 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist___pyx_u
   /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum != 0x8ee055d:             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0x8ee055d, 0x7ab7f32, 0xd3af553):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (%s vs 0x8ee055d = (reward_distribution))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ee055d, 0x7ab7f32, 0xd3af553) = (reward_distribution))" % __pyx_checksum)
  */
-  __pyx_t_1 = ((__pyx_v___pyx_checksum != 0x8ee055d) != 0);
-  if (__pyx_t_1) {
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple_, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
 
     /* "(tree fragment)":5
  *     cdef object __pyx_result
- *     if __pyx_checksum != 0x8ee055d:
+ *     if __pyx_checksum not in (0x8ee055d, 0x7ab7f32, 0xd3af553):
  *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
- *         raise __pyx_PickleError("Incompatible checksums (%s vs 0x8ee055d = (reward_distribution))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ee055d, 0x7ab7f32, 0xd3af553) = (reward_distribution))" % __pyx_checksum)
  *     __pyx_result = OptimalStrategist.__new__(__pyx_type)
  */
-    __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_INCREF(__pyx_n_s_PickleError);
     __Pyx_GIVEREF(__pyx_n_s_PickleError);
-    PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_PickleError);
-    __pyx_t_3 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_2, -1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(__pyx_t_2);
-    __pyx_v___pyx_PickleError = __pyx_t_2;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":6
- *     if __pyx_checksum != 0x8ee055d:
+ *     if __pyx_checksum not in (0x8ee055d, 0x7ab7f32, 0xd3af553):
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (%s vs 0x8ee055d = (reward_distribution))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ee055d, 0x7ab7f32, 0xd3af553) = (reward_distribution))" % __pyx_checksum)             # <<<<<<<<<<<<<<
  *     __pyx_result = OptimalStrategist.__new__(__pyx_type)
  *     if __pyx_state is not None:
  */
-    __pyx_t_2 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 6, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_s_vs_0x8e, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_INCREF(__pyx_v___pyx_PickleError);
-    __pyx_t_2 = __pyx_v___pyx_PickleError; __pyx_t_5 = NULL;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
-      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
-      if (likely(__pyx_t_5)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-        __Pyx_INCREF(__pyx_t_5);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_2, function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
       }
     }
-    __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_4);
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 6, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __PYX_ERR(1, 6, __pyx_L1_error)
 
     /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum != 0x8ee055d:             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0x8ee055d, 0x7ab7f32, 0xd3af553):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (%s vs 0x8ee055d = (reward_distribution))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ee055d, 0x7ab7f32, 0xd3af553) = (reward_distribution))" % __pyx_checksum)
  */
   }
 
   /* "(tree fragment)":7
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (%s vs 0x8ee055d = (reward_distribution))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ee055d, 0x7ab7f32, 0xd3af553) = (reward_distribution))" % __pyx_checksum)
  *     __pyx_result = OptimalStrategist.__new__(__pyx_type)             # <<<<<<<<<<<<<<
  *     if __pyx_state is not None:
  *         __pyx_unpickle_OptimalStrategist__set_state(<OptimalStrategist> __pyx_result, __pyx_state)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist), __pyx_n_s_new); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_4);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
       __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
     }
   }
-  __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_4, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v___pyx_type);
-  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 7, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v___pyx_result = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
 
   /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (%s vs 0x8ee055d = (reward_distribution))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ee055d, 0x7ab7f32, 0xd3af553) = (reward_distribution))" % __pyx_checksum)
  *     __pyx_result = OptimalStrategist.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
  *         __pyx_unpickle_OptimalStrategist__set_state(<OptimalStrategist> __pyx_result, __pyx_state)
  *     return __pyx_result
  */
-  __pyx_t_1 = (__pyx_v___pyx_state != Py_None);
-  __pyx_t_6 = (__pyx_t_1 != 0);
-  if (__pyx_t_6) {
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
 
     /* "(tree fragment)":9
  *     __pyx_result = OptimalStrategist.__new__(__pyx_type)
@@ -3191,13 +4269,13 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist___pyx_u
  *     return __pyx_result
  * cdef __pyx_unpickle_OptimalStrategist__set_state(OptimalStrategist __pyx_result, tuple __pyx_state):
  */
-    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
-    __pyx_t_3 = __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist___pyx_unpickle_OptimalStrategist__set_state(((struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 9, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist___pyx_unpickle_OptimalStrategist__set_state(((struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (%s vs 0x8ee055d = (reward_distribution))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ee055d, 0x7ab7f32, 0xd3af553) = (reward_distribution))" % __pyx_checksum)
  *     __pyx_result = OptimalStrategist.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
  *         __pyx_unpickle_OptimalStrategist__set_state(<OptimalStrategist> __pyx_result, __pyx_state)
@@ -3225,10 +4303,10 @@ static PyObject *__pyx_pf_5bbwrl_3bot_11strategists_18optimal_strategist___pyx_u
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_AddTraceback("bbwrl.bot.strategists.optimal_strategist.__pyx_unpickle_OptimalStrategist", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -3257,7 +4335,6 @@ static PyObject *__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist___pyx_un
   int __pyx_t_5;
   PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -3274,9 +4351,9 @@ static PyObject *__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist___pyx_un
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
     __PYX_ERR(1, 12, __pyx_L1_error)
   }
-  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5bbwrl_3bot_19reward_distribution_RewardDistribution))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  if (!(likely(((PyTuple_GET_ITEM(__pyx_v___pyx_state, 0)) == Py_None) || likely(__Pyx_TypeTest(PyTuple_GET_ITEM(__pyx_v___pyx_state, 0), __pyx_ptype_5bbwrl_3bot_19reward_distribution_RewardDistribution))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
+  __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF(__pyx_v___pyx_result->reward_distribution);
   __Pyx_DECREF(((PyObject *)__pyx_v___pyx_result->reward_distribution));
@@ -3320,21 +4397,18 @@ static PyObject *__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist___pyx_un
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
       __PYX_ERR(1, 14, __pyx_L1_error)
     }
-    __pyx_t_6 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 14, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_8 = NULL;
+    __pyx_t_6 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
-      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
-      if (likely(__pyx_t_8)) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_7);
+      if (likely(__pyx_t_6)) {
         PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
-        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_6);
         __Pyx_INCREF(function);
         __Pyx_DECREF_SET(__pyx_t_7, function);
       }
     }
-    __pyx_t_1 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_8, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6);
-    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_6, PyTuple_GET_ITEM(__pyx_v___pyx_state, 1)) : __Pyx_PyObject_CallOneArg(__pyx_t_7, PyTuple_GET_ITEM(__pyx_v___pyx_state, 1));
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
     if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
@@ -3363,7 +4437,6 @@ static PyObject *__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist___pyx_un
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
   __Pyx_AddTraceback("bbwrl.bot.strategists.optimal_strategist.__pyx_unpickle_OptimalStrategist__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
@@ -3391,7 +4464,7 @@ static PyObject *__pyx_tp_new_5bbwrl_3bot_11strategists_18optimal_strategist_Opt
 static void __pyx_tp_dealloc_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist(PyObject *o) {
   struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *p = (struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *)o;
   #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
   }
   #endif
@@ -3419,12 +4492,14 @@ static int __pyx_tp_clear_5bbwrl_3bot_11strategists_18optimal_strategist_Optimal
 }
 
 static PyMethodDef __pyx_methods_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist[] = {
-  {"should_split", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_3should_split, METH_VARARGS|METH_KEYWORDS, 0},
-  {"should_double", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_5should_double, METH_VARARGS|METH_KEYWORDS, 0},
-  {"should_hit", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_7should_hit, METH_VARARGS|METH_KEYWORDS, 0},
-  {"free_mem", (PyCFunction)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_9free_mem, METH_NOARGS, 0},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_11__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_13__setstate_cython__, METH_O, 0},
+  {"should_split", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_3should_split, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_2should_split},
+  {"should_double", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_5should_double, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_4should_double},
+  {"should_hit", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_7should_hit, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_6should_hit},
+  {"best_moves", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_9best_moves, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_8best_moves},
+  {"split_moves", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_11split_moves, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_10split_moves},
+  {"free_mem", (PyCFunction)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_13free_mem, METH_NOARGS, __pyx_doc_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_12free_mem},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_15__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_17__setstate_cython__, METH_O, 0},
   {0, 0, 0, 0}
 };
 
@@ -3459,7 +4534,7 @@ static PyTypeObject __pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_Op
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
+  " Implementation of the optimal strategist.\n\n    The strategist decides on the optimal action by comparing the reward\n    distribution corresponding to the available actions.\n\n    Attributes:\n        reward_distribution: An object capable of computing distributions\n            corresponding to different actions.\n    ", /*tp_doc*/
   __pyx_tp_traverse_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist, /*tp_traverse*/
   __pyx_tp_clear_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist, /*tp_clear*/
   0, /*tp_richcompare*/
@@ -3489,12 +4564,15 @@ static PyTypeObject __pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_Op
   #if PY_VERSION_HEX >= 0x030400a1
   0, /*tp_finalize*/
   #endif
-  #if PY_VERSION_HEX >= 0x030800b1
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
   0, /*tp_vectorcall*/
   #endif
   #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
   0, /*tp_print*/
   #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
 };
 
 static PyMethodDef __pyx_methods[] = {
@@ -3515,7 +4593,7 @@ static PyModuleDef_Slot __pyx_moduledef_slots[] = {
 static struct PyModuleDef __pyx_moduledef = {
     PyModuleDef_HEAD_INIT,
     "optimal_strategist",
-    0, /* m_doc */
+    __pyx_k_Implementation_of_the_optimal_s, /* m_doc */
   #if CYTHON_PEP489_MULTI_PHASE_INIT
     0, /* m_size */
   #else
@@ -3543,16 +4621,22 @@ static struct PyModuleDef __pyx_moduledef = {
 #endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_s_Incompatible_checksums_s_vs_0x8e, __pyx_k_Incompatible_checksums_s_vs_0x8e, sizeof(__pyx_k_Incompatible_checksums_s_vs_0x8e), 0, 0, 1, 0},
+  {&__pyx_n_s_DOUBLE, __pyx_k_DOUBLE, sizeof(__pyx_k_DOUBLE), 0, 0, 1, 1},
+  {&__pyx_n_s_HIT, __pyx_k_HIT, sizeof(__pyx_k_HIT), 0, 0, 1, 1},
+  {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
   {&__pyx_n_s_OptimalStrategist, __pyx_k_OptimalStrategist, sizeof(__pyx_k_OptimalStrategist), 0, 0, 1, 1},
   {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
   {&__pyx_n_s_RewardDistribution, __pyx_k_RewardDistribution, sizeof(__pyx_k_RewardDistribution), 0, 0, 1, 1},
+  {&__pyx_n_s_STAND, __pyx_k_STAND, sizeof(__pyx_k_STAND), 0, 0, 1, 1},
   {&__pyx_n_s_bbwrl_bot_reward_distribution, __pyx_k_bbwrl_bot_reward_distribution, sizeof(__pyx_k_bbwrl_bot_reward_distribution), 0, 0, 1, 1},
   {&__pyx_n_s_bbwrl_bot_strategists_optimal_st, __pyx_k_bbwrl_bot_strategists_optimal_st, sizeof(__pyx_k_bbwrl_bot_strategists_optimal_st), 0, 0, 1, 1},
+  {&__pyx_n_s_bbwrl_bot_strategists_strategist, __pyx_k_bbwrl_bot_strategists_strategist, sizeof(__pyx_k_bbwrl_bot_strategists_strategist), 0, 0, 1, 1},
   {&__pyx_n_s_bbwrl_environments, __pyx_k_bbwrl_environments, sizeof(__pyx_k_bbwrl_environments), 0, 0, 1, 1},
+  {&__pyx_n_s_best_moves, __pyx_k_best_moves, sizeof(__pyx_k_best_moves), 0, 0, 1, 1},
   {&__pyx_n_s_card_distribution, __pyx_k_card_distribution, sizeof(__pyx_k_card_distribution), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
   {&__pyx_n_s_dealer_total, __pyx_k_dealer_total, sizeof(__pyx_k_dealer_total), 0, 0, 1, 1},
+  {&__pyx_n_s_dealer_totals, __pyx_k_dealer_totals, sizeof(__pyx_k_dealer_totals), 0, 0, 1, 1},
   {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
   {&__pyx_n_s_free_mem, __pyx_k_free_mem, sizeof(__pyx_k_free_mem), 0, 0, 1, 1},
   {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
@@ -3579,6 +4663,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_should_double, __pyx_k_should_double, sizeof(__pyx_k_should_double), 0, 0, 1, 1},
   {&__pyx_n_s_should_hit, __pyx_k_should_hit, sizeof(__pyx_k_should_hit), 0, 0, 1, 1},
   {&__pyx_n_s_should_split, __pyx_k_should_split, sizeof(__pyx_k_should_split), 0, 0, 1, 1},
+  {&__pyx_n_s_split_moves, __pyx_k_split_moves, sizeof(__pyx_k_split_moves), 0, 0, 1, 1},
   {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
@@ -3593,15 +4678,26 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "(tree fragment)":1
- * def __pyx_unpickle_OptimalStrategist(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+  /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x8ee055d, 0x7ab7f32, 0xd3af553):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ee055d, 0x7ab7f32, 0xd3af553) = (reward_distribution))" % __pyx_checksum)
  */
-  __pyx_tuple_ = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple_)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(3, __pyx_int_149816669, __pyx_int_128679730, __pyx_int_221967699); if (unlikely(!__pyx_tuple_)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
-  __pyx_codeobj__2 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple_, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_OptimalStrategist, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__2)) __PYX_ERR(1, 1, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_OptimalStrategist(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_tuple__2 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+  __pyx_codeobj__3 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__2, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_OptimalStrategist, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__3)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -3610,8 +4706,10 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
 }
 
 static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_128679730 = PyInt_FromLong(128679730L); if (unlikely(!__pyx_int_128679730)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_149816669 = PyInt_FromLong(149816669L); if (unlikely(!__pyx_int_149816669)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_221967699 = PyInt_FromLong(221967699L); if (unlikely(!__pyx_int_221967699)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -3660,17 +4758,20 @@ static int __Pyx_modinit_type_init_code(void) {
   __pyx_vtable_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist.should_split = (bool (*)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int, int, int, PyObject *, int __pyx_skip_dispatch))__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_should_split;
   __pyx_vtable_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist.should_double = (bool (*)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int, int, int, PyObject *, int __pyx_skip_dispatch))__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_should_double;
   __pyx_vtable_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist.should_hit = (bool (*)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int, int, int, PyObject *, int __pyx_skip_dispatch))__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_should_hit;
+  __pyx_vtable_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist._best_move = (int (*)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int, int, int))__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist__best_move;
+  __pyx_vtable_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist.best_moves = (PyObject *(*)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int, int, PyObject *, PyObject *, int __pyx_skip_dispatch))__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_best_moves;
+  __pyx_vtable_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist.split_moves = (PyObject *(*)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int, int, PyObject *, PyObject *, int __pyx_skip_dispatch))__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_split_moves;
   __pyx_vtable_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist.free_mem = (void (*)(struct __pyx_obj_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist *, int __pyx_skip_dispatch))__pyx_f_5bbwrl_3bot_11strategists_18optimal_strategist_17OptimalStrategist_free_mem;
-  if (PyType_Ready(&__pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist) < 0) __PYX_ERR(0, 33, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist.tp_dictoffset && __pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (__Pyx_SetVtable(__pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist.tp_dict, __pyx_vtabptr_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_OptimalStrategist, (PyObject *)&__pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist.tp_dict, __pyx_vtabptr_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist) < 0) __PYX_ERR(0, 33, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_OptimalStrategist, (PyObject *)&__pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist) < 0) __PYX_ERR(0, 33, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist) < 0) __PYX_ERR(0, 33, __pyx_L1_error)
   __pyx_ptype_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist = &__pyx_type_5bbwrl_3bot_11strategists_18optimal_strategist_OptimalStrategist;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -3689,8 +4790,7 @@ static int __Pyx_modinit_type_import_code(void) {
   /*--- Type import code ---*/
   __pyx_t_1 = PyImport_ImportModule("bbwrl.bot.reward_distribution"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 49, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_ptype_5bbwrl_3bot_19reward_distribution_RewardDistribution = __Pyx_ImportType(__pyx_t_1, "bbwrl.bot.reward_distribution", "RewardDistribution", sizeof(struct __pyx_obj_5bbwrl_3bot_19reward_distribution_RewardDistribution), __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_5bbwrl_3bot_19reward_distribution_RewardDistribution) __PYX_ERR(2, 49, __pyx_L1_error)
+  __pyx_ptype_5bbwrl_3bot_19reward_distribution_RewardDistribution = __Pyx_ImportType_0_29_37(__pyx_t_1, "bbwrl.bot.reward_distribution", "RewardDistribution", sizeof(struct __pyx_obj_5bbwrl_3bot_19reward_distribution_RewardDistribution), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_5bbwrl_3bot_19reward_distribution_RewardDistribution),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5bbwrl_3bot_19reward_distribution_RewardDistribution) __PYX_ERR(2, 49, __pyx_L1_error)
   __pyx_vtabptr_5bbwrl_3bot_19reward_distribution_RewardDistribution = (struct __pyx_vtabstruct_5bbwrl_3bot_19reward_distribution_RewardDistribution*)__Pyx_GetVtable(__pyx_ptype_5bbwrl_3bot_19reward_distribution_RewardDistribution->tp_dict); if (unlikely(!__pyx_vtabptr_5bbwrl_3bot_19reward_distribution_RewardDistribution)) __PYX_ERR(2, 49, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
@@ -3863,18 +4963,16 @@ if (!__Pyx_RefNanny) {
   #endif
   /*--- Library function declarations ---*/
   /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
   PyEval_InitThreads();
   #endif
-  #endif
   /*--- Module creation code ---*/
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   __pyx_m = __pyx_pyinit_module;
   Py_INCREF(__pyx_m);
   #else
   #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4("optimal_strategist", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  __pyx_m = Py_InitModule4("optimal_strategist", __pyx_methods, __pyx_k_Implementation_of_the_optimal_s, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
   #else
   __pyx_m = PyModule_Create(&__pyx_moduledef);
   #endif
@@ -3886,7 +4984,7 @@ if (!__Pyx_RefNanny) {
   Py_INCREF(__pyx_b);
   __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
   Py_INCREF(__pyx_cython_runtime);
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Initialize various global constants etc. ---*/
   if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
@@ -3920,63 +5018,98 @@ if (!__Pyx_RefNanny) {
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":26
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":27
  * # distutils: language=c++
  * from bbwrl.bot.reward_distribution cimport RewardDistribution
  * from bbwrl.bot.reward_distribution import RewardDistribution             # <<<<<<<<<<<<<<
  * from libcpp cimport bool
  * from bbwrl.environments import rule_variation
  */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 27, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_s_RewardDistribution);
   __Pyx_GIVEREF(__pyx_n_s_RewardDistribution);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_RewardDistribution);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_bbwrl_bot_reward_distribution, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_bbwrl_bot_reward_distribution, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 27, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "bbwrl/bot/strategists/optimal_strategist.pyx":28
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":29
  * from bbwrl.bot.reward_distribution import RewardDistribution
  * from libcpp cimport bool
  * from bbwrl.environments import rule_variation             # <<<<<<<<<<<<<<
- * 
+ * from bbwrl.bot.strategists.strategist import HIT, STAND, DOUBLE
  * 
  */
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 29, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_n_s_rule_variation);
   __Pyx_GIVEREF(__pyx_n_s_rule_variation);
   PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_rule_variation);
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_bbwrl_environments, __pyx_t_2, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_bbwrl_environments, __pyx_t_2, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 29, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_rule_variation); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_rule_variation); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 29, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_rule_variation, __pyx_t_2) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_rule_variation, __pyx_t_2) < 0) __PYX_ERR(0, 29, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
+  /* "bbwrl/bot/strategists/optimal_strategist.pyx":30
+ * from libcpp cimport bool
+ * from bbwrl.environments import rule_variation
+ * from bbwrl.bot.strategists.strategist import HIT, STAND, DOUBLE             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = PyList_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_HIT);
+  __Pyx_GIVEREF(__pyx_n_s_HIT);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_HIT);
+  __Pyx_INCREF(__pyx_n_s_STAND);
+  __Pyx_GIVEREF(__pyx_n_s_STAND);
+  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_STAND);
+  __Pyx_INCREF(__pyx_n_s_DOUBLE);
+  __Pyx_GIVEREF(__pyx_n_s_DOUBLE);
+  PyList_SET_ITEM(__pyx_t_1, 2, __pyx_n_s_DOUBLE);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_bbwrl_bot_strategists_strategist, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_HIT); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_HIT, __pyx_t_1) < 0) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_STAND); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_STAND, __pyx_t_1) < 0) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_DOUBLE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_DOUBLE, __pyx_t_1) < 0) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
   /* "(tree fragment)":1
  * def __pyx_unpickle_OptimalStrategist(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5bbwrl_3bot_11strategists_18optimal_strategist_1__pyx_unpickle_OptimalStrategist, NULL, __pyx_n_s_bbwrl_bot_strategists_optimal_st); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_OptimalStrategist, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5bbwrl_3bot_11strategists_18optimal_strategist_1__pyx_unpickle_OptimalStrategist, NULL, __pyx_n_s_bbwrl_bot_strategists_optimal_st); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_OptimalStrategist, __pyx_t_2) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "bbwrl/bot/strategists/optimal_strategist.pyx":1
  * # MIT License             # <<<<<<<<<<<<<<
  * #
  * # Copyright (c) 2021 Patrik Gergely
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /*--- Wrapped vars code ---*/
 
@@ -4309,7 +5442,7 @@ done:
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
     PyObject *result;
-    ternaryfunc call = func->ob_type->tp_call;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
     if (unlikely(!call))
         return PyObject_Call(func, arg, kw);
     if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
@@ -4460,9 +5593,7 @@ static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
     PyGILState_STATE state;
     if (nogil)
         state = PyGILState_Ensure();
-#ifdef _MSC_VER
-    else state = (PyGILState_STATE)-1;
-#endif
+    else state = (PyGILState_STATE)0;
 #endif
     __Pyx_PyThreadState_assign
     __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
@@ -4491,6 +5622,55 @@ static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
 #endif
 }
 
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
 /* PyObjectCallNoArg */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
@@ -4499,7 +5679,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
         return __Pyx_PyFunction_FastCall(func, NULL, 0);
     }
 #endif
-#ifdef __Pyx_CyFunction_USED
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
     if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
 #else
     if (likely(PyCFunction_Check(func)))
@@ -4566,55 +5746,6 @@ static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject
     return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
 }
 
-/* GetBuiltinName */
-static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
-    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
-    if (unlikely(!result)) {
-        PyErr_Format(PyExc_NameError,
-#if PY_MAJOR_VERSION >= 3
-            "name '%U' is not defined", name);
-#else
-            "name '%.200s' is not defined", PyString_AS_STRING(name));
-#endif
-    }
-    return result;
-}
-
-/* GetModuleGlobalName */
-#if CYTHON_USE_DICT_VERSIONS
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
-#else
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
-#endif
-{
-    PyObject *result;
-#if !CYTHON_AVOID_BORROWED_REFS
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
-    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    } else if (unlikely(PyErr_Occurred())) {
-        return NULL;
-    }
-#else
-    result = PyDict_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
-#endif
-#else
-    result = PyObject_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
-    PyErr_Clear();
-#endif
-    return __Pyx_GetBuiltinName(name);
-}
-
 /* Import */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
@@ -4860,13 +5991,7 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
     }
     PyErr_SetObject(type, value);
     if (tb) {
-#if CYTHON_COMPILING_IN_PYPY
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#else
+#if CYTHON_FAST_THREAD_STATE
         PyThreadState *tstate = __Pyx_PyThreadState_Current;
         PyObject* tmp_tb = tstate->curexc_traceback;
         if (tb != tmp_tb) {
@@ -4874,6 +5999,12 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
             tstate->curexc_traceback = tb;
             Py_XDECREF(tmp_tb);
         }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
 #endif
     }
 bad:
@@ -4882,93 +6013,6 @@ bad:
 }
 #endif
 
-/* GetItemInt */
-static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
-    PyObject *r;
-    if (!j) return NULL;
-    r = PyObject_GetItem(o, j);
-    Py_DECREF(j);
-    return r;
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              CYTHON_NCP_UNUSED int wraparound,
-                                                              CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    Py_ssize_t wrapped_i = i;
-    if (wraparound & unlikely(i < 0)) {
-        wrapped_i += PyList_GET_SIZE(o);
-    }
-    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
-        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
-        Py_INCREF(r);
-        return r;
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
-#endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              CYTHON_NCP_UNUSED int wraparound,
-                                                              CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    Py_ssize_t wrapped_i = i;
-    if (wraparound & unlikely(i < 0)) {
-        wrapped_i += PyTuple_GET_SIZE(o);
-    }
-    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
-        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
-        Py_INCREF(r);
-        return r;
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
-#endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
-                                                     CYTHON_NCP_UNUSED int wraparound,
-                                                     CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
-    if (is_list || PyList_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
-        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
-            PyObject *r = PyList_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    else if (PyTuple_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
-        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
-            PyObject *r = PyTuple_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    } else {
-        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
-        if (likely(m && m->sq_item)) {
-            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
-                Py_ssize_t l = m->sq_length(o);
-                if (likely(l >= 0)) {
-                    i += l;
-                } else {
-                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
-                        return NULL;
-                    PyErr_Clear();
-                }
-            }
-            return m->sq_item(o, i);
-        }
-    }
-#else
-    if (is_list || PySequence_Check(o)) {
-        return PySequence_GetItem(o, i);
-    }
-#endif
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-}
-
 /* ExtTypeTest */
 static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
     if (unlikely(!type)) {
@@ -5110,17 +6154,35 @@ static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
 static int __Pyx_setup_reduce(PyObject* type_obj) {
     int ret = 0;
     PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
     PyObject *object_reduce_ex = NULL;
     PyObject *reduce = NULL;
     PyObject *reduce_ex = NULL;
     PyObject *reduce_cython = NULL;
     PyObject *setstate = NULL;
     PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
 #if CYTHON_USE_PYTYPE_LOOKUP
-    if (_PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate)) goto __PYX_GOOD;
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
 #else
-    if (PyObject_HasAttr(type_obj, __pyx_n_s_getstate)) goto __PYX_GOOD;
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
 #endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
 #if CYTHON_USE_PYTYPE_LOOKUP
     object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
 #else
@@ -5165,6 +6227,8 @@ __PYX_GOOD:
 #if !CYTHON_USE_PYTYPE_LOOKUP
     Py_XDECREF(object_reduce);
     Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
 #endif
     Py_XDECREF(reduce);
     Py_XDECREF(reduce_ex);
@@ -5175,16 +6239,18 @@ __PYX_GOOD:
 }
 
 /* TypeImport */
-#ifndef __PYX_HAVE_RT_ImportType
-#define __PYX_HAVE_RT_ImportType
-static PyTypeObject *__Pyx_ImportType(PyObject *module, const char *module_name, const char *class_name,
-    size_t size, enum __Pyx_ImportType_CheckSize check_size)
+#ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
 {
     PyObject *result = 0;
     char warning[200];
     Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
 #ifdef Py_LIMITED_API
     PyObject *py_basicsize;
+    PyObject *py_itemsize;
 #endif
     result = PyObject_GetAttrString(module, class_name);
     if (!result)
@@ -5197,6 +6263,7 @@ static PyTypeObject *__Pyx_ImportType(PyObject *module, const char *module_name,
     }
 #ifndef Py_LIMITED_API
     basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
 #else
     py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
     if (!py_basicsize)
@@ -5206,22 +6273,37 @@ static PyTypeObject *__Pyx_ImportType(PyObject *module, const char *module_name,
     py_basicsize = 0;
     if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
         goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
 #endif
-    if ((size_t)basicsize < size) {
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
         PyErr_Format(PyExc_ValueError,
             "%.200s.%.200s size changed, may indicate binary incompatibility. "
             "Expected %zd from C header, got %zd from PyObject",
             module_name, class_name, size, basicsize);
         goto bad;
     }
-    if (check_size == __Pyx_ImportType_CheckSize_Error && (size_t)basicsize != size) {
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
         PyErr_Format(PyExc_ValueError,
             "%.200s.%.200s size changed, may indicate binary incompatibility. "
             "Expected %zd from C header, got %zd from PyObject",
             module_name, class_name, size, basicsize);
         goto bad;
     }
-    else if (check_size == __Pyx_ImportType_CheckSize_Warn && (size_t)basicsize > size) {
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
         PyOS_snprintf(warning, sizeof(warning),
             "%s.%s size changed, may indicate binary incompatibility. "
             "Expected %zd from C header, got %zd from PyObject",
@@ -5257,7 +6339,7 @@ bad:
 
 /* CLineInTraceback */
 #ifndef CYTHON_CLINE_IN_TRACEBACK
-static int __Pyx_CLineForTraceback(CYTHON_NCP_UNUSED PyThreadState *tstate, int c_line) {
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
 #if CYTHON_COMPILING_IN_CPYTHON
@@ -5287,7 +6369,7 @@ static int __Pyx_CLineForTraceback(CYTHON_NCP_UNUSED PyThreadState *tstate, int
     }
     if (!use_cline) {
         c_line = 0;
-        PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
     }
     else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
         c_line = 0;
@@ -5381,33 +6463,40 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
             const char *funcname, int c_line,
             int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
     #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
     py_srcfile = PyString_FromString(filename);
-    #else
-    py_srcfile = PyUnicode_FromString(filename);
-    #endif
     if (!py_srcfile) goto bad;
+    #endif
     if (c_line) {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
         #else
         py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
         #endif
     }
     else {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
+        if (!py_funcname) goto bad;
         #endif
     }
-    if (!py_funcname) goto bad;
+    #if PY_MAJOR_VERSION < 3
     py_code = __Pyx_PyCode_New(
         0,
         0,
@@ -5426,11 +6515,16 @@ static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
         __pyx_empty_bytes  /*PyObject *lnotab*/
     );
     Py_DECREF(py_srcfile);
-    Py_DECREF(py_funcname);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
     return py_code;
 bad:
-    Py_XDECREF(py_srcfile);
     Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
     return NULL;
 }
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
@@ -5438,14 +6532,24 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
     PyCodeObject *py_code = 0;
     PyFrameObject *py_frame = 0;
     PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
     if (c_line) {
         c_line = __Pyx_CLineForTraceback(tstate, c_line);
     }
     py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
     if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
         py_code = __Pyx_CreateCodeObjectForTraceback(
             funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
         __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
     py_frame = PyFrame_New(
@@ -5544,7 +6648,7 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -5740,7 +6844,7 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -6054,11 +7158,33 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 
 /* CheckBinaryVersion */
 static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
         char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
         PyOS_snprintf(message, sizeof(message),
                       "compiletime version %s of module '%.100s' "
                       "does not match runtime version %s",
@@ -6316,6 +7442,23 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   Py_DECREF(x);
   return ival;
 }
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
 static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
   return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
 }
@@ -27,6 +27,7 @@ from bbwrl.bot.reward_distribution cimport RewardDistribution
 from bbwrl.bot.reward_distribution import RewardDistribution
 from libcpp cimport bool
 from bbwrl.environments import rule_variation
+from bbwrl.bot.strategists.strategist import HIT, STAND, DOUBLE
 
 
 cdef class OptimalStrategist:
@@ -126,6 +127,78 @@ cdef class OptimalStrategist:
         return (rd.distribution_value(distr_hit) >
                 rd.distribution_value(distr_stand))
 
+    cdef int _best_move(self,
+                        int player_total,
+                        int player_aces,
+                        int dealer_total):
+        """ Returns the optimal move for the current card distribution.
+
+        The distributions of doubling, hitting and standing are computed once
+        and compared, which gives the same move as calling should_double then
+        should_hit.
+        """
+        cdef RewardDistribution rd = self.reward_distribution
+        cdef double value_double = rd.distribution_value(
+            rd.distr_double(player_total, player_aces, dealer_total))
+        cdef double value_hit = rd.distribution_value(
+            rd.distr_hit(player_total, player_aces, dealer_total))
+        cdef double value_stand = rd.distribution_value(
+            rd.distr_stand(player_total,
+                           1 if dealer_total == 11 else 0,
+                           dealer_total,
+                           True))
+        if value_double > max(value_hit, value_stand):
+            return DOUBLE
+        if value_hit > value_stand:
+            return HIT
+        return STAND
+
+    cpdef list best_moves(self,
+                          int player_total,
+                          int player_aces,
+                          dealer_totals,
+                          card_distribution):
+        """ Returns the optimal move against each of the dealer totals.
+
+        Evaluates a whole row of a strategy table in one call, each move is
+        the one get_action of a Strategist would return.
+
+        Args:
+            player_total: The hand total of the player.
+            player_aces: The number of soft aces available to the player.
+            dealer_totals: The hand totals of the dealer.
+            card_distribution: The distribution of the cards remaining in the
+                shoe.
+
+        Returns:
+            One of DOUBLE, HIT and STAND for each of the dealer totals.
+        """
+        self.reward_distribution.set_card_distribution(card_distribution)
+        cdef int dealer_total
+        return [self._best_move(player_total, player_aces, dealer_total)
+                for dealer_total in dealer_totals]
+
+    cpdef list split_moves(self,
+                           int player_total,
+                           int player_aces,
+                           dealer_totals,
+                           card_distribution):
+        """ Returns whether it is optimal to split against each dealer total.
+
+        Args:
+            player_total: The hand total of the player.
+            player_aces: The number of soft aces available to the player.
+            dealer_totals: The hand totals of the dealer.
+            card_distribution: The distribution of the cards remaining in the
+                shoe.
+        """
+        cdef int dealer_total
+        return [self.should_split(player_total,
+                                  player_aces,
+                                  dealer_total,
+                                  card_distribution)
+                for dealer_total in dealer_totals]
+
     cpdef void free_mem(self):
         """ Frees the memory used by the Reward Distribution object. """
         self.reward_distribution.free_mem()
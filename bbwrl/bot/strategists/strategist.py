@@ -25,6 +25,10 @@ import abc
 import numpy as np
 
 
+# The moves a strategist can choose in a hand, as returned by get_action.
+HIT, STAND, DOUBLE = 0, 1, 2
+
+
 class Strategist(abc.ABC):
     """ Implements the Strategist interface.
 
@@ -32,7 +36,13 @@ class Strategist(abc.ABC):
     blackjack game such as splitting, doubling down, hitting and standing
     based on the hand of the player, dealer and the distribution of cards
     remaining in the shoe.
+
+    Attributes:
+        STATELESS: Whether the actions of the strategist are independent of
+            the utility function, so that one instance can be reused for
+            every game.
     """
+    STATELESS = False
 
     @abc.abstractmethod
     def should_split(self,
@@ -85,6 +95,35 @@ class Strategist(abc.ABC):
         """
         pass
 
+    def get_action(self,
+                   player_total: int,
+                   player_aces: int,
+                   dealer_total: int,
+                   card_distribution: np.ndarray) -> int:
+        """ Returns the optimal move among doubling down, hitting and standing.
+
+        Args:
+            player_total: The hand total of the player.
+            player_aces: The number of soft aces available to the player.
+            dealer_total: The hand total of the dealer.
+            card_distribution: The distribution of the cards remaining in the
+                shoe.
+
+        Returns:
+            One of DOUBLE, HIT and STAND.
+        """
+        if self.should_double(player_total,
+                              player_aces,
+                              dealer_total,
+                              card_distribution):
+            return DOUBLE
+        if self.should_hit(player_total,
+                           player_aces,
+                           dealer_total,
+                           card_distribution):
+            return HIT
+        return STAND
+
     @abc.abstractmethod
     def free_mem(self) -> None:
         pass
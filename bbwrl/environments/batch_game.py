@@ -0,0 +1,145 @@
+# MIT License
+#
+# Copyright (c) 2021 Patrik Gergely
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Batched blackjack game simulation.
+
+Simulates many independent games in lockstep, where every game is played
+from its own freshly shuffled shoe. The state of all games is kept in
+arrays and advanced with masked updates, so the cost of a step is shared by
+every game in the batch. Only hitting and standing are supported, for
+splitting and doubling down use Game.
+"""
+from typing import Callable, Optional
+
+import numpy as np
+
+from bbwrl.environments import rule_variation
+from bbwrl.environments.game import _CARD_VALUE
+from bbwrl.environments.shoe import _FULL_SHOE
+
+
+# The value of each card, indexed by the card.
+_CARD_VALUES = np.array(_CARD_VALUE, dtype=np.int16)
+
+# Maps the player total, soft aces and dealer total of every game to whether
+# the player hits in that game.
+Policy = Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+
+def _add_cards(totals: np.ndarray,
+               aces: np.ndarray,
+               cards: np.ndarray,
+               mask: np.ndarray) -> None:
+    """ Adds a card to the hands selected by a mask in place.
+
+    Args:
+        totals: The hand totals with shape (N, ).
+        aces: The number of soft aces of the hands with shape (N, ).
+        cards: The card added to each hand with shape (N, ).
+        mask: Whether to add the card to the given hand with shape (N, ).
+    """
+    totals += _CARD_VALUES[cards] * mask
+    aces += (cards == 1) & mask
+    soft_bust = mask & (totals > 21) & (aces > 0)
+    totals -= 10 * soft_bust
+    aces -= soft_bust
+
+
+def _simulate(shoes: np.ndarray,
+              policy: Policy,
+              positions: Optional[np.ndarray] = None) -> np.ndarray:
+    """ Simulates a game from each shoe.
+
+    Args:
+        shoes: The shuffled shoes with shape (N, number of cards in a shoe).
+        policy: Decides whether the player hits in each game.
+        positions: The index of the next card to draw in each shoe with
+            shape (N, ), advanced in place past the cards drawn. The games
+            are dealt from the top of the shoes if not given.
+
+    Returns:
+        The payout of each game with shape (N, ).
+    """
+    n_games = shoes.shape[0]
+    games = np.arange(n_games)
+    all_games = np.ones(n_games, dtype=bool)
+    if positions is None:
+        positions = np.zeros(n_games, dtype=int)
+    player_totals = np.zeros(n_games, dtype=np.int16)
+    player_aces = np.zeros(n_games, dtype=np.int16)
+    dealer_totals = np.zeros(n_games, dtype=np.int16)
+    dealer_aces = np.zeros(n_games, dtype=np.int16)
+    _add_cards(player_totals, player_aces, shoes[games, positions], all_games)
+    _add_cards(player_totals, player_aces, shoes[games, positions + 1],
+               all_games)
+    _add_cards(dealer_totals, dealer_aces, shoes[games, positions + 2],
+               all_games)
+    hidden_cards = shoes[games, positions + 3]
+    positions += 4
+
+    player_blackjack = player_totals == 21
+    dealer_blackjack = dealer_totals + _CARD_VALUES[hidden_cards] == 21
+    stand = player_blackjack.copy()
+    if rule_variation.DEALER_PEEKS:
+        stand |= dealer_blackjack
+    while not stand.all():
+        hit = ~stand & policy(player_totals, player_aces, dealer_totals)
+        _add_cards(player_totals, player_aces, shoes[games, positions], hit)
+        positions += hit
+        stand |= ~hit | (player_totals >= 21)
+
+    _add_cards(dealer_totals, dealer_aces, hidden_cards, all_games)
+    while True:
+        draw = dealer_totals < 17
+        if rule_variation.HIT_SOFT_17:
+            draw |= (dealer_totals == 17) & (dealer_aces > 0)
+        if not draw.any():
+            break
+        _add_cards(dealer_totals, dealer_aces, shoes[games, positions], draw)
+        positions += draw
+
+    payouts = np.sign(player_totals - dealer_totals).astype(float)
+    payouts[dealer_totals > 21] = 1.0
+    payouts[player_totals > 21] = -1.0
+    payouts[player_blackjack] = np.where(dealer_blackjack[player_blackjack],
+                                         0.0,
+                                         rule_variation.BLACKJACK_PAYOUT)
+    return payouts
+
+
+def batch_simulate(n_games: int,
+                   policy: Policy,
+                   rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """ Simulates independent games in lockstep.
+
+    Args:
+        n_games: The number of games to simulate.
+        policy: Decides whether the player hits in each game, given arrays of
+            the player totals, soft aces and dealer totals.
+        rng: The random number generator used to shuffle the shoes.
+
+    Returns:
+        The payout of each game with shape (n_games, ).
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    shoes = rng.permuted(np.tile(_FULL_SHOE, (n_games, 1)), axis=1)
+    return _simulate(shoes, policy)
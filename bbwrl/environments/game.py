@@ -23,12 +23,68 @@
 """Blackjack game implementation."""
 
 import numpy as np
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from bbwrl.environments.shoe import Shoe, Card
 from bbwrl.environments import rule_variation
 
 
+# The value of each card, indexed by the card. Aces value 11.
+_CARD_VALUE = (0, 11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
+
+
+# Every card adds atleast 1 to the hand total, so the dealer never draws more
+# than 17 cards before reaching 17.
+_MAX_DEALER_DRAWS = 17
+
+
+# Whether the dealer draws another card, indexed first by whether the dealer
+# hits soft 17, then by total*2 + whether the dealer has a soft ace. Both rule
+# variations are tabulated so that changing HIT_SOFT_17 at runtime still works.
+_DEALER_HITS = tuple(
+    tuple(total < 17 or (total == 17 and hit_soft_17 and soft)
+          for total in range(32)
+          for soft in (False, True))
+    for hit_soft_17 in (False, True))
+
+
+def _dealer_transition(total: int,
+                       aces: int,
+                       card: Card,
+                       hits: Tuple[bool, ...]) -> Tuple[int, int, bool]:
+    """Adds a card to the hand of the dealer, like Dealer._add_card.
+
+    Returns:
+        The new hand total, the new number of soft aces and whether the
+        dealer stands with the new hand.
+    """
+    total += _CARD_VALUE[card]
+    aces += card == 1
+    if total > 21 and aces > 0:
+        total -= 10
+        aces -= 1
+    return total, aces, total > 21 or not hits[total*2 + (aces > 0)]
+
+
+# The hand of the dealer after drawing a card, indexed first by whether the
+# dealer hits soft 17, then by (total*2 + soft aces)*14 + card. The dealer
+# never has more than one soft ace, as two would add up to more than 21.
+_DEALER_TRANSITIONS = tuple(
+    tuple(_dealer_transition(total, aces, card, hits)
+          for total in range(32)
+          for aces in (0, 1)
+          for card in range(14))
+    for hits in _DEALER_HITS)
+
+
+# The bits of Player._flags.
+_BJ = 1
+_SPLIT = 2
+_DD_OK = 4
+_DD_DONE = 8
+_STAND = 16
+
+
 def _get_payout(player: int, dealer: int) -> float:
     """Calculates the payout for the given hand totals.
 
@@ -60,11 +116,43 @@ def value(card: Card) -> int:
     Return:
         The value of the given card.
     """
-    if card == 1:
-        return 11
-    if card > 10:
-        return 10
-    return card
+    return _CARD_VALUE[card]
+
+
+def _play_dealer(total: int,
+                 aces: int,
+                 card: Card,
+                 upcoming: List[Card],
+                 shown: List[int],
+                 transitions: Tuple[Tuple[int, int, bool], ...]
+                 ) -> Tuple[int, int, int]:
+    """Plays out the hand of the dealer.
+
+    Equivalent to repeatedly calling Dealer._add_card while
+    Dealer._needs_to_draw holds, with the whole hand kept in local variables
+    and each card added with a single lookup.
+
+    Args:
+        total: The hand total of the dealer before revealing the hidden card.
+        aces: The number of aces which have the possibility to be 1 or 11.
+        card: The hidden card of the dealer.
+        upcoming: The next cards in the shoe, in the order they are drawn.
+        shown: A list of length 14 where the revealed cards are counted.
+        transitions: The row of _DEALER_TRANSITIONS for the rule variation
+            in use.
+
+    Returns:
+        The final hand total, the final number of soft aces and the number
+        of cards drawn from upcoming.
+    """
+    drawn = 0
+    while True:
+        shown[card] += 1
+        total, aces, stands = transitions[(total*2 + aces)*14 + card]
+        if stands:
+            return total, aces, drawn
+        card = upcoming[drawn]
+        drawn += 1
 
 
 class Dealer:
@@ -78,21 +166,34 @@ class Dealer:
         _aces: The number of aces which have the possibility to be 1 or 11.
         _blackjack: Whether the dealer was dealt blackjack.
         _hidden_card: The initial card which is not shown to the player.
+        _hits: Whether the dealer draws, indexed by total*2 + whether the
+            dealer has a soft ace.
         _total: The current hand total.
+        _transitions: The hand after drawing a card, indexed by
+            (total*2 + soft aces)*14 + card.
     """
+    __slots__ = ('_aces', '_blackjack', '_hidden_card', '_hits', '_total',
+                 '_transitions')
+
     def __init__(self,
                  shown_card: Card,
-                 hidden_card: Card):
+                 hidden_card: Card,
+                 hit_soft_17: Optional[bool] = None):
         """Initializes the dealer using two dealt cards.
 
         Args:
             shown_card: The initial card which is shown to the player.
             hidden_card: The initial card which is not shown to the player.
+            hit_soft_17: Whether the dealer hits soft 17. Defaults to the
+                current rule variation.
         """
-        self._total = 0
-        self._aces = 0
-        self._add_card(shown_card)
-        self._blackjack = self._total + value(hidden_card) == 21
+        if hit_soft_17 is None:
+            hit_soft_17 = rule_variation.HIT_SOFT_17
+        self._hits = _DEALER_HITS[hit_soft_17]
+        self._transitions = _DEALER_TRANSITIONS[hit_soft_17]
+        self._total = _CARD_VALUE[shown_card]
+        self._aces = int(shown_card == 1)
+        self._blackjack = self._total + _CARD_VALUE[hidden_card] == 21
         self._hidden_card = hidden_card
 
     def _add_card(self, card: Card) -> None:
@@ -104,12 +205,11 @@ class Dealer:
         Args:
             card: The card to be added to the hand.
         """
-        self._total += value(card)
-        self._aces += 1 if (card == 1) else 0
-        if self._total > 21:
-            if self._aces > 0:
-                self._aces -= 1
-                self._total -= 10
+        self._total += _CARD_VALUE[card]
+        self._aces += card == 1
+        demote = (self._total > 21) & (self._aces > 0)
+        self._aces -= demote
+        self._total -= 10 * demote
 
     def get_blackjack(self) -> bool:
         return self._blackjack
@@ -129,30 +229,30 @@ class Dealer:
         Returns:
             A boolean whether the dealer needs to draw an additional card.
         """
-        if self._total == 17:
-            return rule_variation.HIT_SOFT_17 and self._aces > 0
-        return self._total < 17
+        return self._hits[self._total*2 + (self._aces > 0)]
 
-    def stand(self, shoe: Shoe) -> np.ndarray:
+    def stand(self,
+              shoe: Shoe,
+              currently_shown: Optional[List[int]] = None) -> List[int]:
         """Draws cards until required.
 
         Draws additional cards until it is required by the rules of blackjack.
 
         Args:
             shoe: The shoe where the card is drawn from
+            currently_shown: A list of length 14 to count the drawn cards in.
+                A new list is used if not given.
 
         Returns:
-            A numpy array with shape (14, ) where each entry represents how
-            many of the corresponding cards were drawn.
+            A list of length 14 where each entry represents how many of the
+            corresponding cards were drawn, added to currently_shown.
         """
-        currently_shown = np.zeros(14, dtype=int)
-        card = self._hidden_card
-        self._add_card(card)
-        currently_shown[card] += 1
-        while self._needs_to_draw():
-            card = shoe.draw()
-            self._add_card(card)
-            currently_shown[card] += 1
+        if currently_shown is None:
+            currently_shown = [0] * 14
+        self._total, self._aces, drawn = _play_dealer(
+            self._total, self._aces, self._hidden_card,
+            shoe.peek(_MAX_DEALER_DRAWS), currently_shown, self._transitions)
+        shoe.skip(drawn)
         return currently_shown
 
 
@@ -167,13 +267,13 @@ class Player:
 
     Attributes:
         _aces: The number of aces which have the possibility to be 1 or 11.
-        _blackjack: Whether the player won with blackjack.
-        _can_split: Whether the player is allowed to split.
-        _can_double_down: Whether the player is allowed to double down.
-        _doubled_down: Whether the player doubled down.
-        _stand: Whether the player is standing.
+        _flags: The state of the hand packed into bits: _BJ if the player won
+            with blackjack, _SPLIT if the player is allowed to split, _DD_OK
+            if the player is allowed to double down, _DD_DONE if the player
+            doubled down and _STAND if the player is standing.
         _total: The current hand total.
     """
+    __slots__ = ('_aces', '_flags', '_total')
 
     def __init__(self,
                  first_card: Card,
@@ -189,17 +289,21 @@ class Player:
             can_blackjack: Whether the player is rewarded extra for winning
                 with blackjack.
         """
-        self._total = 0
-        self._aces = 0
-        self._add_card(first_card)
-        self._add_card(second_card)
-        self._can_split = (value(first_card) == value(second_card)
-                           if rule_variation.SPLIT_UNEVEN
-                           else first_card == second_card)
-        self._doubled_down = False
-        self._blackjack = self.get_total() == 21 and can_blackjack
-        self._stand = self.get_total() == 21
-        self._can_double_down = can_double_down and not self._stand
+        # Two cards can only exceed 21 as a pair of aces, which is a soft 12.
+        self._total = _CARD_VALUE[first_card] + _CARD_VALUE[second_card]
+        self._aces = (first_card == 1) + (second_card == 1)
+        if self._total == 22:
+            self._total = 12
+            self._aces = 1
+        can_split = (_CARD_VALUE[first_card] == _CARD_VALUE[second_card]
+                     if rule_variation.SPLIT_UNEVEN
+                     else first_card == second_card)
+        if self._total == 21:
+            self._flags = _STAND | (_BJ if can_blackjack else 0)
+        else:
+            self._flags = _DD_OK if can_double_down else 0
+        if can_split:
+            self._flags |= _SPLIT
 
     def _add_card(self, card: Card) -> None:
         """Updates the hand total with a card.
@@ -211,14 +315,13 @@ class Player:
         Args:
             card: The card to be added to the hand.
         """
-        self._total += value(card)
-        self._aces += 1 if (card == 1) else 0
-        if self._total > 21:
-            if self._aces > 0:
-                self._aces -= 1
-                self._total -= 10
+        self._total += _CARD_VALUE[card]
+        self._aces += card == 1
+        demote = (self._total > 21) & (self._aces > 0)
+        self._aces -= demote
+        self._total -= 10 * demote
         if self._total >= 21:
-            self._stand = True
+            self._flags |= _STAND
 
     def double_down(self, shoe: Shoe) -> Optional[Card]:
         """Doubles down.
@@ -233,28 +336,48 @@ class Player:
             None if the player was not allowed to double down, otherwise the
             drawn card.
         """
-        if not self._can_double_down:
+        if not self._flags & _DD_OK:
             return
-        self._doubled_down = True
+        self._flags |= _DD_DONE
         card = self.hit(shoe)
-        self._stand = True
+        self._flags |= _STAND
         return card
 
     def get_aces(self) -> int:
         return self._aces
 
     def get_blackjack(self) -> bool:
-        return self._blackjack
+        return bool(self._flags & _BJ)
 
     def get_doubled_down(self) -> bool:
-        return self._doubled_down
+        return bool(self._flags & _DD_DONE)
 
     def get_stand(self) -> bool:
-        return self._stand
+        return bool(self._flags & _STAND)
 
     def get_total(self) -> int:
         return self._total
 
+    def payout(self,
+               dealer_total: int,
+               dealer_blackjack: bool,
+               blackjack_payout: float) -> float:
+        """Calculates the payout of the hand against the dealer.
+
+        Args:
+            dealer_total: The final hand total of the dealer.
+            dealer_blackjack: Whether the dealer was dealt blackjack.
+            blackjack_payout: The payout of winning with blackjack.
+
+        Returns:
+            The payout of the hand, doubled if the player doubled down.
+        """
+        flags = self._flags
+        if flags & _BJ:
+            return 0.0 if dealer_blackjack else blackjack_payout
+        payout = _get_payout(self._total, dealer_total)
+        return 2 * payout if flags & _DD_DONE else payout
+
     def hit(self, shoe: Shoe) -> Optional[Card]:
         """ Draws a single card if haven't stood yet.
 
@@ -268,10 +391,9 @@ class Player:
             None if the player was not allowed to hit, otherwise the drawn
             card.
         """
-        if self._stand:
+        if self._flags & _STAND:
             return
-        self._can_split = False
-        self._can_double_down = False
+        self._flags &= ~(_SPLIT | _DD_OK)
         card = shoe.draw()
         self._add_card(card)
         return card
@@ -282,14 +404,14 @@ class Player:
         Returns:
             The initial card if the hand can be split otherwise returns None.
         """
-        if not self._can_split:
+        if not self._flags & _SPLIT:
             return None
         if self._aces != 0:
             return 1
         return int(self._total / 2)
 
     def stand(self) -> None:
-        self._stand = True
+        self._flags |= _STAND
 
 
 class Game:
@@ -300,16 +422,26 @@ class Game:
     a game is finished returns the payout for the game.
 
     Attributes:
-        _currently_shown: A numpy array with shape (14, ) where each element
-            corresponds to the number of cards discarded of the given card.
+        _currently_shown: A list of length 14 where each element corresponds
+            to the number of cards discarded of the given card. It is only
+            converted to a numpy array when observed.
+        _revealed_cards: The numpy array the revealed cards are observed
+            through, reused by every observation of the game and possibly
+            shared with other games. None until an observation needs it.
         _dealer: The dealer the players play against
         _shoe: The shoe to draw cards from.
         _focus: The identifier of the player currently in focus
         _payout: The payout for the game
         _players: A list of players that play the game.
         _resplit: The maximum number of players after resplitting
+        _pair_mask: The bitmask of the cards that are allowed to be split.
     """
-    def __init__(self, shoe: Shoe):
+    __slots__ = ('_currently_shown', '_revealed_cards', '_dealer', '_shoe',
+                 '_focus', '_payout', '_players', '_resplit', '_pair_mask')
+
+    def __init__(self,
+                 shoe: Shoe,
+                 revealed_cards: Optional[np.ndarray] = None):
         """ Initializes a game given a shoe.
 
         The game is initalized by drawing two shown cards for the player and a
@@ -317,9 +449,16 @@ class Game:
 
         Args:
             shoe: The shoe to draw cards from.
+            revealed_cards: An integer array of length 14 to observe the
+                revealed cards through. Games played one after the other can
+                share it to avoid allocating a new array for every game. A new
+                array is allocated by the first observation that needs it if
+                not given.
         """
         self._shoe = shoe
-        self._currently_shown = np.zeros(14, dtype=int)
+        self._pair_mask = rule_variation.PAIR_SPLIT_MASK
+        self._currently_shown = [0] * 14
+        self._revealed_cards = revealed_cards
         if self._shoe.try_reshuffle():
             self._currently_shown[0] = -1
         player_first = shoe.draw()
@@ -351,32 +490,48 @@ class Game:
         """
         if self._resplit <= len(self._players):
             return False
-        if self._get_player() is None:
+        player = self._get_player()
+        if player is None:
             return False
-        card = self._get_player().split_value()
-        if card is None or card not in rule_variation.PAIR_SPLITTING:
+        card = player.split_value()
+        if card is None or not (self._pair_mask >> card) & 1:
             return False
         return True
 
-    def current_observation(self) -> Dict[str, np.ndarray]:
+    def current_observation(
+            self, obs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Returns an observation of the game.
 
+        Args:
+            obs: A dict to write the observation into. A new dict is used if
+                not given. If it already holds a REVEALED_CARDS array, the
+                revealed cards are written into that array instead of the one
+                of the game.
+
         Returns:
             An observation of the current player's hand total, the number of
             aces which have the possibility to be 1 or 11, the dealer's hand
             total and the cards that have been revealed since the last action.
+            The revealed cards are only valid until the next observation.
         """
         player = self._get_player()
         dealer = self._dealer
         if player is None:
             player = self._players[-1]
-        currently_shown = self._currently_shown.copy()
-        self._currently_shown = np.zeros(14, dtype=int)
-        return {'PLAYER_TOTAL': np.array(player.get_total(), dtype=np.int),
-                'PLAYER_ACES': np.array(player.get_aces(), dtype=np.int),
-                'DEALER_TOTAL': np.array(dealer.get_total(), dtype=np.int),
-                'REVEALED_CARDS': currently_shown
-                }
+        if obs is None:
+            obs = {}
+        revealed_cards = obs.get('REVEALED_CARDS')
+        if revealed_cards is None:
+            if self._revealed_cards is None:
+                self._revealed_cards = np.zeros(14, dtype=np.int8)
+            revealed_cards = self._revealed_cards
+            obs['REVEALED_CARDS'] = revealed_cards
+        revealed_cards[:] = self._currently_shown
+        self._currently_shown = [0] * 14
+        obs['PLAYER_TOTAL'] = player.get_total()
+        obs['PLAYER_ACES'] = player.get_aces()
+        obs['DEALER_TOTAL'] = dealer.get_total()
+        return obs
 
     def double_focus(self) -> None:
         """Doubles down the hand of the player currently in focus if allowed.
@@ -384,9 +539,10 @@ class Game:
         Return:
             A boolean value whether the player was allowed to double down.
         """
-        if self._get_player() is None:
+        player = self._get_player()
+        if player is None:
             return
-        self._show_cards(self._get_player().double_down(self._shoe))
+        self._show_cards(player.double_down(self._shoe))
         self.move_focus()
 
     def get_payout(self) -> Optional[float]:
@@ -405,9 +561,11 @@ class Game:
     def hit(self) -> None:
         """Hits the hand of the player currently in focus.
         """
-        if self._get_player() is not None:
-            self._show_cards(self._get_player().hit(self._shoe))
-            if self._get_player().get_stand():
+        focus = self._focus
+        if 0 <= focus < len(self._players):
+            player = self._players[focus]
+            self._show_cards(player.hit(self._shoe))
+            if player.get_stand():
                 self.move_focus()
         self._try_finish()
 
@@ -509,17 +667,12 @@ class Game:
         """
         if (self._payout is not None) or (not self._all_player_stand()):
             return
-        player = self._get_player()
         dealer = self._dealer
+        dealer.stand(self._shoe, self._currently_shown)
+        dealer_total = dealer.get_total()
+        dealer_blackjack = dealer.get_blackjack()
+        blackjack_payout = rule_variation.BLACKJACK_PAYOUT
         self._payout = 0.
-        self._currently_shown += dealer.stand(self._shoe)
         for player in self._players:
-            if player.get_blackjack():
-                payout = (0.0 if dealer.get_blackjack() else
-                          rule_variation.BLACKJACK_PAYOUT)
-            else:
-                payout = _get_payout(player.get_total(),
-                                     dealer.get_total())
-                if player.get_doubled_down():
-                    payout *= 2
-            self._payout += payout
+            self._payout += player.payout(dealer_total, dealer_blackjack,
+                                          blackjack_payout)
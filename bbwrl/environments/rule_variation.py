@@ -24,6 +24,8 @@ HIT_AFTER_SPLIT_ACES = False
 HIT_SOFT_17 = False
 # A list of cards that is allowed to be split.
 PAIR_SPLITTING = list(range(1, 14))
+# PAIR_SPLITTING as a bitmask, where bit c is set if the card c can be split.
+PAIR_SPLIT_MASK = sum(1 << card for card in PAIR_SPLITTING)
 # The ratio of cards left to the whole shoe that when meet reshuffles the shoe.
 RESHUFFLE = 0.25
 # The number of hands the player can have after splitting aces.
@@ -33,50 +33,88 @@ from bbwrl.environments import rule_variation
 # Cards over 10 correspond to face cards, which value 10.
 Card = int
 
-
-class Shoe(object):
+# The cards that make the shoe before shuffling.
+_FULL_SHOE = np.repeat(np.arange(1, 14, dtype=np.int8),
+                       4*rule_variation.SHOE_SIZE)
+# The number of cards in the shoe.
+_NUM_CARDS = _FULL_SHOE.size
+# The smallest number of drawn cards after which the shoe is reshuffled, that
+# is when cards_left() drops below the reshuffle threshold.
+_RESHUFFLE_AT = next((it for it in range(_NUM_CARDS + 1)
+                      if 1 - (it / _NUM_CARDS) < rule_variation.RESHUFFLE),
+                     _NUM_CARDS + 1)
+
+
+class Shoe:
     """ Represents a blackjack shoe.
 
     A shoe contains multiple decks, that the environment can draw from and
     when only a small percentage of cards are left it automatically reshuffles.
 
     Attributes:
-        _full_shoe: A list cards that make the shoe before shuffleing.
         _it: The iterator of the current card in the deck.
         _rng: The random number generator used by the shoe.
         _running_shoe: A list of cards that represent the order of cards in a
-            shuffled shoe.
+            shuffled shoe. It is a Python list, so that drawing a card does
+            not box a numpy scalar.
+        _with_replacement: Whether the cards are sampled with replacement.
     """
+    __slots__ = ('_it', '_rng', '_running_shoe', '_with_replacement')
 
-    def __init__(self):
+    def __init__(self, with_replacement: bool = False):
         """ Initializes a shoe object.
 
-        Sets up the full shoe based on the number of shoes required by the
-        rule variation, saves a random number generator and shuffles the shoe.
+        Saves a random number generator and shuffles the shoe.
+
+        Args:
+            with_replacement: Whether to sample every card of the shoe
+                independently from the full shoe instead of shuffling it. The
+                card distribution is then only approximately that of a real
+                shoe, which is fine for training but not for evaluation.
         """
-        self._full_shoe = np.repeat(np.arange(1, 14),
-                                    4*rule_variation.SHOE_SIZE)
         self._rng = np.random.default_rng()
+        self._with_replacement = with_replacement
         self.reshuffle()
 
     def cards_left(self) -> float:
         """ Returns the percentage of cards that have not yet been drawn. """
-        return 1 - (self._it / np.size(self._full_shoe))
+        return 1 - (self._it / _NUM_CARDS)
 
     def draw(self) -> Card:
         """ Returns the next card in the deck. """
+        card = self._running_shoe[self._it]
         self._it += 1
-        return self._running_shoe[self._it - 1]
+        return card
+
+    def peek(self, max_cards: int) -> List[Card]:
+        """ Returns the next cards in the deck without drawing them.
+
+        Args:
+            max_cards: The maximum number of cards to return.
+        """
+        return self._running_shoe[self._it:self._it + max_cards]
+
+    def skip(self, num_cards: int) -> None:
+        """ Draws cards that were already looked at with peek.
+
+        Args:
+            num_cards: The number of cards to draw.
+        """
+        self._it += num_cards
 
     def reshuffle(self) -> None:
         """ Reshuffles the shoe. """
-        self._running_shoe = self._full_shoe.copy()
+        if self._with_replacement:
+            # Every card value is equally likely in a full shoe.
+            running_shoe = self._rng.integers(1, 14, _NUM_CARDS)
+        else:
+            running_shoe = self._rng.permutation(_FULL_SHOE)
+        self._running_shoe = running_shoe.tolist()
         self._it = 0
-        self._rng.shuffle(self._running_shoe)
 
     def try_reshuffle(self) -> bool:
         """ Reshuffles if there are less cards left than a threshold. """
-        if self.cards_left() < rule_variation.RESHUFFLE:
+        if self._it >= _RESHUFFLE_AT:
             self.reshuffle()
             return True
         return False
@@ -93,8 +131,7 @@ def _custom_shoe(cards: List[Card]) -> Shoe:
     shoe = Shoe()
     running_shoe = shoe._running_shoe
     for card in cards:
-        position = np.where(running_shoe == card)[0][0]
-        running_shoe = np.delete(running_shoe, position)
+        running_shoe.remove(card)
     shoe._rng.shuffle(running_shoe)
-    shoe._running_shoe = np.append(cards, running_shoe)
+    shoe._running_shoe = list(cards) + running_shoe
     return shoe
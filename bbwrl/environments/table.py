@@ -21,6 +21,7 @@
 # SOFTWARE.
 
 """Blackjack table implementation."""
+import sys
 from typing import Any, Dict, Optional
 
 import dm_env
@@ -31,11 +32,16 @@ from bbwrl.environments import rule_variation
 from bbwrl.environments.game import Game
 from bbwrl.environments.shoe import Shoe
 
-_DEFAULT_GAME_OBS = {'PLAYER_TOTAL': np.array(0, dtype=np.int),
-                     'PLAYER_ACES': np.array(0, dtype=np.int),
-                     'DEALER_TOTAL': np.array(0, dtype=np.int),
-                     'REVEALED_CARDS': np.zeros(14, dtype=np.int)
-                     }
+# The stages of a game. They are interned, so comparing them or looking them
+# up in a dict reduces to an identity check.
+CHOOSE_BET = sys.intern('CHOOSE_BET')
+SPLIT = sys.intern('SPLIT?')
+DOUBLE = sys.intern('DOUBLE?')
+HIT_STAND = sys.intern('HIT/STAND')
+
+# The stages are tracked internally by their index in _STAGE_NAMES.
+_STAGE_NAMES = (CHOOSE_BET, SPLIT, DOUBLE, HIT_STAND)
+_CHOOSE_BET_ID, _SPLIT_ID, _DOUBLE_ID, _HIT_STAND_ID = range(4)
 
 
 class Table(dm_env.Environment):
@@ -48,10 +54,19 @@ class Table(dm_env.Environment):
         _chips: The amount of chips in the player's bankroll.
         _game: The game that is currently being played.
         _game_counter: The number of games played
+        _max_mult: The number of times the player can split or double in the
+            current game, fixed when the bet is placed.
+        _observations: Two dicts the observations are written into in turn,
+            so that an observation stays valid for one step after it is
+            returned. Each dict has its own revealed cards array, which is
+            written in place.
+        _observation_index: The index of the dict in _observations that was
+            written last.
         _shoe: The shoe where the cards are drawn from.
-        _stage: The current stage of blackjack.
+        _stage: The index of the current stage of blackjack in _STAGE_NAMES.
         _time_limit: The number of games to automatically terminate after.
-        _stage2move: Maps stages to the corresponding method to call.
+        _stage2move: The method to call in each stage, indexed like
+            _STAGE_NAMES.
     """
     def __init__(self, time_limit: int):
         """Initializes a table.
@@ -59,20 +74,24 @@ class Table(dm_env.Environment):
         Args:
             _time_limit: The number of games to automatically terminate after.
         """
-        self._stage2move = {
-            'CHOOSE_BET': self._place_bet,
-            'SPLIT?': self._split,
-            'DOUBLE?': self._double,
-            'HIT/STAND': self._hit_or_stand,
-        }
+        self._stage2move = (
+            self._place_bet,
+            self._split,
+            self._double,
+            self._hit_or_stand,
+        )
         self._time_limit = time_limit
+        self._observations = tuple(
+            {'REVEALED_CARDS': np.zeros(14, dtype=np.int8)} for _ in range(2))
+        self._observation_index = 0
+        self._shoe = Shoe()
         self.reset()
 
     def reset(self) -> dm_env.TimeStep:
         """Returns the first `TimeStep` of a new episode."""
-        self._shoe = Shoe()
+        self._shoe.reshuffle()
         self._chips = rule_variation.AGENT_CHIPS
-        self._stage = 'CHOOSE_BET'
+        self._stage = _CHOOSE_BET_ID
         self._game: Optional[Game] = None
         self._game_counter = 1
         return dm_env.restart(self._observation())
@@ -102,8 +121,12 @@ class Table(dm_env.Environment):
                     (), np.float32, minimum=0.0, maximum=np.inf),
                 'REVEALED_CARDS':
                 specs.BoundedArray(
-                    (14,), np.int, minimum=0,
+                    (14,), np.int8, minimum=-1,
                     maximum=4*rule_variation.SHOE_SIZE),
+                # The hand totals are observed as plain Python ints, not
+                # arrays, which validate as the default integer dtype. The
+                # strategists index their tables with them, where int8
+                # arithmetic would overflow.
                 'PLAYER_TOTAL':
                     specs.DiscreteArray(dtype=int, num_values=31),
                 'PLAYER_ACES':
@@ -115,12 +138,21 @@ class Table(dm_env.Environment):
     def _observation(self) -> Dict[str, Any]:
         """Returns an observation of the table.
 
+        The observation is only valid until the step after it is returned.
+
         Returns:
             An observation of the current game, stage and amount of chips.
         """
-        obs = _DEFAULT_GAME_OBS if self._game is None else \
-            self._game.current_observation()
-        obs['STAGE'] = self._stage
+        self._observation_index ^= 1
+        obs = self._observations[self._observation_index]
+        if self._game is None:
+            obs['REVEALED_CARDS'].fill(0)
+            obs['PLAYER_TOTAL'] = 0
+            obs['PLAYER_ACES'] = 0
+            obs['DEALER_TOTAL'] = 0
+        else:
+            self._game.current_observation(obs)
+        obs['STAGE'] = _STAGE_NAMES[self._stage]
         obs['CHIPS'] = self._chips
         return obs
 
@@ -133,18 +165,17 @@ class Table(dm_env.Environment):
         """
         payout = self._game.get_payout()
         if payout is not None:
-            self._chips += payout * self._bet_size
+            reward = payout * self._bet_size
+            self._chips += reward
             if self._should_terminate():
                 observation = self._observation()
-                return dm_env.termination(reward=payout * self._bet_size,
+                return dm_env.termination(reward=reward,
                                           observation=observation)
             self._game_counter += 1
-            self._stage = 'CHOOSE_BET'
+            self._stage = _CHOOSE_BET_ID
             observation = self._observation()
             self._game = None
-            return dm_env.transition(
-                reward=payout * self._bet_size,
-                observation=observation)
+            return dm_env.transition(reward=reward, observation=observation)
         return dm_env.transition(reward=0., observation=self._observation())
 
     def _should_terminate(self) -> bool:
@@ -162,15 +193,21 @@ class Table(dm_env.Environment):
             bet_size: The bet the agent wants to place. This needs to be
                 atleast 1.0 and can be atmost the chips available to the agent.
         """
-        self._bet_size = max(min(bet_size, self._chips), 1.0)
+        # Comparing plain floats is cheaper than calling min and max on the
+        # numpy scalar the agent acts with.
+        bet_size = float(bet_size)
+        if bet_size > self._chips:
+            bet_size = self._chips
+        self._bet_size = 1.0 if bet_size < 1.0 else bet_size
         self._bet_multiplier = 1
+        self._max_mult = int(self._chips/self._bet_size)
         self._game = Game(self._shoe)
         if self._can_split():
-            self._stage = 'SPLIT?'
+            self._stage = _SPLIT_ID
         elif self._can_bet_more():
-            self._stage = 'DOUBLE?'
+            self._stage = _DOUBLE_ID
         else:
-            self._stage = 'HIT/STAND'
+            self._stage = _HIT_STAND_ID
 
     def _split(self, want_to_split: float) -> None:
         """Splits the hand of the player if the agent asks to.
@@ -185,9 +222,9 @@ class Table(dm_env.Environment):
         if bool(want_to_split):
             self._bet_multiplier = self._game.split_all(self._max_multiplier())
         if self._can_bet_more():
-            self._stage = 'DOUBLE?'
+            self._stage = _DOUBLE_ID
         else:
-            self._stage = 'HIT/STAND'
+            self._stage = _HIT_STAND_ID
 
     def _double(self, want_to_double: float) -> None:
         """Double down the hand of the player if the agent asks to.
@@ -202,7 +239,7 @@ class Table(dm_env.Environment):
         self._game.move_focus()
         if not self._game.player_in_focus():
             self._game.move_focus(0)
-            self._stage = 'HIT/STAND'
+            self._stage = _HIT_STAND_ID
 
     def _hit_or_stand(self, want_to_hit: float) -> None:
         """ Hits or stands with the player in focus.
@@ -221,13 +258,14 @@ class Table(dm_env.Environment):
 
         The number of times the player can split or double without going
         bankrupt. When keept track of this information, the agent will not be
-        able to achieve a negative bankroll.
+        able to achieve a negative bankroll. The chips only change once the
+        game is over, so it is computed once when the bet is placed.
         """
-        return int(self._chips/self._bet_size)
+        return self._max_mult
 
     def _can_bet_more(self) -> bool:
         """ Return whether the agent is allowed to double down or split. """
-        return self._max_multiplier() > self._bet_multiplier
+        return self._max_mult > self._bet_multiplier
 
     def _can_split(self) -> bool:
         """ Returns whether the agent is allowed to split. """
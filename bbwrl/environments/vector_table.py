@@ -0,0 +1,141 @@
+# MIT License
+#
+# Copyright (c) 2021 Patrik Gergely
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Batched blackjack tables.
+
+Runs many independent tables in lockstep for training bettors. Each table
+keeps its own shoe and bankroll between games, while the hands of every table
+are played together by batch_game. A step plays a whole game at every table,
+so the agent only chooses the bet sizes.
+"""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from bbwrl.environments import rule_variation
+from bbwrl.environments.batch_game import Policy, _simulate
+from bbwrl.environments.shoe import _FULL_SHOE, _RESHUFFLE_AT
+
+# The number of cards of each kind in a full shoe.
+_FULL_DISTRIBUTION = np.full(14, 4*rule_variation.SHOE_SIZE, dtype=int)
+_FULL_DISTRIBUTION[0] = 0
+
+
+class VectorTable:
+    """Represents a number of blackjack tables played in lockstep.
+
+    The state of every table is kept in arrays indexed by the table. Tables
+    whose episode ends are reset automatically at the end of the step, so
+    every step plays a game at every table.
+
+    Attributes:
+        _chips: The bankroll of the agent at each table.
+        _distributions: The number of cards of each kind not yet drawn from
+            the shoe of each table.
+        _games: The number of games played in the current episode at each
+            table.
+        _policy: Decides whether the player hits in each game.
+        _positions: The index of the next card to draw in each shoe.
+        _rng: The random number generator used to shuffle the shoes.
+        _shoes: The shuffled shoe of each table.
+        _time_limit: The number of games to automatically terminate after.
+    """
+    def __init__(self,
+                 num_tables: int,
+                 policy: Policy,
+                 time_limit: int,
+                 rng: Optional[np.random.Generator] = None):
+        """Initializes the tables.
+
+        Args:
+            num_tables: The number of tables to play in lockstep.
+            policy: Decides whether the player hits in each game, given
+                arrays of the player totals, soft aces and dealer totals.
+            time_limit: The number of games to automatically terminate after.
+            rng: The random number generator used to shuffle the shoes.
+        """
+        self._policy = policy
+        self._time_limit = time_limit
+        self._rng = np.random.default_rng() if rng is None else rng
+        self._shoes = np.tile(_FULL_SHOE, (num_tables, 1))
+        self._positions = np.zeros(num_tables, dtype=int)
+        self._distributions = np.tile(_FULL_DISTRIBUTION, (num_tables, 1))
+        self._chips = np.zeros(num_tables)
+        self._games = np.zeros(num_tables, dtype=int)
+        self.reset()
+
+    def _reset_tables(self, tables: np.ndarray) -> None:
+        """Starts a new episode at the tables selected by a mask."""
+        self._chips[tables] = rule_variation.AGENT_CHIPS
+        self._games[tables] = 0
+        self._reshuffle(tables)
+
+    def _reshuffle(self, tables: np.ndarray) -> None:
+        """Reshuffles the shoes of the tables selected by a mask."""
+        self._shoes[tables] = self._rng.permuted(self._shoes[tables], axis=1)
+        self._positions[tables] = 0
+        self._distributions[tables] = _FULL_DISTRIBUTION
+
+    def _observation(self) -> Dict[str, np.ndarray]:
+        """Returns the bankroll and the remaining cards at every table."""
+        return {'CHIPS': self._chips.copy(),
+                'CARD_DISTRIBUTION': self._distributions.copy()}
+
+    def reset(self) -> Dict[str, np.ndarray]:
+        """Starts a new episode at every table.
+
+        Returns:
+            The observation of every table.
+        """
+        self._reset_tables(np.ones(len(self._chips), dtype=bool))
+        return self._observation()
+
+    def step(self, bet_sizes: np.ndarray) -> Tuple[Dict[str, np.ndarray],
+                                                   np.ndarray,
+                                                   np.ndarray]:
+        """Plays a game at every table.
+
+        Args:
+            bet_sizes: The bet the agent places at each table. These are
+                clipped between 1.0 and the chips available at the table.
+
+        Returns:
+            The observation of every table, the reward obtained at each table
+            and whether the episode ended at each table. The observation of a
+            table whose episode ended is already that of the next episode.
+        """
+        self._reshuffle(self._positions >= _RESHUFFLE_AT)
+        bet_sizes = np.maximum(np.minimum(bet_sizes, self._chips), 1.0)
+        starts = self._positions.copy()
+        payouts = _simulate(self._shoes, self._policy, self._positions)
+        rewards = payouts * bet_sizes
+        self._chips += rewards
+        self._games += 1
+
+        cards = np.arange(self._shoes.shape[1])
+        tables, drawn = np.nonzero((cards >= starts[:, None])
+                                   & (cards < self._positions[:, None]))
+        np.subtract.at(self._distributions,
+                       (tables, self._shoes[tables, drawn]), 1)
+
+        dones = (self._chips < 1.0) | (self._games >= self._time_limit)
+        self._reset_tables(dones)
+        return self._observation(), rewards, dones
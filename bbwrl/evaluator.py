@@ -24,121 +24,193 @@
 Use: python bbwrl/evaluator.py simulation/*
 """
 
+import collections
+import functools
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 import math
+import multiprocessing
 import os
+import pathlib
+import re
 import sys
-from typing import TextIO, Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 
+import matplotlib
 import numpy as np
-from matplotlib import pyplot as plt
+
+# The plots are only saved to files, so no interactive backend is needed.
+matplotlib.use('Agg')
+from matplotlib import pyplot as plt  # pylint: disable=wrong-import-position
 
 from bbwrl import simulator
+from bbwrl.utils import logger
+
+# The number of points above which the plotted series are downsampled.
+_MAX_PLOT_POINTS = 5000
+
+# Matches a logged bet and captures the bankroll and the bet size, which are
+# the second and sixth fields of the line.
+_BET_LINE = re.compile(
+    r'^CHOOSE_BET,([^,\n]*),[^,\n]*,[^,\n]*,[^,\n]*,([^,\n]*),', re.MULTILINE)
 
 
-def _get_line(reader: TextIO) -> str:
-    """ Returns the next line from a file.
+def _read_episode(episode: str) -> Tuple[np.ndarray,
+                                         np.ndarray,
+                                         np.ndarray,
+                                         np.ndarray]:
+    """ Parses a single episode of a simulation file.
+
+    The bets are picked out by a single precompiled regular expression and
+    every derived quantity is computed on whole arrays at once.
 
     Args:
-        reader: The reader that reads from the file.
+        episode: The lines logged during the episode.
 
     Returns:
-        The next line that corresponds to an action taken by the bot.
+        Four arrays that contain a snapshot after each bet of the bankroll,
+        the bet size last produced, the payout last obtained and the geometric
+        increase of the bankroll.
     """
-    while True:
-        line = reader.readline()
-        if line in ['', 'START\n'] or line.split(',')[0] in ['CHOOSE_BET',
-                                                             'SPLIT?',
-                                                             'DOUBLE?',
-                                                             'HIT/STAND',]:
-            return line
-
-
-def _read_file(file_name: str) -> Tuple[List[List[float]],
-                                        List[List[float]],
-                                        List[List[float]],
-                                        List[List[float]]]:
-    """ Reads in a simulation file.
+    values = np.array(_BET_LINE.findall(episode),
+                      dtype=np.float64).reshape(-1, 2)
+    return _episode_arrays(values[:, 0], values[:, 1])
+
+
+def _episode_arrays(chips: np.ndarray,
+                    bets: np.ndarray) -> Tuple[np.ndarray,
+                                               np.ndarray,
+                                               np.ndarray,
+                                               np.ndarray]:
+    """ Derives the payouts and geometric increases of an episode.
 
     Args:
-        file_name: The name of the file containing the simulation.
+        chips: The bankroll before each bet of the episode.
+        bets: The size of each bet of the episode.
 
     Returns:
-        Four lists that contain a snapshot after each bet of the bankroll,
+        Four arrays that contain a snapshot after each bet of the bankroll,
         the bet size last produced, the payout last obtained and the geometric
         increase of the bankroll.
     """
-    with open(file_name, 'r') as reader:
-        line = _get_line(reader)
-        chips = []
-        rewards = []
-        bets = []
-        geom_incs = []
-        while line != '':
-            tmp_chips = []
-            tmp_rewards = []
-            tmp_bets = []
-            tmp_geom_incs = []
-            while line != '' and line[:5] != 'START':
-                (move_type, chip, _, _,
-                 _, action, _) = line.split(',')
-                if move_type == 'CHOOSE_BET':
-                    tmp_chips.append(float(chip))
-                    if len(tmp_chips) > 1:
-                        reward = (tmp_chips[-1]-tmp_chips[-2])/tmp_bets[-1]
-                        tmp_rewards.append(round(2*reward)/2)
-                        tmp_geom_incs.append((1+tmp_chips[-1])/
-                                             (1+tmp_chips[-2])-1)
-                    else:
-                        tmp_rewards.append(0.0)
-                        tmp_geom_incs.append(0.0)
-                    tmp_bets.append(float(action))
-                line = _get_line(reader)
-            if len(tmp_chips) > 0:
-                chips.append(tmp_chips)
-                bets.append(tmp_bets)
-                rewards.append(tmp_rewards)
-                geom_incs.append(tmp_geom_incs)
-            line = _get_line(reader)
+    rewards = np.zeros_like(chips)
+    geom_incs = np.zeros_like(chips)
+    rewards[1:] = np.round(2*(chips[1:]-chips[:-1])/bets[:-1])/2
+    geom_incs[1:] = (1+chips[1:])/(1+chips[:-1])-1
+    return chips, bets, rewards, geom_incs
+
+
+def _read_file(file_name: str,
+               need_plot: bool = True) -> Tuple[Optional[List[np.ndarray]],
+                                                Optional[List[np.ndarray]],
+                                                Optional[List[np.ndarray]],
+                                                List[np.ndarray]]:
+    """ Reads in a simulation file.
+
+    When the bets of the simulation were also saved in binary next to the
+    file, they are loaded from there instead of parsing the file.
+
+    Args:
+        file_name: The name of the file containing the simulation.
+        need_plot: Whether to keep the bankrolls, bet sizes and payouts. Only
+            the geometric increases are kept otherwise.
+
+    Returns:
+        Four lists that contain an array for each episode with a snapshot
+        after each bet of the bankroll, the bet size last produced, the payout
+        last obtained and the geometric increase of the bankroll. The first
+        three are None if need_plot is not set.
+    """
+    bets_file_name = file_name + logger.BETS_SUFFIX
+    if os.path.exists(bets_file_name):
+        logged_bets = np.load(bets_file_name)
+        starts = np.flatnonzero(np.diff(logged_bets['episode'])) + 1
+        episodes = [_episode_arrays(tmp_chips, tmp_bets)
+                    for tmp_chips, tmp_bets in zip(
+                        np.split(logged_bets['chips'], starts),
+                        np.split(logged_bets['bet'], starts))]
+    else:
+        with open(file_name, 'r') as reader:
+            episodes = [_read_episode(episode) for episode in
+                        ('\n' + reader.read()).split('\nSTART\n')]
+    episodes = [episode for episode in episodes if len(episode[0]) > 0]
+    geom_incs = [episode[3] for episode in episodes]
+    if not need_plot:
+        return None, None, None, geom_incs
+    chips = [episode[0] for episode in episodes]
+    bets = [episode[1] for episode in episodes]
+    rewards = [episode[2] for episode in episodes]
     return chips, bets, rewards, geom_incs
 
 
-def log_metric(geom_inc: List[List[float]]) -> float:
+def _pad_episodes(episodes: List[np.ndarray]) -> np.ndarray:
+    """ Stacks episodes of different lengths into a single array.
+
+    Args:
+        episodes: An array for each episode.
+
+    Returns:
+        An array with a row for each episode, padded with NaN after the end
+        of the episode.
+    """
+    max_len = max(map(len, episodes), default=0)
+    padded = np.full((len(episodes), max_len), np.nan)
+    for i, episode in enumerate(episodes):
+        padded[i, :len(episode)] = episode
+    return padded
+
+
+def log_metric(geom_inc: np.ndarray) -> float:
     """ Returns the approximation of E[log(1+x)].
 
     Args:
-        geom_inc: The geometric increases corresponding to a simulation.
+        geom_inc: The geometric increases corresponding to a simulation,
+            padded with NaN.
     """
-    geom_inc = np.concatenate(geom_inc).flat
-    mean = np.mean(geom_inc)
-    var = np.var(geom_inc)
+    mean = np.nanmean(geom_inc)
+    var = np.nanvar(geom_inc)
     return math.log(1+mean) - (var / (2*(1+mean)*(1+mean)))
 
 
-def read_logs(file_names: List[str]) -> Tuple[List[List[float]],
-                                              List[List[float]],
-                                              List[List[float]],
-                                              List[List[float]]]:
+def read_logs(file_names: List[str],
+              need_plot: bool = True) -> Tuple[Optional[np.ndarray],
+                                               Optional[np.ndarray],
+                                               Optional[np.ndarray],
+                                               np.ndarray]:
     """ Reads multiple simulation files.
 
+    The text of the files is parsed in parallel by a pool of spawned
+    processes when more than one file has no saved bets next to it, loading
+    the saved bets is faster than starting the pool.
+
     Args:
         file_names: The name of the files containing the simulations.
+        need_plot: Whether to return the bankrolls, bet sizes and payouts.
+            Only the geometric increases are returned otherwise.
 
     Returns:
-        Four lists that contain a snapshot after each bet of the bankroll,
-        the bet size last produced, the payout last obtained and the geometric
-        increase of the bankroll.
+        Four arrays with a row for each episode that contain a snapshot after
+        each bet of the bankroll, the bet size last produced, the payout last
+        obtained and the geometric increase of the bankroll. The rows are
+        padded with NaN after the end of the episode. The first three are None
+        if need_plot is not set.
     """
-    chips = []
-    bets = []
-    rewards = []
-    geom_incs = []
-    for file_name in file_names:
-        tmp_chips, tmp_bets, tmp_rewards, tmp_geom_incs = _read_file(file_name)
-        chips += tmp_chips
-        bets += tmp_bets
-        rewards += tmp_rewards
-        geom_incs += tmp_geom_incs
-    return chips, bets, rewards, geom_incs
+    read_file = functools.partial(_read_file, need_plot=need_plot)
+    num_unparsed = sum(not os.path.exists(file_name + logger.BETS_SUFFIX)
+                       for file_name in file_names)
+    if num_unparsed > 1:
+        # The caller may have initialized TensorFlow, which is not safe to
+        # fork.
+        with ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context('spawn')) as executor:
+            results = list(executor.map(read_file, file_names))
+    else:
+        results = [read_file(file_name) for file_name in file_names]
+    return tuple(
+        None if i < 3 and not need_plot else
+        _pad_episodes(list(itertools.chain.from_iterable(
+            result[i] for result in results)))
+        for i in range(4))
 
 
 def evaluate_simulations(file_names: List[str],
@@ -151,7 +223,8 @@ def evaluate_simulations(file_names: List[str],
     Returns:
         The approximation of E[log(1+x)] based on the simulations.
     """
-    chips, bets, _, geom_incs = read_logs(file_names)
+    chips, bets, _, geom_incs = read_logs(file_names,
+                                          need_plot=output_path is not None)
     metric = log_metric(geom_incs)
     if output_path is not None:
         _plot(chips, bets, metric, output_path)
@@ -164,7 +237,8 @@ def evaluate(bettor_name: str,
              max_episode_length: int,
              num_episodes: int,
              simulation_id: str,
-             path: str = None) -> float:
+             path: str = None,
+             num_processes: int = 1) -> float:
     """ Evaluates a bot after simulating it for a required number of steps.
 
     Args:
@@ -176,44 +250,47 @@ def evaluate(bettor_name: str,
         simulation_id: The of the simulation to avoid overwriting files.
         path: The path to save the simulation to. If not given, the simulation
             is placed in the current directory and deleted afterwards.
+        num_processes: The number of processes to split the episodes
+            between. The processes are spawned rather than forked, so that
+            they do not inherit the TensorFlow state of the caller.
     """
     auto_delete = path is None
     if auto_delete:
         path = '.'
-    log = simulator.simulate(bettor_name,
-                             bettor_params,
-                             strategist_name,
-                             max_episode_length,
-                             num_episodes,
-                             simulation_id,
-                             path)
-    metric = evaluate_simulations([log])
+    num_processes = max(1, min(num_processes, num_episodes))
+    args = [(bettor_name,
+             bettor_params,
+             strategist_name,
+             max_episode_length,
+             num_episodes // num_processes
+             + (process_id < num_episodes % num_processes),
+             simulation_id,
+             path,
+             process_id) for process_id in range(num_processes)]
+    if num_processes > 1:
+        with multiprocessing.get_context('spawn').Pool(num_processes) as pool:
+            logs = pool.starmap(simulator.simulate, args)
+    else:
+        logs = [simulator.simulate(*args[0])]
+    metric = evaluate_simulations(logs)
     if auto_delete:
-        os.remove(log)
+        for log in logs:
+            os.remove(log)
+            os.remove(log + logger.BETS_SUFFIX)
     return metric
 
 
-def _fill_arrays(arrays: List[List[float]]) -> List[List[float]]:
-    maxn = 0
-    for array in arrays:
-        maxn = max(maxn, len(array))
-    modified_arrays=[]
-    for array in arrays:
-        modified_arrays.append(array + [0.0]*(maxn-len(array)))
-    return modified_arrays
-
-
-def _plot(chips: List[List[float]],
-          bets: List[List[float]],
+def _plot(chips: np.ndarray,
+          bets: np.ndarray,
           metric: float,
           path: str) -> None:
+    stride = max(1, chips.shape[1] // _MAX_PLOT_POINTS)
     fig, axs = plt.subplots(2, figsize=(6,12))
     fig.suptitle('{}'.format(metric))
-    modified_chips = _fill_arrays(chips)
-    modified_bets = _fill_arrays(bets)
-    axs[0].plot(np.transpose(modified_chips))
-    axs[1].plot(np.transpose(modified_bets))
+    axs[0].plot(chips[:, ::stride].T)
+    axs[1].plot(bets[:, ::stride].T)
     plt.savefig(path)
+    plt.close(fig)
 
 
 def main():
@@ -222,15 +299,13 @@ def main():
     The function is capable of reading in different bots and group them by
     their simulation type.
     """
-    simulations_by_types = {}
+    simulations_by_types = collections.defaultdict(list)
     for filename in sys.argv[1:]:
-        #simulation_type = filename[:filename.rfind('_')]
-        simulation_type = '_'.join(filename.split('_')[:-2])
-        simulation_type = simulation_type[simulation_type.rfind('/')+1:]
-        if simulation_type in simulations_by_types:
-            simulations_by_types[simulation_type].append(filename)
-        else:
-            simulations_by_types[simulation_type]=[filename]
+        if filename.endswith(logger.BETS_SUFFIX):
+            continue
+        # Drops the simulation and process id from the end of the file name.
+        simulation_type = pathlib.PurePath(filename).stem.rsplit('_', 2)[0]
+        simulations_by_types[simulation_type].append(filename)
     for simulation_type in simulations_by_types:
         filenames = simulations_by_types[simulation_type]
         output = simulation_type + '.pdf'
@@ -71,17 +71,18 @@ def simulate(bettor_name: str,
     Returns:
         The filename of the simulation.
     """
-    filename = '{}/{}_{}_{}_{}.csv'.format(path,
-                                           bettor_name[:-6].upper(),
-                                           strategist_name[:-10].upper(),
-                                           simulation_id,
-                                           process_id)
+    bettor_type = bettor_name[:-6].upper()
+    strategist_type = strategist_name[:-10].upper()
+    filename = (f'{path}/{bettor_type}_{strategist_type}_'
+                f'{simulation_id}_{process_id}.csv')
+    bot_logger = logger.create_logger(filename)
     env_loop = acme.EnvironmentLoop(Table(max_episode_length),
                                     Bot(bettor_name,
                                         bettor_params,
                                         strategist_name,
-                                        logger.create_logger(filename)))
+                                        bot_logger))
     env_loop.run(num_episodes=num_episodes)
+    logger.close_logger(bot_logger)
     return filename
 
 
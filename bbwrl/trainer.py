@@ -48,10 +48,11 @@ Example config file:
 }
 """
 
+import gc
 import json
 import sys
 import time
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterator, Tuple
 import uuid
 import os
 
@@ -63,7 +64,9 @@ from bbwrl.environments import Table
 from bbwrl import evaluator
 
 
-os.environ['CUDA_VISIBLE_DEVICES'] = '0'
+# Only pin the GPU when the caller did not, so that processes started with
+# their own CUDA_VISIBLE_DEVICES keep it.
+os.environ.setdefault('CUDA_VISIBLE_DEVICES', '0')
 
 
 def train(bettor_name: str,
@@ -85,6 +88,36 @@ def train(bettor_name: str,
     Returns:
         The location of the trained bettor.
     """
+    *_, network_path = train_in_chunks(bettor_name, strategist_name, hparams,
+                                       time_limit, max_episode_length,
+                                       num_episodes, 1)
+    return network_path
+
+
+def train_in_chunks(bettor_name: str,
+                    strategist_name: str,
+                    hparams: Dict[str, Any],
+                    time_limit: int,
+                    max_episode_length: int,
+                    num_episodes: int,
+                    num_chunks: int) -> Iterator[str]:
+    """ Trains an ML based bettor, saving it periodically.
+
+    The training time is split into equal chunks and the bettor is saved
+    after each of them, so that it can be evaluated while it is trained.
+
+    Args:
+        bettor_name: The name of the bettor to train (DQNBettor or DDPGBettor).
+        strategist_name: The name of the strategist to use.
+        hparams: The hyper parameters to initalize the trainable bettor with.
+        time_limit: The number of seconds to train the bettor for in total.
+        max_episode_length: The number of games to terminate the episode after.
+        num_episodes: The number of episodes to simulate the bot for.
+        num_chunks: The number of chunks to split the training time into.
+
+    Yields:
+        The location of the trained bettor after each chunk.
+    """
     # When training multiple bettors on the same process (for example during
     # tuning) the _ACME_ID needs to be regenerated to avoid overwriting
     # previous models.
@@ -93,10 +126,47 @@ def train(bettor_name: str,
               hparams,
               strategist_name)
     env_loop = acme.EnvironmentLoop(Table(max_episode_length), bot)
-    start_time = time.time()
-    while (time.time() - start_time) < time_limit:
-        env_loop.run(num_episodes=num_episodes)
-    return bot.save()
+    try:
+        for _ in range(num_chunks):
+            start_time = time.time()
+            while (time.time() - start_time) < time_limit / num_chunks:
+                env_loop.run(num_episodes=num_episodes)
+            yield bot.save()
+    finally:
+        # Also run when the caller closes the generator early. The agent, its
+        # replay server and its variables are in reference cycles, so they
+        # are only released by a collection, not when the last name is gone.
+        del env_loop, bot
+        gc.collect()
+
+
+def evaluate_network(agent_name: str,
+                     strategist_name: str,
+                     network_path: str,
+                     max_episode_length: int,
+                     eval_num_episodes: int,
+                     eval_num_processes: int = 1) -> float:
+    """ Evaluates a trained bettor.
+
+    Args:
+        agent_name: The name of the type of agent to evaluate (DQN or DDPG).
+        strategist_name: The name of the strategist to use.
+        network_path: The location of the trained bettor.
+        max_episode_length: The number of games to terminate the episode after.
+        eval_num_episodes: The number of episodes to simulate the bot for.
+        eval_num_processes: The number of processes to split the episodes
+            between.
+
+    Returns:
+        The score obtained during evaluation.
+    """
+    return evaluator.evaluate(agent_name+'Bettor',
+                              {'policy_path': network_path+'/network'},
+                              strategist_name,
+                              max_episode_length,
+                              eval_num_episodes,
+                              network_path.split('/')[-2],
+                              num_processes=eval_num_processes)
 
 
 def train_and_evaluate(agent_name: str,
@@ -105,7 +175,8 @@ def train_and_evaluate(agent_name: str,
                        time_limit: int,
                        max_episode_length: int,
                        train_num_episodes: int,
-                       eval_num_episodes: int) -> Tuple[str, float]:
+                       eval_num_episodes: int,
+                       eval_num_processes: int = 1) -> Tuple[str, float]:
     """ Train and then evaluate a bettor.
 
     Args:
@@ -118,6 +189,8 @@ def train_and_evaluate(agent_name: str,
             time when training the bettor.
         eval_num_episodes: The number of episodes to simulate the bot for when
             evaluating.
+        eval_num_processes: The number of processes to split the evaluation
+            episodes between.
 
     Args:
         The location of the trained bettor and the score obtained during
@@ -125,12 +198,9 @@ def train_and_evaluate(agent_name: str,
     """
     network_path = train(agent_name+'Trainer', strategist_name, hparams,
                          time_limit, max_episode_length, train_num_episodes)
-    metric = evaluator.evaluate(agent_name+'Bettor',
-                                {'policy_path': network_path+'/network'},
-                                strategist_name,
-                                max_episode_length,
-                                eval_num_episodes,
-                                network_path.split('/')[-2])
+    metric = evaluate_network(agent_name, strategist_name, network_path,
+                              max_episode_length, eval_num_episodes,
+                              eval_num_processes)
     return network_path, metric
 
 
@@ -55,88 +55,122 @@ Example config file
     "max_episode_length": 10000,
     "train_num_episodes": 5,
     "eval_num_episodes": 30,
+    "num_chunks": 4,
+    "trials_per_gpu": 4,
     "checkpoint": "scripts/tune_config/DQN_3_60.pkl"
 }
 
 """
 
 
-import functools
+import contextlib
 import json
 import os
 from pathlib import Path
 import sys
-from typing import Callable, Any, Dict
+from typing import Callable, Any, Dict, Iterator, List, Optional, Tuple
 
+import optuna
 import ray
 from ray import tune
-from ray.tune.suggest import bayesopt
+from ray.tune.schedulers import AsyncHyperBandScheduler
+from ray.tune.suggest import bayesopt, ConcurrencyLimiter
+from ray.tune.suggest.hyperopt import HyperOptSearch
+from ray.tune.suggest.optuna import OptunaSearch
+import tensorflow as tf
 
-from bbwrl import trainer
+# The trials share the GPU, so each of them only allocates the memory it
+# needs instead of all of it. It has to be set before TensorFlow is
+# initialized, so before any bbwrl module is imported. The trial workers
+# run it too, when they import this module to unpickle the trainable.
+for _gpu in tf.config.experimental.list_physical_devices('GPU'):
+    tf.config.experimental.set_memory_growth(_gpu, True)
+
+from bbwrl import trainer  # pylint: disable=wrong-import-position
 
 
 os.environ['CUDA_VISIBLE_DEVICES'] = '0'
 
 
-def _get_hparams(
-    config: Dict[str, Any],
-    hparam_map: Dict[str, Callable[[float], float]]
-) -> Dict[str, Any]:
-    """ Creates hyper-parameters from a configuration.
+# Maps each key of a configuration to the name of the network shape it is a
+# layer of, or None if it is a hyper-parameter itself, and to the function
+# mapping its value to the hyper-parameter.
+Schema = Dict[str, Tuple[Optional[str], Callable[[float], float]]]
 
-    Maps each configuration to a hyper-parameter.
-    Layer parameters are appended to a single list of shape and used as a
-    hyperparameter.
+
+def _schema(search_space: Dict[str, Any],
+            hparam_map: Dict[str, Callable[[float], float]]) -> Schema:
+    """ Parses the keys of a search space once for every configuration.
+
+    Layer parameters are appended to a network shape in the sorted order of
+    their keys, the network shape depends on whether the key belongs to the
+    policy or critic network.
 
     Args:
-        config: The configuration generated by the optimizer.
+        search_space: The search space the configurations are picked from.
         hparam_map: The function mapping a configuration to hyper-parameters.
 
     Returns:
-        A dictionary containing the hyper-parameters.
+        The schema of the configurations.
     """
-    hparams = {}
-    network_shape = []
-    policy_network_shape = []
-    critic_network_shape = []
-
-    for parameter in sorted(config):
+    schema = {}
+    for parameter in sorted(search_space):
         if 'layer' in parameter:
-            value = hparam_map['layer'](config[parameter])
             if 'policy' in parameter:
-                policy_network_shape.append(value)
+                shape_name = 'policy_network_shape'
             elif 'critic' in parameter:
-                critic_network_shape.append(value)
+                shape_name = 'critic_network_shape'
             else:
-                network_shape.append(value)
+                shape_name = 'network_shape'
+            schema[parameter] = (shape_name, hparam_map['layer'])
         elif 'learning_rate' in parameter:
-            hparams[parameter] = hparam_map['learning_rate'](config[parameter])
+            schema[parameter] = (None, hparam_map['learning_rate'])
         else:
-            hparams[parameter] = hparam_map[parameter](config[parameter])
+            schema[parameter] = (None, hparam_map[parameter])
+    return schema
+
 
-    if network_shape:
-        hparams['network_shape'] = network_shape
-    if policy_network_shape:
-        hparams['policy_network_shape'] = policy_network_shape
-    if critic_network_shape:
-        hparams['critic_network_shape'] = critic_network_shape
+def _get_hparams(config: Dict[str, Any], schema: Schema) -> Dict[str, Any]:
+    """ Creates hyper-parameters from a configuration.
+
+    Maps each configuration to a hyper-parameter.
+    Layer parameters are appended to a single list of shape and used as a
+    hyperparameter.
+
+    Args:
+        config: The configuration generated by the optimizer.
+        schema: The schema of the configuration.
 
+    Returns:
+        A dictionary containing the hyper-parameters.
+    """
+    hparams = {}
+    for parameter, (shape_name, transform) in schema.items():
+        value = transform(config[parameter])
+        if shape_name is None:
+            hparams[parameter] = value
+        else:
+            hparams.setdefault(shape_name, []).append(value)
     return hparams
 
 
 def train_config(config: Dict[str, Any],
-                 hparam_map: Dict[str, Callable[[float], float]],
+                 schema: Schema,
                  agent_name: str,
                  strategist_name: str,
                  simulation_time_limit: int,
                  max_episode_length: int,
                  train_num_episodes: int,
-                 eval_num_episodes: int) -> None:
-    """ Trains, evaluates then reports the score for a configuration.
+                 eval_num_episodes: int,
+                 num_chunks: int = 1) -> Iterator[float]:
+    """ Trains and evaluates a configuration.
+
+    The training is split into chunks and the score is yielded after each of
+    them, so that the scheduler can stop unpromising trials early.
 
     Args:
         config: The configuration generated by the optimizer.
-        hparam_map: The function mapping a configuration to hyper-parameters.
+        schema: The schema of the configuration.
         agent_name: The name of the type of agent to train (DQN or DDPG).
         strategist_name: The name of the strategist to use.
         simulation_time_limit: The number of seconds to train the bettor for.
@@ -145,19 +179,106 @@ def train_config(config: Dict[str, Any],
             time when training the bettor.
         eval_num_episodes: The number of episodes to simulate the bot for when
             evaluating.
+        num_chunks: The number of chunks to split the training into.
+
+    Yields:
+        The score of the bettor after each chunk of training.
+    """
+    # Closing this generator also closes the training, releasing its agent.
+    with contextlib.closing(trainer.train_in_chunks(
+            agent_name+'Trainer',
+            strategist_name,
+            _get_hparams(config, schema),
+            simulation_time_limit,
+            max_episode_length,
+            train_num_episodes,
+            num_chunks)) as network_paths:
+        for network_path in network_paths:
+            yield trainer.evaluate_network(agent_name,
+                                           strategist_name,
+                                           network_path,
+                                           max_episode_length,
+                                           eval_num_episodes)
+
+
+def _read_results(results_file: Path,
+                  num_chunks: int) -> List[Tuple[Dict[str, Any], float]]:
+    """ Reads the scores reported in the previous runs of the tuner.
+
+    Args:
+        results_file: The file the scores were appended to.
+        num_chunks: The number of chunks the training of each trial is split
+            into. Only the scores after the last chunk are read, the earlier
+            ones are from trials that were trained less, possibly stopped by
+            the scheduler.
 
     Returns:
-        None
+        The last score reported for each fully trained configuration.
+    """
+    if not results_file.is_file():
+        return []
+    results = {}
+    with open(results_file) as reader:
+        for line in reader:
+            result = json.loads(line)
+            if result.get('training_iteration') != num_chunks:
+                continue
+            config = result['config']
+            results[json.dumps(config, sort_keys=True)] = (config,
+                                                           result['score'])
+    return list(results.values())
+
+
+class _ChunkedTrainable(tune.Trainable):
+    """ Trains a configuration one chunk per training iteration.
+
+    Actors are reused between trials, a new configuration only restarts the
+    training instead of starting a new process and initializing TensorFlow.
+    Every score is also appended to a results file, so that the scores are
+    kept even if the tuner does not finish.
     """
-    _, score = trainer.train_and_evaluate(agent_name,
-                                          strategist_name,
-                                          _get_hparams(config, hparam_map),
-                                          simulation_time_limit,
-                                          max_episode_length,
-                                          train_num_episodes,
-                                          eval_num_episodes)
-    # Send the current training result back to Tune
-    tune.report(score=score)
+    def setup(self,
+              config: Dict[str, Any],
+              results_file: str,
+              **settings: Any) -> None:
+        """ Starts the training of the first configuration.
+
+        Args:
+            config: The configuration generated by the optimizer.
+            results_file: The file to append the scores to.
+            settings: The rest of the arguments of train_config.
+        """
+        self._results_file = results_file
+        self._settings = settings
+        self._config = config
+        self._chunk = 0
+        self._scores = train_config(config, **settings)
+
+    def step(self) -> Dict[str, float]:
+        """ Trains a chunk then reports the score to Tune. """
+        score = next(self._scores)
+        self._chunk += 1
+        # A single short append, which is not interleaved with the lines of
+        # the other trials.
+        with open(self._results_file, 'a') as writer:
+            writer.write(json.dumps({'config': self._config,
+                                     'training_iteration': self._chunk,
+                                     'score': score}) + '\n')
+        return {'score': score}
+
+    def reset_config(self, new_config: Dict[str, Any]) -> bool:
+        """ Starts the training of a new configuration on this actor. """
+        # Releases the agent of the previous configuration before the new one
+        # allocates its own on the shared GPU.
+        self._scores.close()
+        self._config = new_config
+        self._chunk = 0
+        self._scores = train_config(new_config, **self._settings)
+        return True
+
+    def cleanup(self) -> None:
+        """ Releases the agent of the last configuration. """
+        self._scores.close()
 
 
 def tune_model(search_space: Dict[str, Any],
@@ -169,9 +290,30 @@ def tune_model(search_space: Dict[str, Any],
                train_num_episodes: int,
                eval_num_episodes: int,
                time_limit: int,
-               checkpoint: str) -> Dict[str, Any]:
+               checkpoint: str,
+               num_chunks: int = 1,
+               trials_per_gpu: int = 1,
+               search_algorithm: str = 'BayesOpt') -> Dict[str, Any]:
     """ Tunes a model using Bayesian Optimization.
 
+    Trials are scheduled with ASHA, which stops the trials scoring in the
+    bottom part after each chunk of training, leaving the time for more
+    configurations. The networks are small, so multiple trials can share a
+    GPU and run concurrently.
+
+    The scores of the trials are appended to a file next to the checkpoint.
+    With BayesOpt the optimizer is warm-started with them on the next run,
+    even if the previous run did not finish and save the checkpoint. HyperOpt
+    and Optuna are only resumed from the checkpoint.
+
+    The Gaussian process of BayesOpt is refit on every point, which gets slow
+    as the number of trials grows, HyperOpt uses a Tree-structured Parzen
+    Estimator instead that scales with many more trials. Neither of them
+    knows about the trials still running, so concurrent trials can get
+    almost the same configuration. Optuna's TPE sampler with a constant liar
+    treats the running trials as if they had the worst score, spreading the
+    concurrent trials out.
+
     Args:
         search_space: The search space to pick configurations from.
         hparam_map: The function mapping a configuration to hyper-parameters.
@@ -185,36 +327,90 @@ def tune_model(search_space: Dict[str, Any],
             evaluating.
         time_limit: The number of seconds to run the tuner for.
         checkpoint: The location to save the checkpoint for the optimizer.
+        num_chunks: The number of chunks to split the training of each trial
+            into, the trials are evaluated after each chunk.
+        trials_per_gpu: The number of trials running concurrently on the GPU.
+        search_algorithm: The optimizer to use, BayesOpt, HyperOpt or Optuna.
 
     Returns:
         A dictionary containing the hyper-parameters that performed best during
         the training.
 
     """
-    applied_train_function = functools.partial(
-        train_config,
-        hparam_map=hparam_map,
+    checkpoint_file = Path(checkpoint)
+    results_file = checkpoint_file.with_suffix('.jsonl')
+    results = _read_results(results_file, num_chunks)
+    trainable = tune.with_parameters(
+        _ChunkedTrainable,
+        results_file=str(results_file),
+        schema=_schema(search_space, hparam_map),
         agent_name=agent_name,
         strategist_name=strategist_name,
         simulation_time_limit=simulation_time_limit,
         max_episode_length=max_episode_length,
         train_num_episodes=train_num_episodes,
-        eval_num_episodes=eval_num_episodes)
+        eval_num_episodes=eval_num_episodes,
+        num_chunks=num_chunks)
     num_samples = (time_limit/simulation_time_limit)
-    bayesopt_search = bayesopt.BayesOptSearch(search_space,
-                                              metric='score',
-                                              mode='max')
-    checkpoint_file = Path(checkpoint)
+    # The constant parameters are passed to the trials in the config of
+    # tune.run, only the intervals are searched.
+    intervals = {parameter: tune.uniform(*interval)
+                 for parameter, interval in search_space.items()
+                 if isinstance(interval, tuple)}
+    if search_algorithm == 'HyperOpt':
+        searcher = HyperOptSearch(
+            HyperOptSearch.convert_search_space(intervals),
+            metric='score',
+            mode='max')
+    elif search_algorithm == 'Optuna':
+        searcher = OptunaSearch(
+            OptunaSearch.convert_search_space(intervals),
+            metric='score',
+            mode='max',
+            sampler=optuna.samplers.TPESampler(constant_liar=True))
+    else:
+        # The random initial trials are only needed without previous results.
+        searcher = bayesopt.BayesOptSearch(
+            search_space,
+            metric='score',
+            mode='max',
+            random_search_steps=0 if results else 10)
     if checkpoint_file.is_file():
         print('Restoring search from {}'.format(checkpoint))
-        bayesopt_search.restore(checkpoint)
-
-    analysis = tune.run(applied_train_function,
-                        search_alg=bayesopt_search,
+        searcher.restore(checkpoint)
+    if search_algorithm == 'BayesOpt':
+        for result_config, score in results:
+            try:
+                searcher.optimizer.register(params=result_config,
+                                            target=score)
+            except KeyError:
+                # The point is already known from the checkpoint.
+                pass
+    asha = AsyncHyperBandScheduler(time_attr='training_iteration',
+                                   metric='score',
+                                   mode='max',
+                                   max_t=num_chunks,
+                                   grace_period=1,
+                                   reduction_factor=3)
+
+    # Only the optimizer is restored between runs, so the periodic experiment
+    # checkpoints just stall the trials.
+    os.environ.setdefault('TUNE_GLOBAL_CHECKPOINT_S',
+                          str(simulation_time_limit))
+
+    analysis = tune.run(trainable,
+                        search_alg=ConcurrencyLimiter(
+                            searcher, max_concurrent=trials_per_gpu),
+                        scheduler=asha,
+                        stop={'training_iteration': num_chunks},
                         config = search_space,
-                        resources_per_trial={'gpu': 1},
-                        num_samples=round(num_samples))
-    bayesopt_search.save(checkpoint)
+                        resources_per_trial={'cpu': 1,
+                                             'gpu': 1/trials_per_gpu},
+                        num_samples=round(num_samples),
+                        reuse_actors=True,
+                        checkpoint_freq=0,
+                        checkpoint_at_end=False)
+    searcher.save(checkpoint)
     return analysis.get_best_config(metric='score', mode='max')
 
 
@@ -245,7 +441,7 @@ def _search_space(hparams: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def main():
-    ray.init(dashboard_port = 9001, num_cpus=1, num_gpus=1)
+    ray.init(dashboard_port = 9001, num_cpus=os.cpu_count(), num_gpus=1)
     with open(sys.argv[1]) as json_file:
         parameters = json.load(json_file)
     parameters['search_space'] = _search_space(parameters['hparams'])
@@ -258,7 +454,8 @@ def main():
         'batch_size': lambda x: 2**round(x),
     }
     best_config = tune_model(**parameters)
-    print(_get_hparams(best_config, parameters['hparam_map']))
+    print(_get_hparams(best_config, _schema(parameters['search_space'],
+                                            parameters['hparam_map'])))
     ray.shutdown()
 
 if __name__ == '__main__':
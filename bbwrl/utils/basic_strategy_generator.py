@@ -26,94 +26,71 @@ using a full remaining shoe on every possible dealer and player hand
 combination to determine the optimal move when no additional knowledge is
 given to the player.
 """
-from bbwrl.bot.strategists import OptimalStrategist
+import io
+import sys
+from typing import List
+
+from bbwrl.bot.strategists import OptimalStrategist, HIT, STAND, DOUBLE
 from bbwrl.environments import rule_variation
 
 import numpy as np
 
 
+# The letter of each move in the strategy tables of BasicStrategist.
+_MOVE_LETTERS = {HIT: 'H', STAND: 'S', DOUBLE: 'D'}
+
+
+def _move_letters(moves: List[int]) -> List[str]:
+    """ Returns the letters of the moves returned by the strategist. """
+    return [_MOVE_LETTERS[move] for move in moves]
+
+
 def main():
     os = OptimalStrategist(lambda x: x)
     card_distribution = np.full((14,), 4*rule_variation.SHOE_SIZE)
     card_distribution[0] = 0
+    out = io.StringIO()
+    dealer_cards = range(2, 12)
     # Ace strategy:
-    print('BASIC_ACE_STRATEGY = [')
-    print('    # 2    3    4    5    6    7    8    9    10   A')
+    print('BASIC_ACE_STRATEGY = [', file=out)
+    print('    # 2    3    4    5    6    7    8    9    10   A', file=out)
     for player_total in range(12, 22):
-        moves = []
-        for dealer_card in range(2, 12):
-            player_aces = 1
-            if os.should_double(player_total,
-                                player_aces,
-                                dealer_card,
-                                card_distribution):
-                moves.append('D')
-            elif os.should_hit(player_total,
-                               player_aces,
-                               dealer_card,
-                               card_distribution):
-                moves.append('H')
-            else:
-                moves.append('S')
-        print('    {}, # {}'.format(moves, player_total))
-    print(']\n')
+        moves = _move_letters(
+            os.best_moves(player_total, 1, dealer_cards, card_distribution))
+        print('    {}, # {}'.format(moves, player_total), file=out)
+    print(']\n', file=out)
 
     # Hit strategy:
-    print('BASIC_HIT_STRATEGY = [')
-    print('    # 2    3    4    5    6    7    8    9    10   A')
+    print('BASIC_HIT_STRATEGY = [', file=out)
+    print('    # 2    3    4    5    6    7    8    9    10   A', file=out)
     for player_total in range(3, 22):
-        moves = []
-        for dealer_card in range(2, 12):
-            player_aces = 0
-            if os.should_double(player_total,
-                                player_aces,
-                                dealer_card,
-                                card_distribution):
-                moves.append('D')
-            elif os.should_hit(player_total,
-                               player_aces,
-                               dealer_card,
-                               card_distribution):
-                moves.append('H')
-            else:
-                moves.append('S')
-        print('    {}, # {}'.format(moves, player_total))
-    print(']\n')
+        moves = _move_letters(
+            os.best_moves(player_total, 0, dealer_cards, card_distribution))
+        print('    {}, # {}'.format(moves, player_total), file=out)
+    print(']\n', file=out)
 
     # Split strategy:
-    print('BASIC_SPLIT_STRATEGY = [')
+    print('BASIC_SPLIT_STRATEGY = [', file=out)
     print('    #  2      3      4      5      6      7      8      9'
-          '      10     A')
+          '      10     A', file=out)
     # Player has aces
-    moves = []
-    for dealer_card in range(2, 12):
-        player_total = 12
-        player_aces = 1
-        if os.should_split(player_total,
-                           player_aces,
-                           dealer_card,
-                           card_distribution):
-            moves.append('True ')
-        else:
-            moves.append('False')
-    print('    [', end = '')
-    print(*moves, sep = ', ', end = '] # As \n')
+    splits = os.split_moves(12, 1, dealer_cards, card_distribution)
+    moves = ['True ' if split else 'False' for split in splits]
+    print('    [', end = '', file=out)
+    print(*moves, sep = ', ', end = '] # As \n', file=out)
 
     for player_card in range(2, 11):
-        moves = []
-        for dealer_card in range(2, 12):
-            player_total = 2*player_card
-            player_aces = 0
-            if os.should_split(player_total,
-                               player_aces,
-                               dealer_card,
-                               card_distribution):
-                moves.append('True ')
-            else:
-                moves.append('False')
-        print('    [', end = '')
-        print(*moves, sep = ', ', end = '], # {} \n'.format(player_total))
-    print(']\n')
+        player_total = 2*player_card
+        splits = os.split_moves(player_total,
+                                0,
+                                dealer_cards,
+                                card_distribution)
+        moves = ['True ' if split else 'False' for split in splits]
+        print('    [', end = '', file=out)
+        print(*moves, sep = ', ', end = '], # {} \n'.format(player_total),
+              file=out)
+    print(']\n', file=out)
+    sys.stdout.write(out.getvalue())
 
 
 
@@ -24,32 +24,138 @@
 
 import logging
 
+import numpy as np
 
-def create_logger(filename: str) -> logging.Logger:
+# The size of the buffer the log file is written through.
+_BUFFER_SIZE = 1 << 20
+
+# The extension of the binary file the bets are saved to next to the log.
+BETS_SUFFIX = '.npy'
+
+# A logged bet: the episode it was placed in, the bankroll and the bet size.
+_BET_DTYPE = np.dtype([('episode', np.int32),
+                       ('chips', np.float64),
+                       ('bet', np.float64)])
+
+# The formatters are shared by every logger instead of built for each one.
+_FILE_FORMATTER = logging.Formatter('%(message)s')
+_STREAM_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - '
+                                      '%(levelname)s - %(message)s')
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """ A file handler that does not flush after every record.
+
+    The records are written through a large file buffer and only reach the
+    file when the buffer fills up, the handler is flushed or it is closed.
+    """
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=_BUFFER_SIZE,
+                    encoding=self.encoding)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
+class _BetArrayHandler(logging.Handler):
+    """ A handler that saves the logged bets into a binary array.
+
+    Keeps the bankroll and the bet size of every CHOOSE_BET record, taken
+    from the arguments of the record without formatting it, and saves them
+    with numpy when flushed. Every START record begins a new episode. Once
+    closed, the bets are dropped and the file is no longer written.
+
+    Attributes:
+        _episode: The index of the current episode.
+        _filename: The name of the file the bets are saved to.
+        _rows: The bets logged so far, None once closed.
+    """
+    def __init__(self, filename: str):
+        super().__init__(logging.INFO)
+        self._filename = filename
+        self._episode = -1
+        self._rows = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.msg == 'START':
+            self._episode += 1
+        elif record.args and record.args[0] == 'CHOOSE_BET':
+            self._rows.append((self._episode,
+                               float(record.args[1]),
+                               float(record.args[5])))
+
+    def flush(self) -> None:
+        if self._rows is None:
+            return
+        with open(self._filename, 'wb') as writer:
+            np.save(writer, np.array(self._rows, dtype=_BET_DTYPE))
+
+    def close(self) -> None:
+        self.flush()
+        self._rows = None
+        super().close()
+
+
+def create_logger(filename: str,
+                  include_stream: bool = True) -> logging.Logger:
     """ Returns a logger that logs INFO messages to a file.
 
     Creates a logger that logs messages with level INFO or higher to a file
-    and logs messages with level WARNING or higher to the standard stream.
+    and, if include_stream is set, logs messages with level WARNING or higher
+    to the standard stream.
+    The bets are also saved in binary to filename + BETS_SUFFIX, which the
+    evaluator reads without parsing the log. Both files are buffered, so the
+    logger needs to be flushed with flush_logger or closed with close_logger
+    before they are read.
 
     Args:
         filename: The name of the file to log to.
+        include_stream: Whether to log warnings to the standard stream.
     """
     logger = logging.getLogger(filename)
     logger.propagate=False
     logger.setLevel(logging.INFO)
 
-    fh = logging.FileHandler(filename)
+    fh = _BufferedFileHandler(filename)
     fh.setLevel(logging.INFO)
-    formatter = logging.Formatter('%(message)s')
-    fh.setFormatter(formatter)
+    fh.setFormatter(_FILE_FORMATTER)
+    logger.addHandler(fh)
 
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.WARNING)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - '+
-                                  '%(levelname)s - %(message)s')
-    ch.setFormatter(formatter)
+    if include_stream:
+        ch = logging.StreamHandler()
+        ch.setLevel(logging.WARNING)
+        ch.setFormatter(_STREAM_FORMATTER)
+        logger.addHandler(ch)
 
-    logger.addHandler(fh)
-    logger.addHandler(ch)
+    logger.addHandler(_BetArrayHandler(filename + BETS_SUFFIX))
 
     return logger
+
+
+def flush_logger(logger: logging.Logger) -> None:
+    """ Flushes every handler of a logger.
+
+    Args:
+        logger: The logger to flush.
+    """
+    for handler in logger.handlers:
+        handler.flush()
+
+
+def close_logger(logger: logging.Logger) -> None:
+    """ Writes the logs then closes and removes every handler of a logger.
+
+    Closed handlers are not flushed again at exit, so the files can be
+    removed once the logger is closed.
+
+    Args:
+        logger: The logger to close.
+    """
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
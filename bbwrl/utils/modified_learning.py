@@ -22,20 +22,82 @@
 
 """An extension of DDPGLearner that saves snapshots of the policy network."""
 
+from concurrent import futures
+import copy
+import time
+from typing import Any, Mapping
+
 from acme.agents.tf.ddpg import learning
 from acme.tf import savers as tf2_savers
+import sonnet as snt
+
+
+class _AsyncSnapshotter(tf2_savers.Snapshotter):
+    """A snapshotter that saves the periodic snapshots in a background thread.
+
+    Writing the saved model takes a while, so the learner only copies the
+    variables of the modules into clones of them and carries on training
+    while the clones are saved. Forced saves are still synchronous, they wait
+    for the background save to finish first.
+
+    Attributes:
+        _sources: Pairs of the modules to snapshot and the clones they are
+            copied into.
+    """
+    def __init__(self,
+                 objects_to_save: Mapping[str, snt.Module],
+                 *args: Any,
+                 time_delta_minutes: float,
+                 **kwargs: Any):
+        """See base class."""
+        clones = {name: copy.deepcopy(module)
+                  for name, module in objects_to_save.items()}
+        super().__init__(clones, *args,
+                         time_delta_minutes=time_delta_minutes, **kwargs)
+        self._sources = [(module, clones[name])
+                         for name, module in objects_to_save.items()]
+        self._save_interval = 60*time_delta_minutes
+        self._next_save = 0.
+        self._executor = futures.ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+
+    def _copy_variables(self) -> None:
+        """Copies the variables of the modules into their clones."""
+        for module, clone in self._sources:
+            for source, destination in zip(module.variables, clone.variables):
+                destination.assign(source)
+
+    def save(self, force: bool = False) -> bool:
+        """See base class."""
+        if force:
+            if self._pending is not None:
+                self._pending.result()
+            self._copy_variables()
+            return super().save(True)
+        now = time.time()
+        if now < self._next_save or (self._pending is not None and
+                                     not self._pending.done()):
+            return False
+        self._next_save = now + self._save_interval
+        # The clones are only written again once the previous save is done.
+        self._copy_variables()
+        self._pending = self._executor.submit(super().save, True)
+        return True
+
+    def __del__(self):
+        self._executor.shutdown()
 
 
 class ModifiedDDPGLearner(learning.DDPGLearner):
     """An extension of DDPGLearner that saves snapshots of the policy network.
 
     After initializing the base class creates a snapshotter that saves the
-    policy network every 60 minutes.
+    policy network every 60 minutes without blocking the training steps.
     """
     def __init__(self, *args, **kwargs):
         """See base class."""
         super().__init__(*args, **kwargs)
-        self._snapshotter = tf2_savers.Snapshotter(
+        self._snapshotter = _AsyncSnapshotter(
             objects_to_save={'network': self._policy_network},
             time_delta_minutes=60.)
 
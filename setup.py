@@ -1,14 +1,27 @@
-from setuptools import setup
+from setuptools import Extension, setup
 from Cython.Build import cythonize
 import numpy as np
 
 
+def _extension(name: str) -> Extension:
+    return Extension(name,
+                     [name.replace(".", "/") + ".pyx"],
+                     language="c++",
+                     include_dirs=[np.get_include()],
+                     extra_compile_args=["-O3", "-march=native",
+                                         "-funroll-loops"])
+
+
 setup(
     ext_modules=cythonize(
-        ["bbwrl/bot/reward_distribution.pyx",
-         "bbwrl/bot/strategists/optimal_strategist.pyx",
-         "bbwrl/bot/bettors/kelly_bettor.pyx"],
+        [_extension("bbwrl.bot.reward_distribution"),
+         _extension("bbwrl.bot.strategists.optimal_strategist"),
+         _extension("bbwrl.bot.bettors.kelly_bettor")],
+        compiler_directives={"boundscheck": False,
+                             "wraparound": False,
+                             "cdivision": True,
+                             "initializedcheck": False,
+                             "language_level": 3},
         #compiler_directives={'linetrace': True},
         annotate=True),
-        include_dirs=[np.get_include()]
 )
@@ -0,0 +1,36 @@
+import numpy as np
+
+from bbwrl.bot.bettors.ml.policy_bettor import PolicyBettor
+
+
+def _stub_policy(policy_path):
+    # Bets the bankroll divided by the number of aces left in the shoe.
+    return lambda obs: obs['CHIPS'][:, 0] / obs['CARD_DISTRIBUTION'][:, 1]
+
+
+def _create_bettor():
+    return PolicyBettor('unused',
+                        lambda x: x,
+                        lambda x: x,
+                        'float32',
+                        policy_loader=_stub_policy)
+
+
+def test_get_bet_size():
+    bettor = _create_bettor()
+    assert bettor.get_bet_size(
+        64.0,
+        np.array([0, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16]),
+    ) == 4.0
+
+
+def test_get_bet_size_batch():
+    bettor = _create_bettor()
+    card_distributions = np.array([
+        [0, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16],
+        [0, 8, 0, 0, 0, 0, 0, 16, 16, 16, 16, 16, 16, 16],
+    ])
+    assert np.array_equal(
+        bettor.get_bet_size_batch(np.array([64.0, 64.0]),
+                                  card_distributions),
+        [4.0, 8.0])
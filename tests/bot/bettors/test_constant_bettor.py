@@ -3,8 +3,12 @@ import numpy as np
 from bbwrl.bot.bettors.constant_bettor import ConstantBettor
 
 
+_CARD_DISTR = np.array([0, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16])
+_CARD_DISTR.setflags(write=False)
+
+
 def _create_card_distr():
-    return np.array([0, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16])
+    return _CARD_DISTR
 
 
 def test_get_bet_size():
@@ -17,3 +17,15 @@ def test_get_bet_size():
         500.0,
         np.array([0, 16, 0, 0, 0, 0, 0, 16, 16, 16, 16, 16, 16, 16]),
     ) == 31.5
+
+
+def test_get_bet_size_batch():
+    bettor = VectorBettor(4, [0, -1, 1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1])
+    card_distributions = np.array([
+        [0, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16],
+        [0, 16, 0, 0, 0, 0, 0, 16, 16, 16, 16, 16, 16, 16],
+    ])
+    assert np.array_equal(
+        bettor.get_bet_size_batch(np.array([500.0, 500.0]),
+                                  card_distributions),
+        [-1.0, 31.5])
@@ -1,10 +1,15 @@
 import numpy as np
 
 from bbwrl.bot.strategists.basic_strategist import BasicStrategist
+from bbwrl.bot.strategists.strategist import HIT, STAND, DOUBLE
+
+
+_CARD_DISTR = np.array([0, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16])
+_CARD_DISTR.setflags(write=False)
 
 
 def _create_card_distr():
-    return np.array([0, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16])
+    return _CARD_DISTR
 
 
 def test_should_split():
@@ -27,3 +32,10 @@ def test_should_hit():
     assert strategist.should_hit(14, 0, 9, _create_card_distr())
     assert not strategist.should_hit(20, 1, 6, _create_card_distr())
     assert strategist.should_hit(17, 1, 6, _create_card_distr())
+
+
+def test_get_action():
+    strategist = BasicStrategist(lambda x: x)
+    assert strategist.get_action(14, 0, 9, _create_card_distr()) == HIT
+    assert strategist.get_action(20, 1, 6, _create_card_distr()) == STAND
+    assert strategist.get_action(18, 1, 6, _create_card_distr()) == DOUBLE
@@ -2,10 +2,15 @@ import numpy as np
 
 import bbwrl.utils.pyxinstall
 from bbwrl.bot.strategists.optimal_strategist import OptimalStrategist
+from bbwrl.bot.strategists.strategist import HIT, STAND, DOUBLE
+
+
+_CARD_DISTR = np.array([0, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16])
+_CARD_DISTR.setflags(write=False)
 
 
 def _create_card_distr():
-    return np.array([0, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16])
+    return _CARD_DISTR
 
 
 def test_should_split():
@@ -28,3 +33,26 @@ def test_should_hit():
     assert strategist.should_hit(14, 0, 9, _create_card_distr())
     assert not strategist.should_hit(20, 1, 6, _create_card_distr())
     assert strategist.should_hit(17, 1, 6, _create_card_distr())
+
+
+def test_best_moves():
+    strategist = OptimalStrategist(lambda x: x)
+    dealer_totals = range(2, 12)
+    for player_total, player_aces in ((9, 0), (14, 0), (17, 1), (18, 1)):
+        moves = strategist.best_moves(player_total,
+                                      player_aces,
+                                      dealer_totals,
+                                      _create_card_distr())
+        for dealer_total, move in zip(dealer_totals, moves):
+            if strategist.should_double(player_total,
+                                        player_aces,
+                                        dealer_total,
+                                        _create_card_distr()):
+                assert move == DOUBLE
+            elif strategist.should_hit(player_total,
+                                       player_aces,
+                                       dealer_total,
+                                       _create_card_distr()):
+                assert move == HIT
+            else:
+                assert move == STAND
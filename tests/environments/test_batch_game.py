@@ -0,0 +1,32 @@
+import numpy as np
+
+from bbwrl.environments.batch_game import _simulate, batch_simulate
+from bbwrl.environments.game import Game
+from bbwrl.environments.shoe import Shoe
+
+
+def _hit_below_17(player_totals, player_aces, dealer_totals):
+    return player_totals < 17
+
+
+def test_simulate_matches_game():
+    rng = np.random.default_rng(0)
+    shoes = np.array([rng.permutation(Shoe()._running_shoe)
+                      for _ in range(200)], dtype=np.int8)
+    payouts = _simulate(shoes, _hit_below_17)
+    for shoe_cards, payout in zip(shoes, payouts):
+        shoe = Shoe()
+        shoe._running_shoe = shoe_cards.tolist()
+        game = Game(shoe)
+        while game.get_payout() is None:
+            if game.current_observation()['PLAYER_TOTAL'] < 17:
+                game.hit()
+            else:
+                game.stand()
+        assert game.get_payout() == payout
+
+
+def test_batch_simulate():
+    payouts = batch_simulate(100, _hit_below_17, np.random.default_rng(0))
+    assert payouts.shape == (100, )
+    assert np.isin(payouts, [-1.0, 0.0, 1.0, 1.5]).all()
@@ -51,3 +51,12 @@ def test_stand():
     assert np.array_equal(dealer.stand(shoe),
                           [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0])
     assert dealer.get_total() == 24
+
+
+def test_hit_soft_17():
+    dealer = Dealer(1, 6, False)
+    dealer.stand(_custom_shoe([3]))
+    assert dealer.get_total() == 17
+    dealer = Dealer(1, 6, True)
+    dealer.stand(_custom_shoe([3]))
+    assert dealer.get_total() == 20
@@ -35,3 +35,31 @@ def test_current_observation():
     assert obs['DEALER_TOTAL'] == 5
     assert np.array_equal(obs['REVEALED_CARDS'],
                           [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0])
+
+
+def test_shared_revealed_cards():
+    revealed_cards = np.zeros(14, dtype=int)
+    shoe = _custom_shoe([10, 12, 5, 10])
+    obs = Game(shoe, revealed_cards).current_observation()
+    assert obs['REVEALED_CARDS'] is revealed_cards
+    assert np.array_equal(revealed_cards,
+                          [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0])
+
+
+def test_current_observation_into_dict():
+    shoe = _custom_shoe([10, 12, 5, 10])
+    obs = {'STAGE': 'CHOOSE_BET'}
+    assert Game(shoe).current_observation(obs) is obs
+    assert obs['STAGE'] == 'CHOOSE_BET'
+    assert obs['PLAYER_TOTAL'] == 20
+    assert obs['DEALER_TOTAL'] == 5
+
+
+def test_current_observation_into_revealed_cards():
+    revealed_cards = np.zeros(14, dtype=np.int8)
+    shoe = _custom_shoe([10, 12, 5, 10])
+    obs = {'REVEALED_CARDS': revealed_cards}
+    Game(shoe).current_observation(obs)
+    assert obs['REVEALED_CARDS'] is revealed_cards
+    assert np.array_equal(revealed_cards,
+                          [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1, 0])
@@ -77,3 +77,14 @@ def test_split_values():
     shoe = _custom_shoe([3])
     player.hit(shoe)
     assert player.split_value() is None
+
+
+def test_payout():
+    assert Player(1, 12).payout(21, False, 1.5) == 1.5
+    assert Player(1, 12).payout(21, True, 1.5) == 0.0
+    assert Player(10, 8).payout(17, False, 1.5) == 1.0
+    assert Player(10, 8).payout(22, False, 1.5) == 1.0
+    assert Player(10, 7).payout(17, False, 1.5) == 0.0
+    player = Player(10, 3, True)
+    player.double_down(_custom_shoe([10]))
+    assert player.payout(20, False, 1.5) == -2.0
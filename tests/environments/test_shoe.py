@@ -42,3 +42,12 @@ def test_try_reshuffle():
     assert shoe.try_reshuffle()
     shoe.reshuffle()
     assert not shoe.try_reshuffle()
+
+
+def test_with_replacement():
+    shoe = Shoe(with_replacement=True)
+    cards = [shoe.draw() for _ in range(52)]
+    assert all(1 <= card <= 13 for card in cards)
+    assert shoe.cards_left() == 0.75
+    shoe.reshuffle()
+    assert shoe.cards_left() == 1.0
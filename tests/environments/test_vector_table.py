@@ -0,0 +1,34 @@
+import numpy as np
+
+from bbwrl.environments import rule_variation
+from bbwrl.environments.shoe import _NUM_CARDS
+from bbwrl.environments.vector_table import VectorTable
+
+
+def _hit_below_17(player_totals, player_aces, dealer_totals):
+    return player_totals < 17
+
+
+def test_step():
+    table = VectorTable(50, _hit_below_17, 1000, np.random.default_rng(0))
+    obs = table.reset()
+    assert (obs['CHIPS'] == rule_variation.AGENT_CHIPS).all()
+    obs, rewards, dones = table.step(np.full(50, 2.0))
+    assert not dones.any()
+    assert np.isin(rewards,
+                   [-2.0, 0.0, 2.0, 2.0*rule_variation.BLACKJACK_PAYOUT]).all()
+    assert np.array_equal(obs['CHIPS'], rule_variation.AGENT_CHIPS + rewards)
+    drawn = _NUM_CARDS - obs['CARD_DISTRIBUTION'].sum(axis=1)
+    assert (drawn >= 4).all()
+
+
+def test_time_limit():
+    table = VectorTable(10, _hit_below_17, 3, np.random.default_rng(0))
+    table.reset()
+    for _ in range(2):
+        _, _, dones = table.step(np.ones(10))
+        assert not dones.any()
+    obs, _, dones = table.step(np.ones(10))
+    assert dones.all()
+    assert (obs['CHIPS'] == rule_variation.AGENT_CHIPS).all()
+    assert (obs['CARD_DISTRIBUTION'].sum(axis=1) == _NUM_CARDS).all()